@@ -0,0 +1,46 @@
+"""Benchmark cold construction of DataClass.
+
+Compares parsing the JSON catalogs with loading the binary catalog
+snapshots. The process-wide binding cache is cleared before each run, so
+every construction is a cold start as in a fresh worker process.
+
+Run from the repository root with ``python -m benchmarks.bench_dataclass``.
+"""
+
+import timeit
+
+import teaser.data.dataclass as dataclass
+from teaser.data.utilities import ConstructionData
+
+
+def construct(construction_data, use_cache):
+    dataclass.clear_binding_cache()
+    # the bindings are loaded lazily, warm_up() loads all of them
+    dataclass.DataClass(
+        construction_data=construction_data, use_cache=use_cache).warm_up()
+
+
+def main(number=20):
+    for construction_data in [ConstructionData.iwu_heavy,
+                              ConstructionData.tabula_de_standard,
+                              ConstructionData.tabula_dk_standard]:
+        # first call writes the snapshots if they are missing or outdated
+        construct(construction_data, use_cache=True)
+
+        json_time = min(timeit.repeat(
+            lambda: construct(construction_data, use_cache=False),
+            number=number, repeat=3)) / number
+        snapshot_time = min(timeit.repeat(
+            lambda: construct(construction_data, use_cache=True),
+            number=number, repeat=3)) / number
+
+        print("{:<22} json: {:7.2f} ms  snapshot: {:7.2f} ms  "
+              "speedup: {:4.1f}x".format(
+                  construction_data.value,
+                  json_time * 1000,
+                  snapshot_time * 1000,
+                  json_time / snapshot_time))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark the VDI 6007 equivalent resistance calculation of walls.
+
+Compares Wall.calc_equivalent_res() called for each wall with
+calc_equivalent_res_batch() called once for all walls of a project of
+residential archetype buildings, with an empty (cold) and a filled (warm)
+cache of area-normalized values.
+
+Run from the repository root with ``python -m benchmarks.bench_equivalent_res``.
+"""
+
+import timeit
+
+from teaser.project import Project
+from teaser.logic.buildingobjects.buildingphysics.wall import \
+    calc_equivalent_res_batch, equivalent_res_cache
+
+
+def create_project(number_of_buildings):
+    prj = Project()
+    for i in range(number_of_buildings):
+        prj.add_residential(
+            construction_data="iwu_heavy",
+            geometry_data="iwu_single_family_dwelling",
+            name="Building{}".format(i),
+            year_of_construction=1900 + (i * 7) % 110,
+            number_of_floors=2,
+            height_of_floors=3.0,
+            net_leased_area=100 + i,
+            with_ahu=False)
+    return prj
+
+
+def gather_walls(prj):
+    walls = []
+    for bldg in prj.buildings:
+        for zone in bldg.thermal_zones:
+            walls += (zone.outer_walls + zone.rooftops + zone.ground_floors
+                      + zone.inner_walls + zone.floors + zone.ceilings)
+    return walls
+
+
+def per_wall(walls, t_bt):
+    for wall in walls:
+        wall.calc_equivalent_res(t_bt=t_bt)
+
+
+def batch_cold(walls, t_bt):
+    equivalent_res_cache.clear()
+    calc_equivalent_res_batch(walls, t_bt=t_bt)
+
+
+def main(number=5):
+    for number_of_buildings in [10, 100]:
+        walls = gather_walls(create_project(number_of_buildings))
+
+        wall_time = min(timeit.repeat(
+            lambda: per_wall(walls, 5), number=number, repeat=3)) / number
+        cold_time = min(timeit.repeat(
+            lambda: batch_cold(walls, 5), number=number, repeat=3)) / number
+        warm_time = min(timeit.repeat(
+            lambda: calc_equivalent_res_batch(walls, t_bt=5),
+            number=number, repeat=3)) / number
+
+        print("{:>5} walls  per wall: {:7.2f} ms  batch cold: {:7.2f} ms  "
+              "batch warm: {:7.2f} ms  layer stacks: {}".format(
+                  len(walls),
+                  wall_time * 1000,
+                  cold_time * 1000,
+                  warm_time * 1000,
+                  len(equivalent_res_cache)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark writing the AixLib boundary condition tables.
+
+Writes the set temperature, AHU and internal gains tables of office
+buildings with the daily profiles of the use conditions, which are
+exported as one period, and with the same profiles repeated to one year.
+
+Run from the repository root with ``python -m benchmarks.bench_export_tables``.
+"""
+
+import os
+import tempfile
+import time
+import warnings
+
+from teaser.project import Project
+
+
+def create_project(number_of_buildings):
+    prj = Project()
+    prj.name = "BenchExportTables"
+    for i in range(number_of_buildings):
+        prj.add_non_residential(
+            construction_data="iwu_heavy",
+            geometry_data="bmvbs_office",
+            name="Office{}".format(i),
+            year_of_construction=1990,
+            number_of_floors=3,
+            height_of_floors=3.0,
+            net_leased_area=2500.0,
+        )
+    prj.used_library_calc = "AixLib"
+    prj.calc_all_buildings()
+    return prj
+
+
+def write_tables(prj, path):
+    start = time.perf_counter()
+    for bldg in prj.buildings:
+        bldg.library_attr.modelica_set_temp(path=path)
+        bldg.library_attr.modelica_set_temp_cool(path=path)
+        bldg.library_attr.modelica_AHU_boundary(path=path)
+        bldg.library_attr.modelica_gains_boundary(path=path)
+    duration = time.perf_counter() - start
+    size = sum(
+        os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+    return duration, size
+
+
+def main(number_of_buildings=20):
+    warnings.simplefilter("ignore")
+    prj = create_project(number_of_buildings)
+    print("{} office buildings".format(number_of_buildings))
+
+    with tempfile.TemporaryDirectory() as path:
+        duration, size = write_tables(prj, path)
+        print("daily profiles:  {:8.1f} ms {:8.2f} MB".format(
+            duration * 1000, size / 1e6))
+
+    for bldg in prj.buildings:
+        for zone in bldg.thermal_zones:
+            use_cond = zone.use_conditions
+            use_cond.heating_profile = use_cond.heating_profile * 365
+            use_cond.cooling_profile = use_cond.cooling_profile * 365
+            use_cond.persons_profile = use_cond.persons_profile * 365
+
+    with tempfile.TemporaryDirectory() as path:
+        duration, size = write_tables(prj, path)
+        print("yearly profiles: {:8.1f} ms {:8.2f} MB".format(
+            duration * 1000, size / 1e6))
+
+
+if __name__ == "__main__":
+    main()
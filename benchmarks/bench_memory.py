@@ -0,0 +1,73 @@
+"""Benchmark the memory used per building.
+
+Creates residential archetype buildings and reports the memory allocated
+per building (measured with tracemalloc) and the number of building
+elements, layers and materials it holds. Run it before and after a change
+of the object model to compare.
+
+Run from the repository root with ``python -m benchmarks.bench_memory``.
+"""
+
+import gc
+import tracemalloc
+
+from teaser.project import Project
+
+
+def create_buildings(prj, number_of_buildings):
+    for i in range(number_of_buildings):
+        prj.add_residential(
+            construction_data="iwu_heavy",
+            geometry_data="iwu_single_family_dwelling",
+            name="Building{}".format(i),
+            year_of_construction=1900 + (i * 7) % 110,
+            number_of_floors=2,
+            height_of_floors=3.0,
+            net_leased_area=100 + i,
+            with_ahu=False)
+
+
+def count_objects(prj):
+    elements = layers = 0
+    for bldg in prj.buildings:
+        for zone in bldg.thermal_zones:
+            for element in (zone.outer_walls + zone.rooftops
+                            + zone.ground_floors + zone.windows
+                            + zone.inner_walls + zone.floors
+                            + zone.ceilings + zone.doors):
+                elements += 1
+                layers += len(element.layer)
+    return elements, layers
+
+
+def measure(number_of_buildings, intern_materials=False):
+    prj = Project()
+    prj.intern_materials = intern_materials
+    # load the catalogs before measuring
+    create_buildings(prj, 1)
+    prj.buildings = []
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    create_buildings(prj, number_of_buildings)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    elements, layers = count_objects(prj)
+    return (after - before) / number_of_buildings, \
+        elements / number_of_buildings, layers / number_of_buildings
+
+
+def main(number_of_buildings=200):
+    for intern_materials in [False, True]:
+        bytes_per_building, elements, layers = measure(
+            number_of_buildings, intern_materials)
+        print("intern_materials={!s:<5}  {:8.0f} bytes per building  "
+              "({:.0f} elements, {:.0f} layers per building)".format(
+                  intern_materials, bytes_per_building, elements, layers))
+
+
+if __name__ == "__main__":
+    main()
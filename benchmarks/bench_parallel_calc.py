@@ -0,0 +1,46 @@
+"""Benchmark calc_all_buildings() with and without a process pool.
+
+Calculates a project of office buildings sequentially and with
+calc_all_buildings(n_workers=...) for several numbers of workers. The
+parallel runs include starting the pool and shipping the buildings to the
+workers and back.
+
+Run from the repository root with ``python -m benchmarks.bench_parallel_calc``.
+"""
+
+import os
+import time
+import warnings
+
+from teaser.project import Project
+
+
+def create_project(number_of_buildings):
+    prj = Project()
+    for i in range(number_of_buildings):
+        prj.add_non_residential(
+            construction_data="iwu_heavy",
+            geometry_data="bmvbs_office",
+            name="Building{}".format(i),
+            year_of_construction=1950 + (i * 7) % 60,
+            number_of_floors=5,
+            height_of_floors=3.0,
+            net_leased_area=3000 + i,
+            with_ahu=True)
+    return prj
+
+
+def main(number_of_buildings=200):
+    warnings.simplefilter("ignore")
+    prj = create_project(number_of_buildings)
+    print("{} buildings, {} cpus".format(
+        number_of_buildings, os.cpu_count()))
+    for n_workers in [None, 2, 4, 8]:
+        start = time.perf_counter()
+        prj.calc_all_buildings(n_workers=n_workers)
+        print("n_workers={}: {:8.1f} ms".format(
+            n_workers, (time.perf_counter() - start) * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Benchmark the adjustment of yearly (8760 h) use condition profiles.
+
+Loads yearly profiles into many UseConditions, adjusts them with
+calc_adj_schedules() (opening times, weekend factor and set-back) and
+builds the 8760-hour schedules DataFrame of each of them.
+
+Run from the repository root with ``python -m benchmarks.bench_schedules``.
+"""
+
+import time
+
+from teaser.logic.buildingobjects.useconditions import UseConditions
+
+
+def create_use_conditions(number_of_zones):
+    use_conditions = []
+    for i in range(number_of_zones):
+        use_cond = UseConditions()
+        use_cond.heating_profile = use_cond.heating_profile * 365
+        use_cond.cooling_profile = use_cond.cooling_profile * 365
+        use_cond.persons_profile = use_cond.persons_profile * 365
+        use_cond.machines_profile = use_cond.machines_profile * 365
+        use_cond.lighting_profile = use_cond.lighting_profile * 365
+        use_cond.adjusted_opening_times = [7 + i % 3, 18]
+        use_cond.profiles_weekend_factor = 0.5
+        use_cond.set_back_times = [6, 22]
+        use_conditions.append(use_cond)
+    return use_conditions
+
+
+def main(number_of_zones=1000):
+    use_conditions = create_use_conditions(number_of_zones)
+    print("{} zones with 8760-hour profiles".format(number_of_zones))
+
+    start = time.perf_counter()
+    for use_cond in use_conditions:
+        use_cond.calc_adj_schedules()
+    print("calc_adj_schedules: {:8.1f} ms".format(
+        (time.perf_counter() - start) * 1000))
+
+    start = time.perf_counter()
+    for use_cond in use_conditions:
+        use_cond.schedules
+    print("schedules:          {:8.1f} ms".format(
+        (time.perf_counter() - start) * 1000))
+
+
+if __name__ == "__main__":
+    main()
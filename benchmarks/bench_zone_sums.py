@@ -0,0 +1,60 @@
+"""Benchmark the element sums of the calculation models.
+
+Calculates a project of multi-zone office buildings with each of the
+calculation models (OneElement to FiveElement) and reports the time spent
+in calc_all_buildings() and in the _sum_*_elements() functions of the model.
+
+Run from the repository root with ``python -m benchmarks.bench_zone_sums``.
+"""
+
+import cProfile
+import pstats
+import timeit
+import warnings
+
+from teaser.project import Project
+
+
+def create_project(number_of_buildings):
+    prj = Project()
+    for i in range(number_of_buildings):
+        prj.add_non_residential(
+            construction_data="iwu_heavy",
+            geometry_data="bmvbs_office",
+            name="Building{}".format(i),
+            year_of_construction=1950 + (i * 7) % 60,
+            number_of_floors=5,
+            height_of_floors=3.0,
+            net_leased_area=3000 + i,
+            with_ahu=True)
+    return prj
+
+
+def sum_time(prj):
+    """Time spent in the _sum_*_elements() functions of one calculation"""
+    profile = cProfile.Profile()
+    profile.enable()
+    prj.calc_all_buildings()
+    profile.disable()
+    stats = pstats.Stats(profile).stats
+    return sum(
+        cumtime for (_, _, name), (_, _, _, cumtime, _) in stats.items()
+        if name.startswith("_sum_") and name.endswith("_elements"))
+
+
+def main(number_of_buildings=50, number=5):
+    warnings.simplefilter("ignore")
+    prj = create_project(number_of_buildings)
+    zones = sum(len(bldg.thermal_zones) for bldg in prj.buildings)
+    for number_of_elements in [1, 2, 3, 4, 5]:
+        prj.number_of_elements_calc = number_of_elements
+        calc_time = min(timeit.repeat(
+            prj.calc_all_buildings, number=number, repeat=3)) / number
+        print("{} elements  {} zones  calc_all_buildings: {:7.2f} ms  "
+              "element sums (profiled): {:7.2f} ms".format(
+                  number_of_elements, zones, calc_time * 1000,
+                  sum_time(prj) * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
 """This module holds file paths and bindings for json data."""
 import os
 import sys
+import bisect
+import copy
+import hashlib
+import marshal
 import warnings
 
 import teaser.logic.utilities as utils
@@ -15,17 +19,249 @@ if v >= (2, 7):
     except NameError:
         FileNotFoundError = IOError
 
+# Marker for bindings that are loaded on first access
+_NOT_LOADED = object()
+
+# Version of the binary catalog snapshots, increase it whenever the layout of
+# the stored data changes, so that old snapshots are not used anymore.
+SNAPSHOT_VERSION = 2
+
+# Process-wide cache of parsed JSON catalogs. Keys are the normalized file
+# paths (the construction data prefix selects the path), values are tuples of
+# (file stamp, parsed binding, lookup indexes of that binding). Cached
+# bindings are shared between all DataClass instances and must be treated as
+# read-only.
+_binding_cache = {}
+
+
+def clear_binding_cache():
+    """Empty the process-wide cache of parsed JSON catalogs.
+
+    Call this if a catalog has been edited in memory and the edits should
+    not be handed to DataClass instances created afterwards. Changes to the
+    JSON files themselves are detected automatically.
+    """
+    _binding_cache.clear()
+
+
+def _file_stamp(path):
+    """Return a stamp that changes whenever the file at path is modified."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def get_snapshot_dir():
+    """Return the directory of the binary catalog snapshots.
+
+    The directory can be set with the environment variable TEASER_CACHE_DIR,
+    e.g. to share the snapshots between the workers of a batch run. Default
+    is the user cache directory (%LOCALAPPDATA%/teaser on Windows,
+    $XDG_CACHE_HOME/teaser or ~/.cache/teaser elsewhere).
+
+    Returns
+    -------
+    snapshot_dir : str
+        Full path to the snapshot directory
+    """
+    snapshot_dir = os.environ.get("TEASER_CACHE_DIR")
+    if snapshot_dir:
+        return snapshot_dir
+    if sys.platform.startswith("win"):
+        base_dir = os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))
+    else:
+        base_dir = os.environ.get(
+            "XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(base_dir, "teaser")
+
+
+def _snapshot_path(path):
+    """Return the snapshot file of the JSON catalog at path."""
+    path_hash = hashlib.sha1(
+        os.path.normcase(os.path.abspath(path)).encode("utf-8")).hexdigest()
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(
+        get_snapshot_dir(),
+        "{}_{}.v{}.marshal".format(name, path_hash[:16], SNAPSHOT_VERSION))
+
+
+def _is_private_file(path):
+    """Check that path belongs to the current user and only they can write.
+
+    Snapshots in a directory that others can write to are not trusted, as
+    they could be replaced by crafted files. Always True on platforms
+    without POSIX ownership (Windows).
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    stat = os.stat(path)
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+
+def _load_catalog(path, use_snapshot=True):
+    """Parse a JSON catalog, using a binary snapshot if it is up to date.
+
+    The snapshot stores the parsed catalog as plain data (marshal, no
+    pickle) together with the SHA-256 hash of the JSON source. Snapshots
+    are only read if they and their directory belong to the current user
+    and can't be written by others. If the hash of the JSON file differs
+    or the snapshot is missing or unreadable, the JSON is parsed and the
+    snapshot is rewritten. Snapshots that can't be written (e.g. read-only
+    cache directory) are skipped silently.
+
+    Parameters
+    ----------
+    path : str
+        Full path to the JSON file
+    use_snapshot : bool
+        If False, the JSON is always parsed and no snapshot is written
+
+    Returns
+    -------
+    content : dict
+        Parsed content of the JSON file, collections.OrderedDict if parsed
+        from JSON, dict (in the same order) if read from the snapshot
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    if not use_snapshot:
+        return json.loads(raw, object_pairs_hook=collections.OrderedDict)
+
+    source_hash = hashlib.sha256(raw).hexdigest()
+    snapshot = _snapshot_path(path)
+    try:
+        if _is_private_file(os.path.dirname(snapshot)) \
+                and _is_private_file(snapshot):
+            with open(snapshot, "rb") as f:
+                version, snapshot_hash, content = marshal.loads(f.read())
+            if version == SNAPSHOT_VERSION and snapshot_hash == source_hash \
+                    and isinstance(content, dict):
+                return content
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    # marshal only stores plain dicts, they keep the order of the JSON file
+    content = json.loads(raw)
+    try:
+        os.makedirs(os.path.dirname(snapshot), exist_ok=True)
+        # write to a temporary file first, parallel workers may read the
+        # snapshot at the same time
+        tmp_snapshot = "{}.{}.tmp".format(snapshot, os.getpid())
+        with open(tmp_snapshot, "wb") as f:
+            marshal.dump((SNAPSHOT_VERSION, source_hash, content), f)
+        os.replace(tmp_snapshot, snapshot)
+    except (OSError, ValueError):
+        pass
+    return content
+
+
+class _AgeGroupIndex(object):
+    """Sorted building age groups of one element type and construction.
+
+    Entries are tuples of (begin, end, order, key), sorted by begin. The
+    order is the position of the key in the binding, which decides between
+    overlapping age groups, as the first matching entry of the binding wins.
+    """
+
+    def __init__(self):
+        self.begins = []
+        self.entries = []
+        self.overlapping = False
+
+    def add(self, begin, end, order, key):
+        position = bisect.bisect_right(self.begins, begin)
+        self.begins.insert(position, begin)
+        self.entries.insert(position, (begin, end, order, key))
+        self._check_overlap()
+
+    def remove(self, key):
+        for position, entry in enumerate(self.entries):
+            if entry[3] == key:
+                del self.begins[position]
+                del self.entries[position]
+                break
+        self._check_overlap()
+
+    def find(self, year):
+        position = bisect.bisect_right(self.begins, year)
+        if not self.overlapping:
+            if position > 0 and year <= self.entries[position - 1][1]:
+                return self.entries[position - 1][3]
+            return None
+        matches = [entry for entry in self.entries[:position]
+                   if year <= entry[1]]
+        if matches:
+            return min(matches, key=lambda entry: entry[2])[3]
+        return None
+
+    def _check_overlap(self):
+        self.overlapping = False
+        for previous, entry in zip(self.entries, self.entries[1:]):
+            if entry[0] <= previous[1]:
+                self.overlapping = True
+                break
+
+
+def _type_element_index_key(key, element_in):
+    """Return the index key of a type element or None if it is not indexed."""
+    if not isinstance(element_in, dict):
+        return None
+    begin, end = element_in["building_age_group"]
+    if begin is None or end is None:
+        return None
+    return key.split("_")[0], element_in["construction_data"]
+
+
+def _build_type_element_index(element_bind):
+    """Group the type elements by element type and construction."""
+    index = {"groups": {}, "next_order": 0}
+    for key, element_in in element_bind.items():
+        _add_type_element(index, key, element_in)
+    return index
+
+
+def _build_material_name_index(material_bind):
+    """Map material names to ids, the last material of a name wins."""
+    index = {}
+    for mat_id, mat in material_bind.items():
+        if isinstance(mat, dict):
+            index[mat["name"]] = mat_id
+    return index
+
+
+def _add_type_element(index, key, element_in):
+    group_key = _type_element_index_key(key, element_in)
+    if group_key is not None:
+        begin, end = element_in["building_age_group"]
+        index["groups"].setdefault(group_key, _AgeGroupIndex()).add(
+            begin, end, index["next_order"], key)
+    index["next_order"] += 1
+
+
 class DataClass(object):
     """Class for JSON data.
 
     This class loads all JSON files with statistic or template data needed
-    for statistical data enrichment.
+    for statistical data enrichment. Each binding is loaded on first access,
+    so workflows that e.g. only need use conditions never read the type
+    elements. Use warm_up() to load selected bindings in advance.
 
     Parameters
     ----------
     construction_data : ConstructionData
         The prefix of this parameter indicates which statistical data about building
         elements should be used. Its type is the enum class ConstructionData.
+    use_cache : bool
+        If True (default), the JSON catalogs are taken from a process-wide
+        cache that is shared by all DataClass instances and refreshed when
+        the modification time of a file changes. On the first load in a
+        process, a binary snapshot of each catalog is used if its source hash
+        matches the JSON file (see get_snapshot_dir()). Set to False to parse
+        the files again and get bindings that are private to this instance.
+    intern_materials : bool
+        If True, layers of type elements loaded with this DataClass reference
+        one shared, read-only Material per material id instead of an own
+        copy. This saves memory and time for large projects. Default is
+        False. See Material.copy() for editing shared materials.
 
     Attributes
     ----------
@@ -47,88 +283,406 @@ class DataClass(object):
 
     """
 
-    def __init__(self, construction_data: ConstructionData) -> object:
+    def __init__(self, construction_data: ConstructionData,
+                 use_cache=True, intern_materials=False) -> object:
         """Construct DataClass."""
-        self.element_bind = None
+        self.use_cache = use_cache
+        self.intern_materials = intern_materials
+        self._shared_bindings = set()
+        self._indexes = {}
+        self._element_bind = None
+        self.path_tb = None
         if construction_data.is_iwu():
             self.path_tb = utils.get_full_path(
                 "data/input/inputdata/TypeElements_IWU.json"
             )
-            self.load_tb_binding()
         elif construction_data.is_tabula_de():
             self.path_tb = utils.get_full_path(
                 os.path.join(
                     "data", "input", "inputdata", "TypeElements_TABULA_DE.json"
                 )
             )
-            self.load_tb_binding()
         elif construction_data.is_tabula_dk():
             self.path_tb = utils.get_full_path(
                 os.path.join(
                     "data", "input", "inputdata", "TypeElements_TABULA_DK.json"
                 )
             )
-            self.load_tb_binding()
         elif construction_data.is_kfw():
             self.path_tb = utils.get_full_path(
                 os.path.join(
                     "data", "input", "inputdata", "TypeElements_KFW.json"
                 )
             )
-            self.load_tb_binding()
-        elif construction_data is None:
-            pass
-        self.material_bind = None
+        if self.path_tb is not None:
+            self._element_bind = _NOT_LOADED
+        self._material_bind = _NOT_LOADED
         self.path_mat = utils.get_full_path(
             "data/input/inputdata/MaterialTemplates.json"
         )
-        self.conditions_bind = None
+        self._conditions_bind = _NOT_LOADED
         self.path_uc = utils.get_full_path("data/input/inputdata/UseConditions.json")
 
-        self.load_uc_binding()
-        self.load_mat_binding()
+    def warm_up(self, bindings=None):
+        """Load bindings in advance instead of on first access.
+
+        Parameters
+        ----------
+        bindings : list
+            Attribute names of the bindings to load, any of 'element_bind',
+            'material_bind' and 'conditions_bind'. Default is None, which
+            loads all bindings.
+
+        """
+        if bindings is None:
+            bindings = ["element_bind", "material_bind", "conditions_bind"]
+        for binding in bindings:
+            assert binding in (
+                "element_bind", "material_bind", "conditions_bind"), \
+                "Unknown binding " + str(binding)
+            getattr(self, binding)
 
     def load_tb_binding(self):
         """Load TypeBuildingElement json into binding classes."""
         if self.path_tb.endswith("json"):
             if os.path.isfile(self.path_tb):
                 try:
-                    with open(self.path_tb, "r") as f:
-                        self.element_bind = json.load(
-                            f, object_pairs_hook=collections.OrderedDict
-                        )
+                    self.element_bind = self._read_binding(
+                        self.path_tb, "element_bind")
                 except json.decoder.JSONDecodeError:
                     print("Your TypeElements file seems to be broken.")
             else:
                 with open(self.path_tb, "w") as f:
                     self.element_bind = collections.OrderedDict()
+                self._shared_bindings.discard("element_bind")
 
     def load_uc_binding(self):
         """Load UseConditions json into binding classes."""
         if self.path_uc.endswith("json"):
             if os.path.isfile(self.path_uc):
                 try:
-                    with open(self.path_uc, "r") as f:
-                        self.conditions_bind = json.load(
-                            f, object_pairs_hook=collections.OrderedDict
-                        )
+                    self.conditions_bind = self._read_binding(
+                        self.path_uc, "conditions_bind")
                 except json.decoder.JSONDecodeError:
                     raise IOError("Your UseConditions.json file seems to be broken.")
             else:
                 with open(self.path_uc, "w") as f:
                     self.conditions_bind = collections.OrderedDict()
+                self._shared_bindings.discard("conditions_bind")
 
     def load_mat_binding(self):
         """Load MaterialTemplates json into binding classes."""
         if self.path_mat.endswith("json"):
             if os.path.isfile(self.path_mat):
                 try:
-                    with open(self.path_mat, "r") as f:
-                        self.material_bind = json.load(
-                            f, object_pairs_hook=collections.OrderedDict
-                        )
+                    self.material_bind = self._read_binding(
+                        self.path_mat, "material_bind")
                 except json.decoder.JSONDecodeError:
                     print("Your Materials file seems to be broken.")
             else:
                 with open(self.path_mat, "w") as f:
                     self.material_bind = collections.OrderedDict()
+                self._shared_bindings.discard("material_bind")
+
+    def detach_binding(self, binding):
+        """Replace a shared binding by a private copy before it is edited.
+
+        Bindings taken from the process-wide cache are shared with all other
+        DataClass instances. Functions that modify a binding in place (e.g.
+        saving a type element) call this first, so the cache stays
+        untouched.
+
+        Parameters
+        ----------
+        binding : str
+            Attribute name of the binding, one of 'element_bind',
+            'material_bind' or 'conditions_bind'
+
+        Returns
+        -------
+        binding : collections.OrderedDict
+            The binding that is now private to this instance
+
+        """
+        content = getattr(self, binding)
+        if binding in self._shared_bindings:
+            setattr(self, binding, copy.deepcopy(content))
+            self._shared_bindings.discard(binding)
+            self._indexes.pop(binding, None)
+        return getattr(self, binding)
+
+    def find_type_element_key(self, element_type, construction, year):
+        """Find the type element for element type, construction and year.
+
+        Uses an index of the building age groups that is built on first use
+        and shared along with the cached binding, so a lookup is a dict
+        access plus a bisection instead of a scan over all type elements.
+        If age groups overlap, the first matching entry of the binding is
+        returned, as the linear search did.
+
+        Parameters
+        ----------
+        element_type : str
+            Class name of the element, e.g. 'OuterWall'
+        construction : str
+            Construction type, e.g. 'iwu_heavy' or 'tabula_de_standard_1_SFH'
+        year : int
+            Year of construction
+
+        Returns
+        -------
+        key : str
+            Key of the type element in element_bind, None if no entry
+            matches
+
+        """
+        index = self._get_index(
+            "element_bind", "type_element", _build_type_element_index)
+        age_groups = index["groups"].get((element_type, construction))
+        if age_groups is None:
+            return None
+        return age_groups.find(year)
+
+    def update_type_element_index(self, key):
+        """Synchronize the type element index with element_bind for one key.
+
+        Needs to be called after a type element has been added to or deleted
+        from element_bind.
+
+        Parameters
+        ----------
+        key : str
+            Key of the added or deleted type element
+
+        """
+        index = self._get_index(
+            "element_bind", "type_element", _build_type_element_index,
+            build=False)
+        if index is None:
+            return
+        for age_groups in index["groups"].values():
+            age_groups.remove(key)
+        if key in self.element_bind:
+            _add_type_element(index, key, self.element_bind[key])
+
+    def find_material_id(self, mat_name):
+        """Find the id of a material in material_bind by its name.
+
+        If several materials share a name, the id of the last one in the
+        binding is returned. The name index is built on first use and
+        shared along with the cached binding.
+
+        Parameters
+        ----------
+        mat_name : str
+            Name of the material as stored in the JSON
+
+        Returns
+        -------
+        mat_id : str
+            Key of the material in material_bind, None if no material has
+            this name
+
+        """
+        index = self._get_index(
+            "material_bind", "material_name", _build_material_name_index)
+        return index.get(mat_name)
+
+    def get_shared_material(self, mat_id):
+        """Return the shared, read-only Material for a material id.
+
+        The material is created from material_bind on first request and
+        then reused. The pool of shared materials is kept along with the
+        binding, so it is shared with all DataClass instances using the
+        cached binding.
+
+        Parameters
+        ----------
+        mat_id : str
+            id of material from JSON
+
+        Returns
+        -------
+        material : Material()
+            Read-only material, shared by all callers
+
+        """
+        from teaser.logic.buildingobjects.buildingphysics.material import \
+            Material
+        import teaser.data.input.material_input_json as material_input
+
+        materials = self._get_index(
+            "material_bind", "shared_material", lambda binding: {})
+        material = materials.get(mat_id)
+        if material is None:
+            material = Material()
+            material_input.load_material_id(material, mat_id, self)
+            material.make_read_only()
+            materials[mat_id] = material
+        return material
+
+    def get_use_conditions_template(self, zone_usage):
+        """Return the template of a usage for loading UseConditions.
+
+        The template holds the validated attributes of UseConditions
+        loaded from conditions_bind[zone_usage], so loading a usage is a
+        single copy. Profiles are shared, immutable objects. Templates are
+        created on first request and kept along with the binding, they are
+        dropped if the binding is replaced (e.g. by detach_binding()).
+
+        Parameters
+        ----------
+        zone_usage : str
+            Usage as stored in the JSON
+
+        Returns
+        -------
+        template : dict
+            Attributes of UseConditions, shared by all callers
+
+        """
+        import teaser.data.input.usecond_input as usecond_input
+
+        templates = self._get_index(
+            "conditions_bind", "use_conditions_template", lambda binding: {})
+        template = templates.get(zone_usage)
+        if template is None:
+            template = usecond_input.create_use_conditions_template(
+                zone_usage, self)
+            templates[zone_usage] = template
+        return template
+
+    def update_material_index(self, mat_id):
+        """Synchronize the material name index with material_bind.
+
+        Needs to be called after a material has been added to or modified in
+        material_bind. A shared material of this id is dropped from the pool,
+        layers referencing it keep the former values.
+
+        Parameters
+        ----------
+        mat_id : str
+            Key of the added or modified material
+
+        """
+        materials = self._get_index(
+            "material_bind", "shared_material", None, build=False)
+        if materials is not None:
+            materials.pop(mat_id, None)
+        index = self._get_index(
+            "material_bind", "material_name", _build_material_name_index,
+            build=False)
+        if index is None:
+            return
+        mat = self.material_bind.get(mat_id)
+        # bindings of snapshots are plain dicts, reversed() of a dict needs
+        # Python 3.8
+        if isinstance(mat, dict) and mat_id not in index.values() and list(
+                self.material_bind)[-1] == mat_id:
+            index[mat["name"]] = mat_id
+        else:
+            # a modified material may change which id wins for a name
+            index.clear()
+            index.update(_build_material_name_index(self.material_bind))
+
+    def _get_index(self, binding, name, builder, build=True):
+        """Return a lookup index of a binding, building it if needed.
+
+        Indexes are stored per binding object. If the binding has been
+        replaced since the index was built, the index is discarded.
+
+        Parameters
+        ----------
+        binding : str
+            Attribute name of the binding
+        name : str
+            Name of the index
+        builder : callable
+            Function that builds the index from the binding
+        build : bool
+            If False, None is returned instead of building a missing index
+
+        """
+        content = getattr(self, binding)
+        owner, indexes = self._indexes.get(binding, (None, None))
+        if owner is not content:
+            indexes = {}
+            self._indexes[binding] = (content, indexes)
+        if name not in indexes:
+            if not build:
+                return None
+            indexes[name] = builder(content)
+        return indexes[name]
+
+    def _read_binding(self, path, binding):
+        """Parse a JSON catalog or take it from one of the caches.
+
+        Parameters
+        ----------
+        path : str
+            Full path to the JSON file
+        binding : str
+            Attribute name the result is stored in, used to remember whether
+            this instance holds a shared binding
+
+        Returns
+        -------
+        binding : collections.OrderedDict
+            Parsed content of the JSON file
+
+        """
+        key = os.path.normcase(os.path.abspath(path))
+        stamp = _file_stamp(path)
+        if self.use_cache:
+            cached = _binding_cache.get(key)
+            if cached is not None and cached[0] == stamp:
+                self._shared_bindings.add(binding)
+                self._indexes[binding] = (cached[1], cached[2])
+                return cached[1]
+
+        content = _load_catalog(path, use_snapshot=self.use_cache)
+
+        if self.use_cache:
+            indexes = {}
+            _binding_cache[key] = (stamp, content, indexes)
+            self._shared_bindings.add(binding)
+            self._indexes[binding] = (content, indexes)
+        else:
+            self._shared_bindings.discard(binding)
+        return content
+
+    @property
+    def element_bind(self):
+        if self._element_bind is _NOT_LOADED:
+            self.load_tb_binding()
+            if self._element_bind is _NOT_LOADED:
+                self._element_bind = None
+        return self._element_bind
+
+    @element_bind.setter
+    def element_bind(self, value):
+        self._element_bind = value
+
+    @property
+    def material_bind(self):
+        if self._material_bind is _NOT_LOADED:
+            self.load_mat_binding()
+            if self._material_bind is _NOT_LOADED:
+                self._material_bind = None
+        return self._material_bind
+
+    @material_bind.setter
+    def material_bind(self, value):
+        self._material_bind = value
+
+    @property
+    def conditions_bind(self):
+        if self._conditions_bind is _NOT_LOADED:
+            self.load_uc_binding()
+            if self._conditions_bind is _NOT_LOADED:
+                self._conditions_bind = None
+        return self._conditions_bind
+
+    @conditions_bind.setter
+    def conditions_bind(self, value):
+        self._conditions_bind = value
@@ -51,27 +51,14 @@ def load_type_element(element, year, construction, data_class,
     if element_type is None:
         element_type = type(element).__name__
 
-    for key, element_in in element_binding.items():
-        if (
-            element_in["building_age_group"][0]
-            <= year
-            <= element_in["building_age_group"][1]
-            and element_in["construction_data"] == construction
-            and key.startswith(element_type)
-        ):
-            _set_basic_data(element=element, element_in=element_in)
-            for id, layer_in in (
-                        element_in["layer"].items().__reversed__()
-                        if reverse_layers else element_in["layer"].items()
-                ):
-                layer = Layer(element)
-                layer.id = id
-                layer.thickness = layer_in["thickness"]
-                material = Material(layer)
-                mat_input.load_material_id(
-                    material, layer_in["material"]["material_id"], data_class
-                )
-            return
+    key = data_class.find_type_element_key(
+        element_type=element_type, construction=construction, year=year)
+    if key is not None:
+        element_in = element_binding[key]
+        _set_basic_data(element=element, element_in=element_in)
+        _set_layer_data(element=element, element_in=element_in,
+                        data_class=data_class, reverse_layers=reverse_layers)
+        return
     logging.warning(f"No database entry found for construction={construction}, "
                     f"year{year}, element={type(element).__name__}")
 
@@ -108,6 +95,30 @@ def load_type_element_by_key(element, type_element_key, data_class,
     element_in = element_binding[type_element_key]
 
     _set_basic_data(element=element, element_in=element_in)
+    _set_layer_data(element=element, element_in=element_in,
+                    data_class=data_class, reverse_layers=reverse_layers)
+
+
+def _set_layer_data(element, element_in, data_class, reverse_layers):
+    """Set layers and materials for building elements.
+
+    Helper function to add the layers of a type element to the
+    BuildingElement class. If data_class.intern_materials is True, the layers
+    reference shared, read-only materials.
+
+    Parameters
+    ----------
+    element : BuildingElement
+        BuildingElement
+    element_in :
+        json string of input data
+    data_class : DataClass()
+        DataClass containing the bindings for TypeBuildingElement and
+        Material
+    reverse_layers : bool
+        defines if layer list should be reversed
+
+    """
     for id, layer_in in (
             element_in["layer"].items().__reversed__()
             if reverse_layers else element_in["layer"].items()
@@ -115,10 +126,21 @@ def load_type_element_by_key(element, type_element_key, data_class,
         layer = Layer(element)
         layer.id = id
         layer.thickness = layer_in["thickness"]
-        material = Material(layer)
-        mat_input.load_material_id(
-            material, layer_in["material"]["material_id"], data_class
-        )
+        if data_class.intern_materials:
+            layer.material = data_class.get_shared_material(
+                layer_in["material"]["material_id"])
+        else:
+            material = Material(layer)
+            mat_input.load_material_id(
+                material, layer_in["material"]["material_id"], data_class
+            )
+
+    if data_class.intern_materials and (
+            element.inner_convection is not None
+            and element.inner_radiation is not None
+            and element.area is not None):
+        # shared materials don't trigger the calculation on assignment
+        element.calc_ua_value()
 
 
 def _set_basic_data(element, element_in):
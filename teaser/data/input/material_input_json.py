@@ -23,19 +23,10 @@ def load_material(material, mat_name, data_class):
         but the user can individually change that.
 
     """
-    binding = data_class.material_bind
+    mat_id = data_class.find_material_id(mat_name)
 
-    for id, mat in binding.items():
-        if mat["name"] == mat_name:
-
-            material.material_id = id
-            material.name = mat["name"]
-            material.density = mat["density"]
-            material.thermal_conduc = mat["thermal_conduc"]
-            material.heat_capac = mat["heat_capac"]
-            material.solar_absorp = mat["solar_absorp"]
-            material.thickness_default = mat["thickness_default"]
-            material.thickness_list = mat["thickness_list"]
+    if mat_id is not None:
+        _set_material_data(material, mat_id, data_class.material_bind[mat_id])
 
 
 def load_material_id(material, mat_id, data_class):
@@ -57,16 +48,32 @@ def load_material_id(material, mat_id, data_class):
         but the user can individually change that.
 
     """
-    binding = data_class.material_bind
-
-    for id, mat in binding.items():
-        if id == mat_id:
-
-            material.material_id = id
-            material.name = mat["name"]
-            material.density = mat["density"]
-            material.thermal_conduc = mat["thermal_conduc"]
-            material.heat_capac = mat["heat_capac"]
-            material.solar_absorp = mat["solar_absorp"]
-            material.thickness_default = mat["thickness_default"]
-            material.thickness_list = mat["thickness_list"]
+    mat = data_class.material_bind.get(mat_id)
+
+    if isinstance(mat, dict):
+        _set_material_data(material, mat_id, mat)
+
+
+def _set_material_data(material, mat_id, mat):
+    """Set material data from its JSON entry.
+
+    Parameters
+    ----------
+    material : Material()
+        instance of TEASERS Material class
+
+    mat_id : str
+        id of material from JSON
+
+    mat : collections.OrderedDict
+        JSON entry of the material
+
+    """
+    material.material_id = mat_id
+    material.name = mat["name"]
+    material.density = mat["density"]
+    material.thermal_conduc = mat["thermal_conduc"]
+    material.heat_capac = mat["heat_capac"]
+    material.solar_absorp = mat["solar_absorp"]
+    material.thickness_default = mat["thickness_default"]
+    material.thickness_list = mat["thickness_list"]
@@ -6,6 +6,9 @@ def load_use_conditions(use_cond, zone_usage, data_class):
     SIA2024 in addition some AixLib specific use conditions for central AHU
     are defined.
 
+    The values are copied from a template of the usage that data_class
+    creates on first use (see DataClass.get_use_conditions_template()).
+
     Parameters
     ----------
     use_cond : UseConditions()
@@ -21,6 +24,39 @@ def load_use_conditions(use_cond, zone_usage, data_class):
         but the user can individually change that.
 
     """
+    template = data_class.get_use_conditions_template(zone_usage)
+    if use_cond.use_maintained_illuminance:
+        # warns as setting lighting_power does, the value is overwritten
+        use_cond.lighting_power = template["_lighting_power"]
+    use_cond.__dict__.update(template)
+
+
+def create_use_conditions_template(zone_usage, data_class):
+    """Create the template of a usage for load_use_conditions()
+
+    Sets the values of conditions_bind[zone_usage] through the setters of
+    UseConditions once, the resulting attributes are the template.
+
+    Parameters
+    ----------
+    zone_usage : str
+        code list for zone_usage according to 18599
+
+    data_class : DataClass()
+        DataClass containing the bindings for Use Conditions
+
+    Returns
+    -------
+    template : dict
+        Attributes (instance dictionary) of UseConditions with this usage
+
+    """
+    from teaser.logic.buildingobjects.useconditions import UseConditions
+
+    # the attributes set below, without the ones of UseConditions.__init__
+    use_cond = UseConditions.__new__(UseConditions)
+    use_cond._use_maintained_illuminance = False
+
     conditions_bind = data_class.conditions_bind
 
     use_cond.usage = zone_usage
@@ -85,3 +121,4 @@ def load_use_conditions(use_cond, zone_usage, data_class):
     use_cond.with_ideal_thresholds = conditions_bind[zone_usage][
         "with_ideal_thresholds"
     ]
+    return use_cond.__dict__
@@ -177,7 +177,9 @@ def export_besmod(
         bldg_path = os.path.join(path, bldg.name)
         utilities.create_path(bldg_path)
         utilities.create_path(os.path.join(bldg_path, bldg.name + "_DataBase"))
-        bldg.library_attr.modelica_gains_boundary(path=bldg_path)
+        # BESMod reads the table in its own user profiles, keep one year
+        bldg.library_attr.modelica_gains_boundary(
+            path=bldg_path, periodic=False)
 
         with open(os.path.join(bldg_path, bldg.name + ".mo"), 'w') as out_file:
             out_file.write(building_template.render_unicode(
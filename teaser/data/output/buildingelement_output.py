@@ -27,6 +27,7 @@ def save_type_element(element, data_class):
         but the user can individually change that.
 
     """
+    data_class.detach_binding("element_bind")
     add_to_json = True
 
     warning_text = (
@@ -54,6 +55,7 @@ def save_type_element(element, data_class):
         _set_layer_data_json(
             element=element, wall_out=data_class.element_bind[check_str]
         )
+        data_class.update_type_element_index(check_str)
 
     with open(utilities.get_full_path(data_class.path_tb), "w") as file:
         file.write(
@@ -85,7 +87,9 @@ def delete_type_element(element, data_class):
         type(element).__name__, element.building_age_group, element.construction_data
     )
 
+    data_class.detach_binding("element_bind")
     del data_class.element_bind[check_str]
+    data_class.update_type_element_index(check_str)
 
     with open(utilities.get_full_path(data_class.path_tb), "w") as file:
         file.write(
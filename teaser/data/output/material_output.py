@@ -24,6 +24,7 @@ def save_material(material, data_class):
         but the user can individually change that.
 
     """
+    data_class.detach_binding("material_bind")
     data_class.material_bind["version"] = "0.7"
     add_to_json = True
 
@@ -64,6 +65,51 @@ def save_material(material, data_class):
             material.material_id]["thickness_list"] = material.thickness_list
         data_class.material_bind[
             material.material_id]["solar_absorp"] = material.solar_absorp
+        data_class.update_material_index(material.material_id)
+
+    with open(utilities.get_full_path(data_class.path_mat), 'w') as file:
+        file.write(json.dumps(
+            data_class.material_bind,
+            indent=4,
+            separators=(',', ': ')))
+
+
+def modify_material(material, data_class):
+    """Material modifier.
+
+    Overwrites the properties of an existing material in the JSON file for
+    materials with the properties of the given material. The material is
+    identified by its material_id. If no material with this id exists,
+    nothing is changed and a warning is raised.
+
+    Parameters
+    ----------
+    material : Material()
+        instance of TEASERS Material class
+
+    data_class : DataClass()
+        DataClass containing the bindings for TypeBuildingElement and
+        Material (typically this is the data class stored in prj.data,
+        but the user can individually change that.
+
+    """
+    if not isinstance(
+            data_class.material_bind.get(material.material_id), dict):
+        warnings.warn("Material with id " + str(material.material_id) +
+                      " does not exist in JSON, use save_material_template "
+                      "to add it")
+        return
+
+    data_class.detach_binding("material_bind")
+    mat_out = data_class.material_bind[material.material_id]
+    mat_out["name"] = material.name
+    mat_out["density"] = material.density
+    mat_out["thermal_conduc"] = material.thermal_conduc
+    mat_out["heat_capac"] = material.heat_capac
+    mat_out["thickness_default"] = material.thickness_default
+    mat_out["thickness_list"] = material.thickness_list
+    mat_out["solar_absorp"] = material.solar_absorp
+    data_class.update_material_index(material.material_id)
 
     with open(utilities.get_full_path(data_class.path_mat), 'w') as file:
         file.write(json.dumps(
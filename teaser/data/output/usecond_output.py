@@ -26,6 +26,7 @@ def save_use_conditions(use_cond, data_class):
         but the user can individually change that.ile
 
     """
+    data_class.detach_binding("conditions_bind")
     if use_cond.usage in data_class.conditions_bind.keys():
         add_to_json = False
         warnings.warn(
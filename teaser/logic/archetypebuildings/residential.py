@@ -68,8 +68,9 @@ class Residential(Building):
         number of floors above ground (default: None)
     height_of_floors : float [m]
         Average height of the floors (default: None)
-    internal_id : float
-        Random id for the distinction between different buildings.
+    internal_id : int or float
+        Id for the distinction between different buildings, drawn from the
+        id_allocator of the project.
     year_of_retrofit : int
         Year of last retrofit.
     type_of_building : string
@@ -4,7 +4,8 @@
 """This module includes the Building class
 """
 import inspect
-import random
+import teaser.logic.utilities as utilities
+from contextlib import contextmanager
 import re
 import warnings
 from teaser.logic.buildingobjects.calculation.aixlib import AixLib
@@ -79,8 +80,9 @@ class Building(object):
         number of floors above ground (default: None)
     height_of_floors : float [m]
         Average height of the floors (default: None)
-    internal_id : float
-        Random id for the distinction between different buildings.
+    internal_id : int or float
+        Id for the distinction between different buildings, drawn from the
+        id_allocator of the project.
     year_of_retrofit : int
         Year of last retrofit.
     type_of_building : string
@@ -102,10 +104,12 @@ class Building(object):
         List with instances of ThermalZone(), that are located in this building.
     outer_area : dict [degree: m2]
         Dictionary with orientation as key and sum of outer wall areas of
-        that direction as value.
+        that direction as value. Kept up to date by the OuterWalls, Rooftops
+        and GroundFloors of the building (see update_element_area()).
     window_area : dict [degree: m2]
         Dictionary with orientation as key and sum of window areas of
-        that direction as value.
+        that direction as value. Kept up to date by the Windows of the
+        building (see update_element_area()).
     bldg_height : float [m]
         Total building height.
     area_rt : float [m2]
@@ -178,7 +182,7 @@ class Building(object):
         self.height_of_floors = None
         self.inner_wall_approximation_approach \
             = inner_wall_approximation_approach
-        self.internal_id = random.random()
+        self.internal_id = utilities.get_id_allocator(parent).next_id()
         self._year_of_retrofit = None
         self.type_of_building = type(self).__name__
         self.building_id = None
@@ -190,6 +194,14 @@ class Building(object):
         self._thermal_zones = []
         self._outer_area = {}
         self._window_area = {}
+        # bookkeeping of outer_area and window_area: orientation of each
+        # element, areas per orientation, sums and changed orientations
+        self._area_members = {"outer": {}, "window": {}}
+        self._area_orientations = {"outer": {}, "window": {}}
+        self._area_sums = {"outer": {}, "window": {}}
+        self._area_changed = {"outer": set(), "window": set()}
+        self._bulk_edit_depth = 0
+        self._bulk_edit_elements = {}
 
         self.bldg_height = None
         self.area_rt = None
@@ -222,29 +234,13 @@ class Building(object):
         """
 
         for zone in self.thermal_zones:
-            for wall in zone.outer_walls:
-                if wall.orientation == orientation:
-                    wall.area = ((new_area / self.net_leased_area) * zone.area) / sum(
-                        count.orientation == orientation for count in zone.outer_walls
-                    )
-
-            for roof in zone.rooftops:
-                if roof.orientation == orientation:
-                    roof.area = ((new_area / self.net_leased_area) * zone.area) / sum(
-                        count.orientation == orientation for count in zone.rooftops
-                    )
-
-            for ground in zone.ground_floors:
-                if ground.orientation == orientation:
-                    ground.area = ((new_area / self.net_leased_area) * zone.area) / sum(
-                        count.orientation == orientation for count in zone.ground_floors
-                    )
-
-            for door in zone.doors:
-                if door.orientation == orientation:
-                    door.area = ((new_area / self.net_leased_area) * zone.area) / sum(
-                        count.orientation == orientation for count in zone.doors
-                    )
+            for elements in (zone.outer_walls, zone.rooftops,
+                             zone.ground_floors, zone.doors):
+                elements = [element for element in elements
+                            if element.orientation == orientation]
+                for element in elements:
+                    element.area = ((new_area / self.net_leased_area)
+                                    * zone.area) / len(elements)
 
     def set_window_area(self, new_area, orientation):
         """Window area setter
@@ -261,11 +257,11 @@ class Building(object):
         """
 
         for zone in self.thermal_zones:
-            for win in zone.windows:
-                if win.orientation == orientation:
-                    win.area = ((new_area / self.net_leased_area) * zone.area) / sum(
-                        count.orientation == orientation for count in zone.windows
-                    )
+            windows = [win for win in zone.windows
+                       if win.orientation == orientation]
+            for win in windows:
+                win.area = ((new_area / self.net_leased_area)
+                            * zone.area) / len(windows)
 
     def get_outer_wall_area(self, orientation):
         """Get aggregated wall area of one orientation
@@ -355,41 +351,150 @@ class Building(object):
 
         Fills the dictionary outer_area with the sum of outer wall area
         corresponding to the orientations of the building. This function
-        covers OuterWalls, GroundFloors and Rooftops.
+        covers OuterWalls, GroundFloors and Rooftops. outer_area is kept up
+        to date on changes of the elements, this function counts all
+        elements again, e.g. after elements have been removed from the zone
+        lists directly.
 
         """
-        self.outer_area = {}
+        self._area_members["outer"] = {}
+        self._area_orientations["outer"] = {}
+        self._area_sums["outer"] = {}
         for zone_count in self.thermal_zones:
-            for wall_count in zone_count.outer_walls:
-                self.outer_area[wall_count.orientation] = None
-            for roof in zone_count.rooftops:
-                self.outer_area[roof.orientation] = None
-            for ground in zone_count.ground_floors:
-                self.outer_area[ground.orientation] = None
-
-        for key in self.outer_area:
-            self.outer_area[key] = self.get_outer_wall_area(key)
+            for wall_count in (zone_count.outer_walls
+                               + zone_count.rooftops
+                               + zone_count.ground_floors):
+                self.update_element_area(wall_count)
+        self._outer_area = self._get_area_dict("outer")
 
     def fill_window_area_dict(self):
         """Fills the attribute
 
         Fills the dictionary window_area with the sum of window area
-        corresponding to the orientations of the building.
+        corresponding to the orientations of the building. window_area is
+        kept up to date on changes of the windows, this function counts all
+        windows again.
 
         """
-        self.window_area = {}
+        self._area_members["window"] = {}
+        self._area_orientations["window"] = {}
+        self._area_sums["window"] = {}
         for zone_count in self.thermal_zones:
             for win_count in zone_count.windows:
-                self.window_area[win_count.orientation] = None
+                self.update_element_area(win_count)
+        self._window_area = self._get_area_dict("window")
+
+    def update_element_area(self, element):
+        """Updates outer_area or window_area for one changed element
+
+        Moves the contribution of the element to outer_area (OuterWall,
+        Rooftop, GroundFloor) or window_area (Window) from its former to its
+        current orientation and area. Elements without area or orientation
+        don't contribute. This is called by the elements on changes of area,
+        orientation and parent, so each change only costs one update instead
+        of summing up all elements of the building.
 
-        for key in self.window_area:
-            self.window_area[key] = self.get_window_area(key)
+        Parameters
+        ----------
+        element : BuildingElement()
+            OuterWall, Rooftop, GroundFloor or Window of this building
+        """
+        if type(element).__name__ == "Window":
+            kind = "window"
+        else:
+            kind = "outer"
+        members = self._area_members[kind]
+        orientations = self._area_orientations[kind]
+
+        former = members.pop(element, None)
+        if former is not None:
+            areas = orientations[former]
+            del areas[element]
+            if not areas:
+                del orientations[former]
+            self._area_changed[kind].add(former)
+
+        if (element.area is not None
+                and element.orientation is not None
+                and element.parent is not None
+                and element.parent in self._thermal_zones):
+            members[element] = element.orientation
+            orientations.setdefault(element.orientation, {})[element] = \
+                element.area
+            self._area_changed[kind].add(element.orientation)
+
+    @contextmanager
+    def bulk_edit(self):
+        """Defers recalculations of elements while editing the building
+
+        Within this context, changes of building elements (e.g. area,
+        convection and radiation coefficients, layer thickness or
+        conductivity) don't recalculate the UA-Value of the element and the
+        outer_area and window_area of the building. The changed elements are
+        recalculated once when the context is left. Contexts can be nested,
+        the recalculation is done when the outermost context is left.
+
+        Example
+        -------
+        >>> with bldg.bulk_edit():
+        ...     for wall in bldg.thermal_zones[0].outer_walls:
+        ...         wall.inner_convection = 2.0
+        ...         wall.area = 10.0
+
+        """
+        self._bulk_edit_depth += 1
+        try:
+            yield self
+        finally:
+            self._bulk_edit_depth -= 1
+            if self._bulk_edit_depth == 0:
+                elements = self._bulk_edit_elements
+                self._bulk_edit_elements = {}
+                for element in elements:
+                    element.update_building_area()
+                    if element.inner_convection is not None and \
+                            element.inner_radiation is not None and \
+                            element.area is not None:
+                        element.calc_ua_value()
+
+    def defer_element_update(self, element):
+        """Records a changed element for recalculation after bulk_edit()
+
+        Parameters
+        ----------
+        element : BuildingElement()
+            Changed element of this building
+
+        Returns
+        -------
+        deferred : bool
+            True if the building is in bulk_edit() and the recalculation of
+            the element is deferred, False if it has to be done now
+        """
+        if self._bulk_edit_depth == 0:
+            return False
+        self._bulk_edit_elements[element] = None
+        return True
+
+    def _get_area_dict(self, kind):
+        """Sums up the areas of changed orientations for outer/window_area"""
+        orientations = self._area_orientations[kind]
+        sums = self._area_sums[kind]
+        for orientation in self._area_changed[kind]:
+            if orientation in orientations:
+                sums[orientation] = sum(orientations[orientation].values())
+            else:
+                sums.pop(orientation, None)
+        self._area_changed[kind] = set()
+        return {orientation: sums[orientation]
+                for orientation in orientations}
 
     def calc_building_parameter(
             self,
             number_of_elements=None,
             merge_windows=None,
-            used_library=None
+            used_library=None,
+            incremental=False
     ):
         """calc all building parameters
 
@@ -399,9 +504,13 @@ class Building(object):
 
         Parameters
         ----------
-        number_of_elements : int, optional
+        number_of_elements : int or list, optional
             defines the number of elements, that area aggregated, between 1
-            and 5. Default is 2. If None, uses existing class property
+            and 5. Default is 2. If None, uses existing class property. A
+            list of numbers calculates all of these model orders in one pass
+            (see ThermalZone.calc_zone_parameters()), the first one is used
+            as number_of_elements_calc, others can be chosen with
+            select_model_attr()
         merge_windows : bool, optional
             True for merging the windows into the outer walls, False for
             separate resistance for window. If None, uses existing class
@@ -409,6 +518,15 @@ class Building(object):
         used_library : str, optional
             used library (AixLib and IBPSA are supported). If None, uses
             existing class property
+        incremental : bool, optional
+            If True, only zones whose inputs changed since their last
+            calculation are calculated (see
+            ThermalZone.calc_zone_parameters()). Default is False
+
+        Returns
+        -------
+        skipped : int
+            Number of zones whose calculation was skipped
         """
         # Use provided values or fall back to existing class properties
         number_of_elements = (
@@ -420,19 +538,26 @@ class Building(object):
             self._used_library_calc)
 
         # Update class properties with the values being used
-        self.number_of_elements_calc = number_of_elements
+        if isinstance(number_of_elements, (list, tuple)):
+            self.number_of_elements_calc = number_of_elements[0]
+        else:
+            self.number_of_elements_calc = number_of_elements
         self.merge_windows_calc = merge_windows
         self.used_library_calc = used_library
 
+        self.sum_heat_load = 0
         self.area_rt = 0
         self.area_gf = 0
+        skipped = 0
         for zone in self.thermal_zones:
-            zone.calc_zone_parameters(
-                number_of_elements=number_of_elements,
-                merge_windows=merge_windows,
-                t_bt=self.t_bt,
-                t_bt_layer=self.t_bt_layer
-            )
+            if not zone.calc_zone_parameters(
+                    number_of_elements=number_of_elements,
+                    merge_windows=merge_windows,
+                    t_bt=self.t_bt,
+                    t_bt_layer=self.t_bt_layer,
+                    incremental=incremental
+            ):
+                skipped += 1
             self.sum_heat_load += zone.model_attr.heat_load
             self.area_rt += sum(rf.area for rf in zone.rooftops)
             self.area_gf += sum(gf.area for gf in zone.ground_floors)
@@ -463,6 +588,29 @@ class Building(object):
                 self.library_attr.calc_auxiliary_attr()
             elif self.used_library_calc == "IBPSA":
                 self.library_attr = IBPSA(parent=self)
+        return skipped
+
+    def select_model_attr(self, number_of_elements):
+        """Selects the model of one order in all zones for the export
+
+        The zones need to be calculated with this order before, e.g. with
+        calc_building_parameter(number_of_elements=[1, 2, 3, 4, 5]). Sets
+        model_attr of all zones (see ThermalZone.select_model_attr()) and
+        number_of_elements_calc and updates sum_heat_load and the library
+        attributes, without calculating the zones again.
+
+        Parameters
+        ----------
+        number_of_elements : int
+            Model order (1 to 5)
+        """
+        self.sum_heat_load = 0
+        for zone in self.thermal_zones:
+            zone.select_model_attr(number_of_elements)
+            self.sum_heat_load += zone.model_attr.heat_load
+        self.number_of_elements_calc = number_of_elements
+        if type(self.library_attr).__name__ == "AixLib":
+            self.library_attr.calc_auxiliary_attr()
 
     def retrofit_building(
         self,
@@ -572,6 +720,11 @@ class Building(object):
 
             assert type(value).__name__ == "Project", ass_error_1
 
+            if hasattr(self, "internal_id"):
+                # keep ids unique within the project
+                self.internal_id = value.id_allocator.next_id()
+                for zone in self.thermal_zones:
+                    utilities.renew_internal_ids(zone, value.id_allocator)
             self.__parent = value
 
             if inspect.isclass(Building):
@@ -685,22 +838,32 @@ class Building(object):
 
         if value is None:
             self._thermal_zones = []
+            self.fill_outer_area_dict()
+            self.fill_window_area_dict()
 
     @property
     def outer_area(self):
+        if self._area_changed["outer"]:
+            self._outer_area = self._get_area_dict("outer")
         return self._outer_area
 
     @outer_area.setter
     def outer_area(self, value):
         self._outer_area = value
+        # pending changes are replaced by the given value
+        self._get_area_dict("outer")
 
     @property
     def window_area(self):
+        if self._area_changed["window"]:
+            self._window_area = self._get_area_dict("window")
         return self._window_area
 
     @window_area.setter
     def window_area(self, value):
         self._window_area = value
+        # pending changes are replaced by the given value
+        self._get_area_dict("window")
 
     @property
     def year_of_retrofit(self):
@@ -4,6 +4,7 @@ from __future__ import division
 import warnings
 from teaser.logic.buildingobjects.buildingphysics.layer import Layer
 import teaser.data.input.buildingelement_input_json as buildingelement_input
+import teaser.logic.utilities as utilities
 import numpy as np
 import random
 import re
@@ -27,8 +28,9 @@ class BuildingElement(object):
     Attributes
     ----------
 
-    internal_id : float
-        Random id for the distinction between different elements.
+    internal_id : int or float
+        Id for the distinction between different elements, drawn from the
+        id_allocator of the project.
     name : str
         Individual name
     construction_data : str
@@ -112,13 +114,22 @@ class BuildingElement(object):
         Weightfactor of building element ua_value/ua_value_zone
     """
 
+    __slots__ = (
+        "_parent", "internal_id", "_name", "_value", "_construction_data",
+        "_year_of_retrofit", "_year_of_construction", "building_age_group",
+        "_area", "_tilt", "_orientation", "_inner_convection",
+        "_inner_radiation", "_outer_convection", "_outer_radiation",
+        "_layer", "r1", "r2", "r3", "c1", "c2", "c1_korr", "ua_value",
+        "u_value", "r_conduc", "r_inner_conv", "r_inner_rad", "r_inner_comb",
+        "r_outer_conv", "r_outer_rad", "r_outer_comb", "wf_out")
+
     def __init__(self, parent=None):
         """Constructor for BuildingElement
         """
 
         self.parent = parent
 
-        self.internal_id = random.random()
+        self.internal_id = utilities.get_id_allocator(self.parent).next_id()
 
         self.name = None
         self._construction_data = None
@@ -194,6 +205,54 @@ class BuildingElement(object):
             pass
 
 
+    def calc_signature(self):
+        """Returns the inputs of the zone calculation held by this element
+
+        ThermalZone.calc_zone_parameters(incremental=True) compares the
+        signatures of all elements of a zone with the ones of the last
+        calculation to find out whether the zone has changed.
+
+        Returns
+        -------
+        signature : tuple
+            Type, area, tilt, orientation, heat transfer coefficients and
+            the thickness and material properties of all layers
+        """
+        return (
+            type(self).__name__, self._area, self._tilt, self._orientation,
+            self._inner_convection, self._inner_radiation,
+            self._outer_convection, self._outer_radiation,
+            tuple((layer._thickness,) + layer._material.calc_signature()
+                  if layer._material is not None else (layer._thickness,)
+                  for layer in self._layer))
+
+    def update_building_area(self):
+        """Updates outer_area or window_area of the building
+
+        Passes a change of area, orientation or parent of OuterWalls,
+        Rooftops, GroundFloors and Windows to
+        Building.update_element_area(). Other elements are not part of these
+        dictionaries.
+        """
+        if type(self).__name__ in ("OuterWall", "Rooftop", "GroundFloor",
+                                   "Window"):
+            if self.parent is not None and self.parent.parent is not None \
+                    and not self.defer_update():
+                self.parent.parent.update_element_area(self)
+
+    def defer_update(self):
+        """Defers recalculations if the building is in bulk_edit()
+
+        Returns
+        -------
+        deferred : bool
+            True if the building of the element is in Building.bulk_edit()
+            and the recalculation of this element is done at its end
+        """
+        return (self.parent is not None
+                and self.parent.parent is not None
+                and self.parent.parent.defer_element_update(self))
+
     def gather_element_properties(self):
         """Helper function for matrix calculation.
 
@@ -438,6 +497,14 @@ class BuildingElement(object):
         self.r_outer_rad = 0.0
         self.r_outer_comb = 0.0
 
+    @property
+    def parent(self):
+        return self._parent
+
+    @parent.setter
+    def parent(self, value):
+        self._parent = value
+
     @property
     def name(self):
         return self._name
@@ -493,14 +560,7 @@ class BuildingElement(object):
     def orientation(self, value):
 
         self._orientation = value
-        if type(self).__name__ == "OuterWall":
-            if (self.parent is not None and self.parent.parent is not None and
-                    self.area is not None):
-                self.parent.parent.fill_outer_area_dict()
-        elif type(self).__name__ == "Window":
-            if (self.parent is not None and self.parent.parent is not None and
-                    self.area is not None):
-                self.parent.parent.fill_window_area_dict()
+        self.update_building_area()
 
     @property
     def layer(self):
@@ -515,7 +575,8 @@ class BuildingElement(object):
         if self.inner_convection is not None and\
                 self.inner_radiation is not None and\
                 self.area is not None:
-            self.calc_ua_value()
+            if not self.defer_update():
+                self.calc_ua_value()
 
     @property
     def inner_convection(self):
@@ -539,7 +600,8 @@ class BuildingElement(object):
         if self.inner_convection is not None and\
                 self.inner_radiation is not None and\
                 self.area is not None:
-            self.calc_ua_value()
+            if not self.defer_update():
+                self.calc_ua_value()
 
     @property
     def inner_radiation(self):
@@ -563,7 +625,8 @@ class BuildingElement(object):
         if self.inner_convection is not None and\
                 self.inner_radiation is not None and\
                 self.area is not None:
-            self.calc_ua_value()
+            if not self.defer_update():
+                self.calc_ua_value()
 
     @property
     def outer_convection(self):
@@ -587,7 +650,8 @@ class BuildingElement(object):
         if self.inner_convection is not None and\
                 self.inner_radiation is not None and\
                 self.area is not None:
-            self.calc_ua_value()
+            if not self.defer_update():
+                self.calc_ua_value()
 
     @property
     def outer_radiation(self):
@@ -611,7 +675,8 @@ class BuildingElement(object):
         if self.inner_convection is not None and\
                 self.inner_radiation is not None and\
                 self.area is not None:
-            self.calc_ua_value()
+            if not self.defer_update():
+                self.calc_ua_value()
 
     @property
     def area(self):
@@ -632,19 +697,12 @@ class BuildingElement(object):
 
         if value is not None:
             self._area = value
-        if type(self).__name__ == "OuterWall"\
-                or type(self).__name__ == "Rooftop" \
-                or type(self).__name__ == "GroundFloor":
-            if (self.parent is not None and self.parent.parent is not None and
-                    self.orientation is not None):
-                self.parent.parent.fill_outer_area_dict()
-        elif type(self).__name__ == "Window":
-            if self.parent is not None and self.orientation is not None:
-                self.parent.parent.fill_window_area_dict()
+        self.update_building_area()
         if self.inner_convection is not None and\
                 self.inner_radiation is not None and\
                 self.area is not None:
-            self.calc_ua_value()
+            if not self.defer_update():
+                self.calc_ua_value()
 
     @property
     def tilt(self):
@@ -27,8 +27,9 @@ class Door(OuterWall):
     Attributes
     ----------
 
-    internal_id : float
-        Random id for the distinction between different elements.
+    internal_id : int or float
+        Id for the distinction between different elements, drawn from the
+        id_allocator of the project.
     name : str
         Individual name
     construction_data : str
@@ -145,6 +146,8 @@ class Door(OuterWall):
         Weightfactor of building element ua_value/ua_value_zone
     """
 
+    __slots__ = ("__parent",)
+
     def __init__(self, parent=None):
         """
         """
@@ -22,8 +22,9 @@ class Floor(InnerWall):
     Attributes
     ----------
 
-    internal_id : float
-        Random id for the distinction between different elements.
+    internal_id : int or float
+        Id for the distinction between different elements, drawn from the
+        id_allocator of the project.
     name : str
         Individual name
     construction_data : str
@@ -143,6 +144,8 @@ class Floor(InnerWall):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, parent=None):
         """
         """
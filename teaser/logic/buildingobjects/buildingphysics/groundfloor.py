@@ -23,8 +23,9 @@ class GroundFloor(OuterWall):
     Attributes
     ----------
 
-    internal_id : float
-        Random id for the distinction between different elements.
+    internal_id : int or float
+        Id for the distinction between different elements, drawn from the
+        id_allocator of the project.
     name : str
         Individual name
     construction_data : str
@@ -142,6 +143,8 @@ class GroundFloor(OuterWall):
         Weightfactor of building element ua_value/ua_value_zone
     """
 
+    __slots__ = ()
+
     def __init__(self, parent=None):
         """
         """
@@ -23,8 +23,9 @@ class InnerWall(Wall):
     Attributes
     ----------
 
-    internal_id : float
-        Random id for the distinction between different elements.
+    internal_id : int or float
+        Id for the distinction between different elements, drawn from the
+        id_allocator of the project.
     name : str
         Individual name
     construction_data : str
@@ -143,6 +144,8 @@ class InnerWall(Wall):
         Weightfactor of building element ua_value/ua_value_zone
     """
 
+    __slots__ = ("__parent",)
+
     def __init__(self, parent=None):
         """
         """
@@ -29,8 +29,9 @@ class InterzonalCeiling(InterzonalWall):
     Attributes
     ----------
 
-    internal_id : float
-        Random id for the distinction between different elements.
+    internal_id : int or float
+        Id for the distinction between different elements, drawn from the
+        id_allocator of the project.
     name : str
         Individual name
     construction_data : str
@@ -146,6 +147,8 @@ class InterzonalCeiling(InterzonalWall):
         Weightfactor of building element ua_value/ua_value_zone
     """
 
+    __slots__ = ()
+
     def __init__(self, parent=None, other_side=None):
         """Constructor InterzonalCeiling (InterzonalWall)
 
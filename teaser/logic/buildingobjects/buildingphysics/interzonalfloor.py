@@ -28,8 +28,9 @@ class InterzonalFloor(InterzonalWall):
     Attributes
     ----------
 
-    internal_id : float
-        Random id for the distinction between different elements.
+    internal_id : int or float
+        Id for the distinction between different elements, drawn from the
+        id_allocator of the project.
     name : str
         Individual name
     construction_data : str
@@ -146,6 +147,8 @@ class InterzonalFloor(InterzonalWall):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, parent=None, other_side=None):
         """
         """
@@ -30,8 +30,9 @@ class InterzonalWall(Wall):
     Attributes
     ----------
 
-    internal_id : float
-        Random id for the distinction between different elements.
+    internal_id : int or float
+        Id for the distinction between different elements, drawn from the
+        id_allocator of the project.
     name : str
         Individual name
     construction_data : str
@@ -147,6 +148,8 @@ class InterzonalWall(Wall):
         Weightfactor of building element ua_value/ua_value_zone
     """
 
+    __slots__ = ("__parent", "idx_orientation")
+
     def __init__(self, parent=None, other_side=None):
         """
         """
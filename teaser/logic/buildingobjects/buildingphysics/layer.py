@@ -2,7 +2,7 @@
 # by TEASER4 Development Team
 
 
-import random
+import teaser.logic.utilities as utilities
 
 
 class Layer(object):
@@ -29,13 +29,15 @@ class Layer(object):
         Thickness of the layer
     """
 
+    __slots__ = ("__parent", "_material", "_thickness", "id", "internal_id")
+
     def __init__(self, parent=None, id=0, parent_position=None):
         """Constructor of Layer.
 
 
         """
         self.parent = (parent, parent_position)
-        self.internal_id = random.random()
+        self.internal_id = utilities.get_id_allocator(self.parent).next_id()
         self.id = id
         self._material = None
         self._thickness = 0.0
@@ -108,5 +110,6 @@ class Layer(object):
             self._thickness = float(value)
 
         if self.material is not None and self.parent is not None:
-            if vars(self.material)['_thermal_conduc'] != 0:
-                self.parent.calc_ua_value()
+            if self.material._thermal_conduc != 0:
+                if not self.parent.defer_update():
+                    self.parent.calc_ua_value()
@@ -3,7 +3,7 @@
 
 
 import re
-import uuid
+import teaser.logic.utilities as utilities
 import teaser.data.input.material_input_json as material_input
 import teaser.data.output.material_output as material_output
 
@@ -45,13 +45,23 @@ class Material(object):
     material_id : str(uuid)
         UUID of material, this is used to have similar behaviour like foreign
         key in SQL data bases for use in TypeBuildingElements and Material json
+    is_shared : bool
+        True if this material is a read-only catalog record that is shared
+        between layers (see DataClass.intern_materials). Use copy() to get
+        an editable material.
 
     """
 
+    __slots__ = (
+        "_read_only", "__parent", "_name", "_density", "_thermal_conduc",
+        "_heat_capac", "_solar_absorp", "_ir_emissivity", "_transmittance",
+        "_thickness_default", "_thickness_list", "__material_id")
+
     def __init__(self, parent=None):
         """Constructor of Material.
         """
 
+        object.__setattr__(self, "_read_only", False)
         self.parent = parent
         self._name = ""
         self._density = 0.0
@@ -66,7 +76,77 @@ class Material(object):
         self._thickness_default = 0.0
         self._thickness_list = []
 
-        self.material_id = str(uuid.uuid1())
+        # drawn on first access, most materials get their id from JSON
+        self.material_id = None
+
+    def __setattr__(self, name, value):
+        if self._read_only:
+            raise AttributeError(
+                "Material " + str(self._name) + " is shared between layers "
+                "and can't be changed, use copy() to get an editable "
+                "material")
+        super(Material, self).__setattr__(name, value)
+
+    def __setstate__(self, state):
+        """Restores a copy (e.g. copy.deepcopy()), also of shared materials"""
+        if isinstance(state, tuple):
+            state = state[1]
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def copy(self, parent=None):
+        """Return an editable copy of this material.
+
+        This is the way to change a shared material of a layer, e.g.
+        layer.material.copy(parent=layer) replaces the shared material of
+        the layer by a private copy. The copy keeps the material_id, as it
+        still refers to the same catalog entry.
+
+        Parameters
+        ----------
+        parent : Layer
+            The layer the copy belongs to. Default is None
+
+        Returns
+        -------
+        material : Material()
+            Editable copy of this material
+
+        """
+        material = Material(parent)
+        material._name = self._name
+        material._density = self._density
+        material._thermal_conduc = self._thermal_conduc
+        material._heat_capac = self._heat_capac
+        material._solar_absorp = self._solar_absorp
+        material._ir_emissivity = self._ir_emissivity
+        material._transmittance = self._transmittance
+        material._thickness_default = self._thickness_default
+        material._thickness_list = list(self._thickness_list)
+        material.material_id = self.material_id
+        return material
+
+    def calc_signature(self):
+        """Returns the properties used by the zone calculation
+
+        Part of BuildingElement.calc_signature().
+
+        Returns
+        -------
+        signature : tuple
+            density, thermal_conduc, heat_capac, solar_absorp,
+            ir_emissivity and transmittance
+        """
+        return (self._density, self._thermal_conduc, self._heat_capac,
+                self._solar_absorp, self._ir_emissivity, self._transmittance)
+
+    def make_read_only(self):
+        """Protect this material against changes.
+
+        Used for materials that are shared between layers. Read-only
+        materials can't be made editable again, use copy() instead.
+        """
+        object.__setattr__(self, "_read_only", True)
 
     def load_material_template(self, mat_name, data_class=None):
         """Material loader.
@@ -143,8 +223,16 @@ class Material(object):
 
         material_output.modify_material(material=self, data_class=data_class)
 
+    @property
+    def is_shared(self):
+        return self._read_only
+
     @property
     def material_id(self):
+        if self.__material_id is None:
+            object.__setattr__(
+                self, "_Material__material_id",
+                utilities.get_id_allocator(self.parent).next_uuid())
         return self.__material_id
 
     @material_id.setter
@@ -214,7 +302,8 @@ class Material(object):
                             self.parent.parent.inner_radiation is \
                             not None and \
                             self.parent.parent.area is not None:
-                        self.parent.parent.calc_ua_value()
+                        if not self.parent.parent.defer_update():
+                            self.parent.parent.calc_ua_value()
 
     @property
     def density(self):
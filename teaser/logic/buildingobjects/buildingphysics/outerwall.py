@@ -23,8 +23,9 @@ class OuterWall(Wall):
     Attributes
     ----------
 
-    internal_id : float
-        Random id for the distinction between different elements.
+    internal_id : int or float
+        Id for the distinction between different elements, drawn from the
+        id_allocator of the project.
     name : str
         Individual name
     construction_data : str
@@ -142,6 +143,8 @@ class OuterWall(Wall):
         Weightfactor of building element ua_value/ua_value_zone
     """
 
+    __slots__ = ("__parent",)
+
     def __init__(self, parent=None):
         """
         """
@@ -176,6 +179,10 @@ class OuterWall(Wall):
             else:
                 raise ValueError('Instance of OuterWall not known')
 
+            if hasattr(self, "_orientation"):
+                # parent changed after construction
+                self.update_building_area()
+
             if self.parent.parent is not None:
                 self.year_of_construction = \
                     self.parent.parent.year_of_construction
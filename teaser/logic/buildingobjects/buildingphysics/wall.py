@@ -3,6 +3,7 @@ from teaser.logic.buildingobjects.buildingphysics.buildingelement \
     import BuildingElement
 from teaser.logic.buildingobjects.buildingphysics.layer import Layer
 from teaser.logic.buildingobjects.buildingphysics.material import Material
+import collections
 import numpy as np
 import warnings
 
@@ -25,8 +26,9 @@ class Wall(BuildingElement):
     Attributes
     ----------
 
-    internal_id : float
-        Random id for the distinction between different elements.
+    internal_id : int or float
+        Id for the distinction between different elements, drawn from the
+        id_allocator of the project.
     name : str
         Individual name
     construction_data : str
@@ -146,6 +148,9 @@ class Wall(BuildingElement):
         Weightfactor of building element ua_value/ua_value_zone
     """
 
+    __slots__ = ("_other_side", "_interzonal_type_material",
+                 "_interzonal_type_export")
+
     def __init__(self, parent=None, other_side=None):
         """Constructor of Wall
         """
@@ -279,6 +284,23 @@ class Wall(BuildingElement):
                 or type(self).__name__ == "GroundFloor":
             self.c1 = self.c1_korr
 
+    def calc_signature(self):
+        """Returns the inputs of the zone calculation held by this element
+
+        Extends BuildingElement.calc_signature() by the adjacent zone and
+        the export type of interzonal elements, which decide how the
+        element is aggregated.
+
+        Returns
+        -------
+        signature : tuple
+            Signature of the element
+        """
+        signature = super(Wall, self).calc_signature()
+        if self._other_side is None:
+            return signature
+        return signature + (self._other_side, self.interzonal_type_export)
+
     def insulate_wall(
             self,
             material=None,
@@ -589,4 +611,236 @@ class Wall(BuildingElement):
     def interzonal_type_export(self, value):
         allowed_values = (None, 'inner', 'outer_ordered', 'outer_reversed')
         assert value in allowed_values
-        self._interzonal_type_export = value
\ No newline at end of file
+        self._interzonal_type_export = value
+
+
+class EquivalentResCache(object):
+    """Bounded LRU cache of area-normalized VDI 6007 parameters.
+
+    The equivalent resistances and capacities of a wall only depend on its
+    layer stack and t_bt, the area just scales them. The cache stores
+    r1*A, r2*A, r3*A, c1/A, c2/A and c1_korr/A for a fingerprint of the
+    layer stack (thickness, thermal_conduc, density and heat_capac of each
+    layer in calculation order) and t_bt. Walls of the same type element
+    thus only need one matrix chain calculation.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximal number of cached layer stacks, the least recently used one
+        is dropped first (default 4096)
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups that were found in the cache
+    misses : int
+        Number of lookups that needed a calculation
+    """
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._values = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._values)
+
+    def get(self, key):
+        """Return the cached values for key or None, counts hits/misses"""
+        values = self._values.get(key)
+        if values is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._values.move_to_end(key)
+        return values
+
+    def put(self, key, values):
+        """Store values for key and drop the least recently used entries"""
+        self._values[key] = values
+        self._values.move_to_end(key)
+        while len(self._values) > self.maxsize:
+            self._values.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries and reset the counters"""
+        self._values.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+equivalent_res_cache = EquivalentResCache()
+
+
+def calc_equivalent_res_batch(walls, t_bt=7):
+    """Equivalent resistance according to VDI 6007 for many walls at once.
+
+    Vectorized version of Wall.calc_equivalent_res(). Area-normalized values
+    are looked up in equivalent_res_cache by layer stack and t_bt, so only
+    layer stacks that are not cached are calculated. Their layers are
+    gathered into arrays padded to the maximal number of layers. Padding
+    layers are represented by identity matrices, so the chain matrix of each
+    stack is the same as in Wall.calc_equivalent_res(). The transfer matrices
+    of all layers are set up in one step and multiplied layer by layer for
+    all stacks together. The results (r1, r2, r3, c1, c2, c1_korr) are
+    scaled by the area of each wall and set on the wall.
+
+    Parameters
+    ----------
+    walls : list
+        List of Wall() instances (e.g. all walls of one zone, building or
+        project)
+    t_bt : int
+        Time constant according to VDI 6007 (default t_bt = 7)
+    """
+
+    walls = list(walls)
+    if not walls:
+        return
+
+    # raises the same errors for missing or zero area as the per wall path
+    area_inv = [1 / wall.area for wall in walls]
+
+    keys = []
+    # values of this call, kept locally so that entries dropped from the
+    # cache by later puts of this call are still available
+    values = {}
+    missing = collections.OrderedDict()
+    for wall in walls:
+        layer_stack = tuple(
+            (layer.thickness,
+             layer.material.thermal_conduc,
+             layer.material.density,
+             layer.material.heat_capac) for layer in wall.layer)
+        if wall.interzonal_type_export == 'outer_reversed':
+            layer_stack = layer_stack[-1::-1]
+        key = (t_bt, layer_stack)
+        keys.append(key)
+        if key in values or key in missing:
+            continue
+        value = equivalent_res_cache.get(key)
+        if value is None:
+            missing[key] = layer_stack
+        else:
+            values[key] = value
+
+    if missing:
+        calculated = _calc_equivalent_res_normalized(
+            list(missing.values()), t_bt)
+        for key, value in zip(missing, calculated):
+            equivalent_res_cache.put(key, value)
+            values[key] = value
+
+    for wall, key, inv in zip(walls, keys, area_inv):
+        r1, r2, r3, c1, c2, c1_korr = values[key]
+        wall.r3 = inv * r3
+        wall.c1_korr = wall.area * c1_korr
+        if wall.interzonal_type_export == 'outer_reversed':
+            wall.r1 = inv * r2
+            wall.r2 = inv * r1
+            wall.c1 = wall.area * c2
+            wall.c2 = wall.area * c1
+        else:
+            wall.r1 = inv * r1
+            wall.r2 = inv * r2
+            wall.c1 = wall.area * c1
+            wall.c2 = wall.area * c2
+
+        if type(wall).__name__ == "OuterWall" \
+                or type(wall).__name__ == "Rooftop" \
+                or type(wall).__name__ == "GroundFloor":
+            wall.c1 = wall.c1_korr
+
+
+def _calc_equivalent_res_normalized(layer_stacks, t_bt):
+    """Calculate area-normalized VDI 6007 parameters for layer stacks.
+
+    Parameters
+    ----------
+    layer_stacks : list
+        List of layer stacks, each a tuple of (thickness, thermal_conduc,
+        density, heat_capac) per layer in calculation order
+    t_bt : int
+        Time constant according to VDI 6007
+
+    Returns
+    -------
+    values : list
+        List of tuples (r1*A, r2*A, r3*A, c1/A, c2/A, c1_korr/A) for each
+        layer stack, r1/c1 refer to the first layer of the stack
+    """
+
+    nr_of_stacks = len(layer_stacks)
+    max_layer = max(len(layer_stack) for layer_stack in layer_stacks)
+    properties = np.zeros((nr_of_stacks, max_layer, 4))
+    is_layer = np.zeros((nr_of_stacks, max_layer), dtype=bool)
+    for i, layer_stack in enumerate(layer_stacks):
+        if layer_stack:
+            properties[i, :len(layer_stack)] = layer_stack
+            is_layer[i, :len(layer_stack)] = True
+
+    thickness = properties[..., 0]
+    thermal_conduc = properties[..., 1]
+    density = properties[..., 2]
+    heat_capac = properties[..., 3]
+
+    omega = 2 * np.pi / (86400 * t_bt)
+
+    r_layer = np.zeros((nr_of_stacks, max_layer))
+    r_layer[is_layer] = thickness[is_layer] / thermal_conduc[is_layer]
+    c_layer = heat_capac * density * thickness * 1000
+
+    r = r_layer[is_layer]
+    c = c_layer[is_layer]
+    sqrt_rc = np.sqrt(0.5 * omega * r * c)
+    cosh = np.cosh(sqrt_rc)
+    cos = np.cos(sqrt_rc)
+    sinh = np.sinh(sqrt_rc)
+    sin = np.sin(sqrt_rc)
+    r_sqrt = r * np.sqrt(1 / (2 * omega * r * c))
+
+    re11 = cosh * cos
+    im11 = sinh * sin
+    re12 = r_sqrt * (cosh * sin + sinh * cos)
+    im12 = r_sqrt * (cosh * sin - sinh * cos)
+    re21 = (-1 / r) * sqrt_rc * (cosh * sin - sinh * cos)
+    im21 = (1 / r) * sqrt_rc * (cosh * sin + sinh * cos)
+
+    # -----setting up the matrix for each layer, identity for padding
+    a_layer = np.zeros((nr_of_stacks, max_layer, 4, 4))
+    a_layer[...] = np.diag(np.ones(4))
+    a_layer[is_layer] = np.stack([
+        np.stack([re11, im11, re12, im12], axis=-1),
+        np.stack([-im11, re11, -im12, re12], axis=-1),
+        np.stack([re21, im21, re11, im11], axis=-1),
+        np.stack([-im21, re21, -im11, re11], axis=-1)], axis=-2)
+
+    # -----multiplication of the matrix
+    new_mat = np.zeros((nr_of_stacks, 4, 4))
+    new_mat[...] = np.diag(np.ones(4))
+    for count_layer in range(max_layer):
+        new_mat = np.matmul(new_mat, a_layer[:, count_layer])
+
+    m00 = new_mat[:, 0, 0]
+    m01 = new_mat[:, 0, 1]
+    m02 = new_mat[:, 0, 2]
+    m03 = new_mat[:, 0, 3]
+    m23 = new_mat[:, 2, 3]
+    m33 = new_mat[:, 3, 3]
+
+    # equivalent Resistance and capacities for an area of 1 m2
+    r1 = ((m33 - 1) * m02 + m23 * m03) / ((m33 - 1) ** 2 + m23 ** 2)
+    r2 = ((m00 - 1) * m02 + m01 * m03) / ((m00 - 1) ** 2 + m01 ** 2)
+    c1 = ((m33 - 1) ** 2 + m23 ** 2) / \
+        (omega * (m02 * m23 - (m33 - 1) * m03))
+    c2 = ((m00 - 1) ** 2 + m01 ** 2) / \
+        (omega * (m02 * m01 - (m00 - 1) * m03))
+    r_wall = np.sum(r_layer, axis=1)
+    r3 = r_wall - r1 - r2
+
+    c1_korr = (1 / (omega * r1)) * ((r_wall - m02 * m33 - m03 * m23)
+                                    / (m33 * m03 - m02 * m23))
+
+    return list(zip(r1, r2, r3, c1, c2, c1_korr))
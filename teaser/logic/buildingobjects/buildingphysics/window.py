@@ -25,8 +25,9 @@ class Window(BuildingElement):
      Attributes
     ----------
 
-    internal_id : float
-        Random id for the distinction between different elements.
+    internal_id : int or float
+        Id for the distinction between different elements, drawn from the
+        id_allocator of the project.
     name : str
         Individual name
     construction_data : str
@@ -156,6 +157,9 @@ class Window(BuildingElement):
 
     """
 
+    __slots__ = ("__parent", "_g_value", "_a_conv", "_shading_g_total",
+                 "_shading_max_irr")
+
     def __init__(self, parent=None):
 
         super(Window, self).__init__(parent)
@@ -193,6 +197,21 @@ class Window(BuildingElement):
         for layer_count in c_layer:
             self.c1 += layer_count
 
+    def calc_signature(self):
+        """Returns the inputs of the zone calculation held by this element
+
+        Extends BuildingElement.calc_signature() by the solar properties of
+        the window.
+
+        Returns
+        -------
+        signature : tuple
+            Signature of the element
+        """
+        return super(Window, self).calc_signature() + (
+            self._g_value, self._a_conv, self._shading_g_total,
+            self._shading_max_irr)
+
     def replace_window(self, year_of_retrofit, window_type=None):
         """Replace a window, with a newer one.
 
@@ -241,6 +260,10 @@ class Window(BuildingElement):
             else:
                 raise ValueError('Instance of Window not known')
 
+            if hasattr(self, "_orientation"):
+                # parent changed after construction
+                self.update_building_area()
+
             if self.parent.parent is not None:
                 self.year_of_construction = \
                     self.parent.parent.year_of_construction
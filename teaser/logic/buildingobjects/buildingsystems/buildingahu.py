@@ -5,6 +5,7 @@
 """
 import pandas as pd
 from itertools import cycle, islice
+import teaser.logic.utilities as utilities
 
 
 class BuildingAHU(object):
@@ -107,9 +108,7 @@ class BuildingAHU(object):
         self._v_flow_profile = 7 * [0.0] + 12 * [1.0] + 5 * [0.0]
 
         self.schedules = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="h")
-            .to_series()
-            .dt.strftime("%m-%d %H:%M:%S"),
+            index=utilities.get_hourly_index(),
             data={
                 "temperature_profile": list(
                     islice(cycle(self.temperature_profile), 8760)
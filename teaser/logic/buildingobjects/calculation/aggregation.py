@@ -0,0 +1,514 @@
+# created October 2026
+
+import numpy as np
+from teaser.logic.buildingobjects.buildingphysics.wall import \
+    calc_equivalent_res_batch
+
+
+class ElementSums(object):
+    """Sums of the properties of a list of building elements
+
+    Walks through the elements once and sums all their properties in the
+    same loop: areas and UA-values are summed, resistances are summed as
+    conductances (parallel connection) and surface properties are summed
+    area weighted. The sums add the elements in list order, so the results
+    equal generator sums over the same list.
+
+    Parameters
+    ----------
+
+    elements : list
+        List of building elements, the equivalent resistances and UA-values
+        need to be calculated beforehand.
+    outer : bool
+        If True, also sums the values facing the ambient (or the adjacent
+        zone), as needed for outer walls and rooftops. Default is True
+    window : bool
+        If True, also sums a_conv and g_value of windows. Default is False
+
+    Attributes
+    ----------
+
+    columns : tuple
+        Names of the summed columns, inner_columns, outer_columns or
+        window_columns
+    totals : list
+        Sums of all columns
+
+    """
+
+    inner_columns = (
+        "area",
+        "ua_value",
+        "r_inner_conv",
+        "r_inner_rad",
+        "r_inner_comb",
+        "ir_emissivity_inner",
+    )
+    outer_columns = inner_columns + (
+        "r_outer_conv",
+        "r_outer_rad",
+        "r_outer_comb",
+        "ir_emissivity_outer",
+        "solar_absorp",
+    )
+    window_columns = outer_columns + ("a_conv", "g_value")
+
+    _index = {name: i for i, name in enumerate(window_columns)}
+
+    def __init__(self, elements=(), outer=True, window=False):
+
+        if window:
+            self.columns = self.window_columns
+        elif outer:
+            self.columns = self.outer_columns
+        else:
+            self.columns = self.inner_columns
+        self.totals = sum_elements(
+            elements, outer, window)[:len(self.columns)]
+
+    @classmethod
+    def from_totals(cls, totals, columns):
+        """ElementSums with the given totals, e.g. from sum_elements()"""
+        element_sums = cls.__new__(cls)
+        element_sums.columns = columns
+        element_sums.totals = totals[:len(columns)]
+        return element_sums
+
+    def total(self, name):
+        """Sum of the column name of all elements
+
+        Resistances are summed as conductances (1 / r), the surface
+        properties (e.g. ir_emissivity_inner) weighted with the element area.
+
+        """
+        return self.totals[self._index[name]]
+
+    def parallel(self, name):
+        """Resistance name of all elements connected in parallel"""
+        return 1 / self.totals[self._index[name]]
+
+    def area_weighted(self, name):
+        """Area weighted mean of the property name of all elements"""
+        return self.totals[self._index[name]] / self.totals[0]
+
+    @property
+    def area(self):
+        return self.totals[0]
+
+    @property
+    def ua_value(self):
+        return self.totals[1]
+
+
+def sum_elements(elements, outer=True, window=False, totals=None):
+    """Sums the properties of the elements in one loop
+
+    See ElementSums for the meaning of the columns.
+
+    Parameters
+    ----------
+
+    elements : list
+        List of building elements
+    outer : bool
+        If True, also sums the values facing the ambient. Default is True
+    window : bool
+        If True, also sums a_conv and g_value of windows. Default is False
+    totals : list
+        Sums to continue with. Default is None
+
+    Returns
+    -------
+
+    totals : list
+        Sums of all columns of ElementSums.window_columns, those that are
+        not summed are zero
+
+    """
+    if totals is None:
+        totals = [0] * len(ElementSums.window_columns)
+        if not elements:
+            return totals
+    else:
+        totals = totals + [0] * (
+            len(ElementSums.window_columns) - len(totals))
+
+    (area, ua_value, conv_inner, rad_inner, comb_inner, emissivity_inner,
+     conv_outer, rad_outer, comb_outer, emissivity_outer, solar_absorp,
+     a_conv, g_value) = totals
+    for el in elements:
+        el_area = el.area
+        area += el_area
+        ua_value += el.ua_value
+        conv_inner += 1 / el.r_inner_conv
+        rad_inner += 1 / el.r_inner_rad
+        comb_inner += 1 / el.r_inner_comb
+        emissivity_inner += el.layer[0].material.ir_emissivity * el_area
+        if outer:
+            conv_outer += 1 / el.r_outer_conv
+            rad_outer += 1 / el.r_outer_rad
+            comb_outer += 1 / el.r_outer_comb
+            material = el.layer[-1].material
+            emissivity_outer += material.ir_emissivity * el_area
+            solar_absorp += material.solar_absorp * el_area
+            if window:
+                a_conv += el.a_conv * el_area
+                g_value += el.g_value * el_area
+    return [
+        area, ua_value, conv_inner, rad_inner, comb_inner, emissivity_inner,
+        conv_outer, rad_outer, comb_outer, emissivity_outer, solar_absorp,
+        a_conv, g_value,
+    ]
+
+
+class ElementCalculation(object):
+    """Calculates the equivalent resistances and UA-values of elements
+
+    Used by the calculation models (OneElement to FiveElement) for the
+    element values (Wall.calc_equivalent_res(), calc_ua_value()) their
+    aggregation is based on. An element is only calculated again if this
+    instance hasn't calculated it before with the same t_bt. The element
+    values only depend on the element and t_bt, so models of several
+    orders that share one instance (see ThermalZone.calc_zone_parameters())
+    calculate each element once, as does a model that needs its inner
+    walls twice.
+
+    """
+
+    def __init__(self):
+
+        self._t_bt = {}
+
+    def _pending(self, elements, t_bt):
+        return [element for element in elements
+                if element not in self._t_bt or self._t_bt[element] != t_bt]
+
+    def calc_walls(self, walls, t_bt=7):
+        """Calculates walls, rooftops, floors and interzonal elements
+
+        Parameters
+        ----------
+
+        walls : list
+            Wall instances (OuterWall, InnerWall, Rooftop ...)
+        t_bt : float [d]
+            Time constant according to VDI 6007 (default t_bt = 7)
+
+        """
+        walls = self._pending(walls, t_bt)
+        calc_equivalent_res_batch(walls, t_bt=t_bt)
+        for wall in walls:
+            wall.calc_ua_value()
+            self._t_bt[wall] = t_bt
+
+    def calc_windows(self, windows):
+        """Calculates windows
+
+        Parameters
+        ----------
+
+        windows : list
+            Window instances
+
+        """
+        for win in self._pending(windows, None):
+            win.calc_equivalent_res()
+            win.calc_ua_value()
+            self._t_bt[win] = None
+
+
+class ZoneAggregator(object):
+    """Sums the elements of a thermal zone kind by kind
+
+    Used by the calculation models (OneElement to FiveElement) to sum up
+    their element groups. Each kind of element of the thermal zone (e.g.
+    outer_walls) is summed once, when it is first needed, and is reused by
+    all groups that contain it.
+
+    Parameters
+    ----------
+
+    thermal_zone : ThermalZone()
+        Thermal zone the elements belong to
+    nzbs_for_iw : list
+        Interzonal elements that are treated as inner walls. Default is an
+        empty list
+
+    """
+
+    kinds = (
+        "outer_walls",
+        "rooftops",
+        "ground_floors",
+        "izes_outer",
+        "inner_walls",
+        "floors",
+        "ceilings",
+        "nzbs_for_iw",
+        "windows",
+    )
+    outer_kinds = ("outer_walls", "rooftops", "izes_outer", "windows")
+
+    def __init__(self, thermal_zone, nzbs_for_iw=None):
+
+        self.thermal_zone = thermal_zone
+        self.nzbs_for_iw = nzbs_for_iw if nzbs_for_iw is not None else []
+        self._izes_outer = None
+        self._facades = None
+        self._totals = {}
+        self._sums = {}
+
+    @property
+    def facades(self):
+        """FacadeIndex of the thermal zone, built when first needed"""
+        if self._facades is None:
+            self._facades = self.thermal_zone.facade_index()
+        return self._facades
+
+    def elements(self, kind):
+        """Element list of the given kind"""
+        if kind == "izes_outer":
+            if self._izes_outer is None:
+                self._izes_outer = self.thermal_zone.find_izes_outer()
+            return self._izes_outer
+        elif kind == "nzbs_for_iw":
+            return self.nzbs_for_iw
+        assert kind in self.kinds, "Unknown kind of element " + str(kind)
+        return getattr(self.thermal_zone, kind)
+
+    def _kind_totals(self, kind):
+        """Totals of one kind of element, see sum_elements()"""
+        try:
+            return self._totals[kind]
+        except KeyError:
+            totals = sum_elements(
+                self.elements(kind),
+                outer=kind in self.outer_kinds,
+                window=kind == "windows")
+            self._totals[kind] = totals
+            return totals
+
+    def _columns(self, kinds):
+        """Columns that are summed for all of the given kinds"""
+        if kinds == ("windows",):
+            return ElementSums.window_columns
+        for kind in kinds:
+            if kind not in self.outer_kinds:
+                return ElementSums.inner_columns
+        return ElementSums.outer_columns
+
+    def __getitem__(self, kind):
+        try:
+            return self._sums[kind]
+        except KeyError:
+            sums = ElementSums.from_totals(
+                self._kind_totals(kind), self._columns((kind,)))
+            self._sums[kind] = sums
+            return sums
+
+    def concatenate(self, *kinds):
+        """Sums over the concatenated element lists of the given kinds
+
+        Continues the sums of the first kind with the elements of the other
+        kinds.
+
+        """
+        try:
+            return self._sums[kinds]
+        except KeyError:
+            columns = self._columns(kinds)
+            outer = columns is not ElementSums.inner_columns
+            totals = self._kind_totals(kinds[0])
+            for kind in kinds[1:]:
+                totals = sum_elements(
+                    self.elements(kind), outer=outer,
+                    totals=totals[:len(columns)])
+            sums = ElementSums.from_totals(totals, columns)
+            self._sums[kinds] = sums
+            return sums
+
+    def add(self, *kinds):
+        """Sums of the given kinds, added kind by kind"""
+        key = ("+",) + kinds
+        try:
+            return self._sums[key]
+        except KeyError:
+            totals = self._kind_totals(kinds[0])
+            for kind in kinds[1:]:
+                totals = [
+                    a + b for a, b in zip(totals, self._kind_totals(kind))]
+            sums = ElementSums.from_totals(totals, self._columns(kinds))
+            self._sums[key] = sums
+            return sums
+
+
+
+class FacadeIndex(object):
+    """Outer elements of a thermal zone grouped by orientation and tilt
+
+    Walks through the outer elements of the zone once and groups each kind
+    of element by (orientation, tilt), so the facades of a zone can be
+    looked up without scanning the element lists again, see
+    ThermalZone.facade_index().
+
+    Parameters
+    ----------
+
+    thermal_zone : ThermalZone()
+        Thermal zone the elements belong to
+
+    Attributes
+    ----------
+
+    groups : dict
+        Dictionary with one dictionary per kind of element (outer_walls,
+        rooftops, ground_floors, windows, izes_outer), each mapping
+        (orientation, tilt) to the list of elements in list order. izes_outer
+        holds the interzonal elements lumped with the outer elements, as
+        ThermalZone.find_izes_outer()
+
+    """
+
+    kinds = (
+        "outer_walls",
+        "izes_outer",
+        "ground_floors",
+        "rooftops",
+        "windows",
+    )
+
+    def __init__(self, thermal_zone):
+
+        self.groups = {}
+        for kind in self.kinds:
+            if kind == "izes_outer":
+                elements = [
+                    element for element in thermal_zone.interzonal_elements
+                    if element.interzonal_type_export == 'outer_ordered']
+            else:
+                elements = getattr(thermal_zone, kind)
+            groups = {}
+            for element in elements:
+                key = (element.orientation, element.tilt)
+                try:
+                    groups[key].append(element)
+                except KeyError:
+                    groups[key] = [element]
+            self.groups[kind] = groups
+
+    def find(self, kind, orientation, tilt):
+        """Elements of the given kind with orientation and tilt
+
+        Returns the same elements as the find functions of ThermalZone (e.g.
+        find_walls() for outer_walls), an empty list if there are none.
+
+        """
+        return self.groups[kind].get((orientation, tilt), [])
+
+    def tilt_orient(self, *kinds):
+        """Distinct (orientation, tilt) pairs of the given kinds
+
+        The pairs come in the order of list(set(pairs)) over the elements of
+        the kinds, as the facade lists of the models have always been
+        sorted.
+
+        """
+        return list(set(
+            key for kind in kinds for key in self.groups[kind]))
+
+
+def calc_parallel_connection(r1, c1, omega):
+    """Parallel connection of RC branches according to VDI 6007
+
+    Closed form of the pairwise parallel connection of VDI 6007 (equation
+    23, 24): the complex admittances Y = 1 / (R1 + 1 / (j * omega * C1)) of
+    all branches are summed up and the sum is converted back into R1 and
+    C1. The branches are summed along the last axis, so leading axes can
+    hold several zones (or several frequencies) at once. Branches with
+    C1 = 0 have no admittance, which can be used to pad lists of different
+    length.
+
+    Parameters
+    ----------
+
+    r1 : array_like
+        Resistances R1 of the branches in K/W, shape (..., n)
+    c1 : array_like
+        Capacities C1 of the branches in J/K, shape (..., n)
+    omega : float or array_like
+        VDI 6007 frequency in 1/s, broadcastable to shape (...)
+
+    Returns
+    -------
+
+    r1 : float or ndarray [K/W]
+        Resistance of the parallel connection, shape (...)
+    c1 : float or ndarray [J/K]
+        Capacity of the parallel connection, shape (...)
+
+    """
+    r1 = np.asarray(r1, dtype=float)
+    c1 = np.asarray(c1, dtype=float)
+    omega = np.asarray(omega, dtype=float)
+    j_omega_c1 = 1j * omega[..., np.newaxis] * c1
+    admittance = np.sum(j_omega_c1 / (1 + j_omega_c1 * r1), axis=-1)
+    impedance = 1 / admittance
+    r1_total = impedance.real
+    c1_total = -1 / (omega * impedance.imag)
+    if r1_total.ndim == 0:
+        return float(r1_total), float(c1_total)
+    return r1_total, c1_total
+
+
+def as_float(value):
+    """Returns a scalar result as float, arrays are returned unchanged
+
+    Results of calc_parallel_connection() are arrays if the models are
+    calculated for an array of t_bt (see teaser.logic.sweep).
+
+    """
+    if np.ndim(value) == 0:
+        return float(value)
+    return value
+
+
+def parallel_connection(element_list, omega, mode="iw"):
+    """Parallel connection of walls according to VDI 6007
+
+    Collects R1 and C1 of the walls and connects them in parallel with
+    calc_parallel_connection().
+
+    Parameters
+    ----------
+
+    element_list : list
+        List of inner or outer walls, the equivalent resistances need to be
+        calculated beforehand
+    omega : float
+        VDI 6007 frequency
+    mode : str
+        'ow' uses r1 and c1_korr
+        'iw' uses r1 and c1 (function falls back here for other strings)
+        'izw_backwards' uses r2 and c1_korr because heat flow goes towards
+            this thermal zone (instead of away from it) for interzonal
+            elements between heated and unheated zones
+
+    Returns
+    -------
+
+    r1 : float [K/W]
+        VDI 6007 resistance for all inner or outer walls
+    c1 : float [J/K]
+        VDI 6007 capacity for all inner or outer walls
+
+    """
+    if mode == "izw_backwards":
+        r1 = [el.r2 for el in element_list]
+    else:
+        r1 = [el.r1 for el in element_list]
+    if mode == "ow" or mode == "izw_backwards":
+        c1 = [el.c1_korr for el in element_list]
+    else:
+        c1 = [el.c1 for el in element_list]
+    return calc_parallel_connection(r1, c1, omega)
@@ -1,9 +1,8 @@
 """This module includes AixLib calculation class."""
 
 import teaser.logic.utilities as utilities
-from itertools import cycle, islice
 import os
-import pandas as pd
+import numpy as np
 
 
 class AixLib(object):
@@ -135,26 +134,20 @@ class AixLib(object):
         utilities.create_path(path)
         path = os.path.join(path, self.file_set_t_heat)
 
-        export = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="h")
-            .to_series()
-            .dt.strftime("%m-%d %H:%M:%S"),
-            columns=[zone.name for zone in self.parent.thermal_zones],
-        )
-
-        for zone_count in self.parent.thermal_zones:
-            export[zone_count.name] = zone_count.use_conditions.schedules[
-                "heating_profile"
-            ]
+        profiles = [
+            zone.use_conditions.get_profile("heating_profile")
+            for zone in self.parent.thermal_zones
+        ]
+        period = utilities.get_table_period(
+            [profile.period for profile in profiles])
 
-        export.index = [(i + 1) * 3600 for i in range(8760)]
         self._delete_file(path=path)
-        with open(path, "a") as f:
-            f.write("#1\n")
-            f.write(
-                "double Tset({}, {})\n".format(8760, len(self.parent.thermal_zones) + 1)
-            )
-            export.to_csv(f, sep="\t", header=False, index_label=False)
+        utilities.write_table(
+            path=path,
+            table_name="Tset",
+            columns=[np.resize(profile.values, period) for profile in profiles],
+            period=period,
+        )
 
     def modelica_set_temp_cool(self, path=None):
         """Create .txt file for set temperatures cooling.
@@ -177,26 +170,20 @@ class AixLib(object):
         utilities.create_path(path)
         path = os.path.join(path, self.file_set_t_cool)
 
-        export = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="h")
-            .to_series()
-            .dt.strftime("%m-%d %H:%M:%S"),
-            columns=[zone.name for zone in self.parent.thermal_zones],
-        )
+        profiles = [
+            zone.use_conditions.get_profile("cooling_profile")
+            for zone in self.parent.thermal_zones
+        ]
+        period = utilities.get_table_period(
+            [profile.period for profile in profiles])
 
-        for zone_count in self.parent.thermal_zones:
-            export[zone_count.name] = zone_count.use_conditions.schedules[
-                "cooling_profile"
-            ]
-
-        export.index = [(i + 1) * 3600 for i in range(8760)]
         self._delete_file(path=path)
-        with open(path, "a") as f:
-            f.write("#1\n")
-            f.write(
-                "double Tset({}, {})\n".format(8760, len(self.parent.thermal_zones) + 1)
-            )
-            export.to_csv(f, sep="\t", header=False, index_label=False)
+        utilities.write_table(
+            path=path,
+            table_name="Tset",
+            columns=[np.resize(profile.values, period) for profile in profiles],
+            period=period,
+        )
 
     def modelica_AHU_boundary(self, path=None):
         """Create .txt file for AHU boundary conditions (building).
@@ -236,27 +223,43 @@ class AixLib(object):
         path = os.path.join(path, self.file_ahu)
 
         if self.parent.with_ahu is True:
-            export = self.parent.central_ahu.schedules
+            columns = [
+                self.parent.central_ahu.schedules[name].to_numpy()
+                for name in (
+                    "temperature_profile",
+                    "min_relative_humidity_profile",
+                    "max_relative_humidity_profile",
+                    "v_flow_profile",
+                )
+            ]
         else:  # Dummy values for Input Table
-            export = pd.DataFrame(
-                index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="h")
-                .to_series()
-                .dt.strftime("%m-%d %H:%M:%S")
-            )
-
-            export["temperature_profile"] = list(islice(cycle([293.15, 293.15]), 8760))
-            export["min_relative_humidity_profile"] = list(islice(cycle([0, 0]), 8760))
-            export["max_relative_humidity_profile"] = list(islice(cycle([1, 1]), 8760))
-            export["v_flow_profile"] = list(islice(cycle([0, 1]), 8760))
-
-        export.index = [(i + 1) * 3600 for i in range(8760)]
+            columns = [
+                np.resize([293.15, 293.15], 8760),
+                np.resize([0, 0], 8760),
+                np.resize([1, 1], 8760),
+                np.resize([0, 1], 8760),
+            ]
+
+        # AHU profiles of any length are repeated in the schedules, find
+        # the period from the values
+        period = next(
+            (
+                period
+                for period in (24, 168)
+                if all(
+                    np.array_equal(column, np.resize(column[:period], 8760))
+                    for column in columns
+                )
+            ),
+            8760,
+        )
+
         self._delete_file(path=path)
-        with open(path, "a") as f:
-            f.write("#1\n")
-            f.write("double AHU({}, {})\n".format(8760, 5))
-            export.to_csv(f, sep="\t", header=False, index_label=False)
+        utilities.write_table(
+            path=path, table_name="AHU", columns=columns, period=period
+        )
 
-    def modelica_gains_boundary(self, path=None):
+    def modelica_gains_boundary(self, path=None, periodic=True):
         """Create .txt file for internal gains boundary conditions.
 
         This function creates a matfile (-v4) for building internal gains
@@ -278,6 +281,11 @@ class AixLib(object):
         ----------
         path : str
             optional path, when matfile is exported separately
+        periodic : bool
+            If True (default), profiles repeating every 24 h or every week
+            are written as one period, which needs periodic extrapolation of
+            the table in Modelica. If False, the table always holds one year
+            (e.g. for BESMod, whose tables are not part of the templates).
 
         """
         if path is None:
@@ -288,33 +296,24 @@ class AixLib(object):
         utilities.create_path(path)
         path = os.path.join(path, self.file_internal_gains)
 
-        export = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="h")
-            .to_series()
-            .dt.strftime("%m-%d %H:%M:%S")
-        )
-
+        profiles = []
         for zone_count in self.parent.thermal_zones:
-            export[
-                "person_{}".format(zone_count.name)
-            ] = zone_count.use_conditions.schedules["persons_profile"]
-            export[
-                "machines_{}".format(zone_count.name)
-            ] = zone_count.use_conditions.schedules["machines_profile"]
-            export[
-                "lighting_{}".format(zone_count.name)
-            ] = zone_count.use_conditions.schedules["lighting_profile"]
-
-        export.index = [(i + 1) * 3600 for i in range(8760)]
+            profiles += [
+                zone_count.use_conditions.get_profile(name)
+                for name in ("persons_profile", "machines_profile", "lighting_profile")
+            ]
+        if periodic:
+            period = utilities.get_table_period([profile.period for profile in profiles])
+        else:
+            period = 8760
+
         self._delete_file(path=path)
-        with open(path, "a") as f:
-            f.write("#1\n")
-            f.write(
-                "double Internals({}, {})\n".format(
-                    8760, (len(self.parent.thermal_zones) * 3 + 1)
-                )
-            )
-            export.to_csv(f, sep="\t", header=False, index_label=False)
+        utilities.write_table(
+            path=path,
+            table_name="Internals",
+            columns=[np.resize(profile.values, period) for profile in profiles],
+            period=period,
+        )
 
     def _delete_file(self, path):
         """Delete a file before new information is written to it.
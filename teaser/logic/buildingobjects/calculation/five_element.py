@@ -3,8 +3,11 @@
 from __future__ import division
 import math
 import numpy as np
-import random
+import teaser.logic.utilities as utilities
 import warnings
+from teaser.logic.buildingobjects.calculation.aggregation import \
+    ElementCalculation, ElementSums, ZoneAggregator, as_float, \
+    calc_parallel_connection, parallel_connection
 
 
 class FiveElement(object):
@@ -30,6 +33,10 @@ class FiveElement(object):
         supported for IBPSA)
     t_bt : float [d]
         Time constant according to VDI 6007 (default t_bt = 5)
+    element_calculation : ElementCalculation()
+        Calculates the element values, shared with the models of other
+        orders in ThermalZone.calc_zone_parameters(). Default is None, the
+        model calculates the elements on its own
 
     Attributes
     ----------
@@ -364,14 +371,18 @@ class FiveElement(object):
 
     """
 
-    def __init__(self, thermal_zone, merge_windows, t_bt):
+    def __init__(self, thermal_zone, merge_windows, t_bt,
+                 element_calculation=None):
         """Constructor for FourElement"""
 
-        self.internal_id = random.random()
+        self.internal_id = utilities.get_id_allocator(
+            thermal_zone).next_id()
 
         self.thermal_zone = thermal_zone
         self.merge_windows = merge_windows
         self.t_bt = t_bt
+        self._aggregator = None
+        self._element_calculation = element_calculation
 
         # Attributes of inner walls
         self.area_iw = 0.0
@@ -627,31 +638,25 @@ class FiveElement(object):
 
     def calc_attributes(self):
         """Calls all necessary function to calculate model attributes"""
-
-        for out_wall in self.thermal_zone.outer_walls:
-            out_wall.calc_equivalent_res()
-            out_wall.calc_ua_value()
-        for rt in self.thermal_zone.rooftops:
-            rt.calc_equivalent_res()
-            rt.calc_ua_value()
-        for gf in self.thermal_zone.ground_floors:
-            gf.calc_equivalent_res()
-            gf.calc_ua_value()
-        for nzb in self.thermal_zone.interzonal_elements:
-            nzb.calc_equivalent_res()
-            nzb.calc_ua_value()
-        for win in self.thermal_zone.windows:
-            win.calc_equivalent_res()
-            win.calc_ua_value()
-        for inner_wall in (
+        if self._element_calculation is None:
+            self._element_calculation = ElementCalculation()
+        elements = self._element_calculation
+
+        elements.calc_walls(self.thermal_zone.outer_walls)
+        elements.calc_walls(self.thermal_zone.rooftops)
+        elements.calc_walls(self.thermal_zone.ground_floors)
+        elements.calc_walls(self.thermal_zone.interzonal_elements)
+        elements.calc_windows(self.thermal_zone.windows)
+        inner_walls = (
             self.thermal_zone.inner_walls
             + self.thermal_zone.floors
             + self.thermal_zone.ceilings
-        ):
-            inner_wall.calc_equivalent_res()
-            inner_wall.calc_ua_value()
+        )
+        elements.calc_walls(inner_walls)
 
         self.set_calc_default()
+        self._aggregator = ZoneAggregator(
+            self.thermal_zone, self.nzbs_for_iw)
         if len(self.thermal_zone.outer_walls) < 1:
             warnings.warn(
                 "No walls are defined as outer walls for thermal "
@@ -748,6 +753,8 @@ class FiveElement(object):
             )
         self._calc_number_of_elements()
         self._fill_zone_lists()
+        self._aggregator = None
+        self._element_calculation = None
         self._calc_heat_load()
         self.cool_load = -self.heat_load
 
@@ -758,7 +765,8 @@ class FiveElement(object):
         """Parallel connection of walls according to VDI 6007
 
         Calculates the parallel connection of wall elements according to VDI
-        6007, resulting in R1 and C1 (equation 23, 24).
+        6007, resulting in R1 and C1 (equation 23, 24), see
+        aggregation.parallel_connection().
 
         Parameters
         ----------
@@ -781,46 +789,42 @@ class FiveElement(object):
             VDI 6007 capacity all for inner or outer walls
         """
 
-        for wall_count in range(len(element_list) - 1):
+        return parallel_connection(element_list, omega, mode)
 
-            if wall_count == 0:
-                if mode == 'izw_backwards':
-                    r1_before = element_list[wall_count].r2
-                else:
-                    r1_before = element_list[wall_count].r1
-                if mode == 'ow' or mode == 'izw_backwards':
-                    c1_before = element_list[wall_count].c1_korr
-                else:
-                    c1_before = element_list[wall_count].c1
-            else:
-                r1_before = r1
-                c1_before = c1
-            if mode == 'izw_backwards':
-                r1_add = element_list[wall_count + 1].r2
-            else:
-                r1_add = element_list[wall_count + 1].r1
-            if mode == 'ow' or mode == 'izw_backwards':
-                c1_add = element_list[wall_count + 1].c1_korr
-            else:
-                c1_add = element_list[wall_count + 1].c1
-
-            r1 = (r1_before * c1_before ** 2 + r1_add * c1_add ** 2
-                  + omega ** 2 * r1_before * r1_add * (r1_before + r1_add)
-                  * c1_before ** 2 * c1_add ** 2) \
-                 / ((c1_before + c1_add) ** 2
-                    + omega ** 2 * (r1_before + r1_add) ** 2 * c1_before ** 2
-                    * c1_add ** 2)
-
-            c1 = ((c1_before + c1_add) ** 2
-                  + omega ** 2 * (r1_before + r1_add) ** 2 * c1_before ** 2
-                  * c1_add ** 2) \
-                 / (c1_before + c1_add
-                    + omega ** 2
-                    * (r1_before ** 2 * c1_before + r1_add ** 2 * c1_add)
-                    * c1_before
-                    * c1_add)
-
-        return r1, c1
+    def _element_sums(self):
+        """Returns the ZoneAggregator with the element sums of the zone
+
+        Within calc_attributes() all sum functions share one aggregator, so
+        the properties of each kind of element are collected only once.
+        Called on their own, the sum functions collect them anew.
+
+        Returns
+        -------
+        aggregator : ZoneAggregator()
+            Aggregator of the elements of self.thermal_zone
+
+        """
+        if self._aggregator is not None:
+            return self._aggregator
+        return ZoneAggregator(self.thermal_zone, self.nzbs_for_iw)
+
+    def _element_values(self):
+        """Returns the ElementCalculation for the element values of the zone
+
+        Within calc_attributes() the equivalent resistances and UA-values of
+        each element are calculated only once (together with the models of
+        other orders, if the ElementCalculation is shared). Called on their
+        own, the calculation functions calculate them anew.
+
+        Returns
+        -------
+        element_calculation : ElementCalculation()
+            Element calculation of self.thermal_zone
+
+        """
+        if self._element_calculation is not None:
+            return self._element_calculation
+        return ElementCalculation()
 
     def _sum_outer_wall_elements(self):
         """Sum attributes for outer wall elements
@@ -833,35 +837,22 @@ class FiveElement(object):
         as one kind of wall type.
 
         """
+        ow = self._element_sums()["outer_walls"]
 
-        self.area_ow = sum(out_wall.area for out_wall in self.thermal_zone.outer_walls)
+        self.area_ow = ow.area
 
-        self.ua_value_ow = sum(
-            out_wall.ua_value for out_wall in self.thermal_zone.outer_walls
-        )
+        self.ua_value_ow = ow.ua_value
 
         self.r_total_ow = 1 / self.ua_value_ow
 
         # values facing the inside of the thermal zone
 
-        self.r_conv_inner_ow = 1 / (
-            sum(1 / out_wall.r_inner_conv for out_wall in self.thermal_zone.outer_walls)
-        )
+        self.r_conv_inner_ow = ow.parallel("r_inner_conv")
+        self.r_rad_inner_ow = ow.parallel("r_inner_rad")
+        self.r_comb_inner_ow = ow.parallel("r_inner_comb")
 
-        self.r_rad_inner_ow = 1 / (
-            sum(1 / out_wall.r_inner_rad for out_wall in self.thermal_zone.outer_walls)
-        )
-
-        self.r_comb_inner_ow = 1 / (
-            sum(1 / out_wall.r_inner_comb for out_wall in self.thermal_zone.outer_walls)
-        )
-
-        self.ir_emissivity_inner_ow = (
-            sum(
-                out_wall.layer[0].material.ir_emissivity * out_wall.area
-                for out_wall in self.thermal_zone.outer_walls
-            )
-        ) / self.area_ow
+        self.ir_emissivity_inner_ow = ow.area_weighted(
+            "ir_emissivity_inner")
 
         self.alpha_conv_inner_ow = 1 / (self.r_conv_inner_ow * self.area_ow)
         self.alpha_rad_inner_ow = 1 / (self.r_rad_inner_ow * self.area_ow)
@@ -870,33 +861,12 @@ class FiveElement(object):
         # values facing the ambient
         # ground floor does not have any coefficients on ambient side
 
-        self.r_conv_outer_ow = 1 / (
-            sum(1 / out_wall.r_outer_conv for out_wall in self.thermal_zone.outer_walls)
-        )
-        self.r_rad_outer_ow = 1 / (
-            sum(1 / out_wall.r_outer_rad for out_wall in self.thermal_zone.outer_walls)
-        )
-        self.r_comb_outer_ow = 1 / (
-            sum(1 / out_wall.r_outer_comb for out_wall in self.thermal_zone.outer_walls)
-        )
-
-        self.ir_emissivity_outer_ow = (
-            (
-                sum(
-                    out_wall.layer[-1].material.ir_emissivity * out_wall.area
-                    for out_wall in self.thermal_zone.outer_walls
-                )
-            )
-        ) / self.area_ow
+        self.r_conv_outer_ow = ow.parallel("r_outer_conv")
+        self.r_rad_outer_ow = ow.parallel("r_outer_rad")
+        self.r_comb_outer_ow = ow.parallel("r_outer_comb")
 
-        self.solar_absorp_ow = (
-            (
-                sum(
-                    out_wall.layer[-1].material.solar_absorp * out_wall.area
-                    for out_wall in self.thermal_zone.outer_walls
-                )
-            )
-        ) / self.area_ow
+        self.ir_emissivity_outer_ow = ow.area_weighted("ir_emissivity_outer")
+        self.solar_absorp_ow = ow.area_weighted("solar_absorp")
 
         self.alpha_conv_outer_ow = 1 / (self.r_conv_outer_ow * self.area_ow)
         self.alpha_rad_outer_ow = 1 / (self.r_rad_outer_ow * self.area_ow)
@@ -910,36 +880,22 @@ class FiveElement(object):
         transfer, resistances, areas and UA-Values.
 
         """
+        gf = self._element_sums()["ground_floors"]
 
-        self.area_gf = sum(ground.area for ground in self.thermal_zone.ground_floors)
+        self.area_gf = gf.area
 
-        self.ua_value_gf = sum(
-            ground.ua_value for ground in self.thermal_zone.ground_floors
-        )
+        self.ua_value_gf = gf.ua_value
 
         self.r_total_gf = 1 / self.ua_value_gf
 
         # values facing the inside of the thermal zone
 
-        self.r_conv_inner_gf = 1 / sum(
-            1 / ground.r_inner_conv for ground in self.thermal_zone.ground_floors
-        )
+        self.r_conv_inner_gf = gf.parallel("r_inner_conv")
+        self.r_rad_inner_gf = gf.parallel("r_inner_rad")
+        self.r_comb_inner_gf = gf.parallel("r_inner_comb")
 
-        self.r_rad_inner_gf = 1 / sum(
-            1 / ground.r_inner_rad for ground in self.thermal_zone.ground_floors
-        )
-
-        self.r_comb_inner_gf = 1 / sum(
-            1 / ground.r_inner_comb for ground in self.thermal_zone.ground_floors
-        )
-
-        self.ir_emissivity_inner_gf = (
-            sum(
-                ground.layer[0].material.ir_emissivity * ground.area
-                for ground in self.thermal_zone.ground_floors
-            )
-            / self.area_gf
-        )
+        self.ir_emissivity_inner_gf = gf.area_weighted(
+            "ir_emissivity_inner")
 
         self.alpha_conv_inner_gf = 1 / (self.r_conv_inner_gf * self.area_gf)
         self.alpha_rad_inner_gf = 1 / (self.r_rad_inner_gf * self.area_gf)
@@ -956,34 +912,22 @@ class FiveElement(object):
         as one kind of wall type.
 
         """
+        rt = self._element_sums()["rooftops"]
 
-        self.area_rt = sum(roof.area for roof in self.thermal_zone.rooftops)
+        self.area_rt = rt.area
 
-        self.ua_value_rt = sum(roof.ua_value for roof in self.thermal_zone.rooftops)
+        self.ua_value_rt = rt.ua_value
 
         self.r_total_rt = 1 / self.ua_value_rt
 
         # values facing the inside of the thermal zone
 
-        self.r_conv_inner_rt = 1 / sum(
-            1 / roof.r_inner_conv for roof in self.thermal_zone.rooftops
-        )
-
-        self.r_rad_inner_rt = 1 / sum(
-            1 / roof.r_inner_rad for roof in self.thermal_zone.rooftops
-        )
-
-        self.r_comb_inner_rt = 1 / sum(
-            1 / roof.r_inner_comb for roof in self.thermal_zone.rooftops
-        )
+        self.r_conv_inner_rt = rt.parallel("r_inner_conv")
+        self.r_rad_inner_rt = rt.parallel("r_inner_rad")
+        self.r_comb_inner_rt = rt.parallel("r_inner_comb")
 
-        self.ir_emissivity_inner_rt = (
-            sum(
-                roof.layer[0].material.ir_emissivity * roof.area
-                for roof in self.thermal_zone.rooftops
-            )
-            / self.area_rt
-        )
+        self.ir_emissivity_inner_rt = rt.area_weighted(
+            "ir_emissivity_inner")
 
         self.alpha_conv_inner_rt = 1 / (self.r_conv_inner_rt * self.area_rt)
         self.alpha_rad_inner_rt = 1 / (self.r_rad_inner_rt * self.area_rt)
@@ -992,31 +936,12 @@ class FiveElement(object):
         # values facing the ambient
         # ground floor does not have any coefficients on ambient side
 
-        self.r_conv_outer_rt = 1 / sum(
-            1 / roof.r_outer_conv for roof in self.thermal_zone.rooftops
-        )
-        self.r_rad_outer_rt = 1 / sum(
-            1 / roof.r_outer_rad for roof in self.thermal_zone.rooftops
-        )
-        self.r_comb_outer_rt = 1 / sum(
-            1 / roof.r_outer_comb for roof in self.thermal_zone.rooftops
-        )
+        self.r_conv_outer_rt = rt.parallel("r_outer_conv")
+        self.r_rad_outer_rt = rt.parallel("r_outer_rad")
+        self.r_comb_outer_rt = rt.parallel("r_outer_comb")
 
-        self.ir_emissivity_outer_rt = (
-            sum(
-                roof.layer[-1].material.ir_emissivity * roof.area
-                for roof in self.thermal_zone.rooftops
-            )
-            / self.area_rt
-        )
-
-        self.solar_absorp_rt = (
-            sum(
-                roof.layer[-1].material.solar_absorp * roof.area
-                for roof in self.thermal_zone.rooftops
-            )
-            / self.area_rt
-        )
+        self.ir_emissivity_outer_rt = rt.area_weighted("ir_emissivity_outer")
+        self.solar_absorp_rt = rt.area_weighted("solar_absorp")
 
         self.alpha_conv_outer_rt = 1 / (self.r_conv_outer_rt * self.area_rt)
         self.alpha_rad_outer_rt = 1 / (self.r_rad_outer_rt * self.area_rt)
@@ -1037,61 +962,21 @@ class FiveElement(object):
         currently not supported.
 
         """
-        self.area_iw = (
-            sum(in_wall.area for in_wall in self.thermal_zone.inner_walls)
-            + sum(floor.area for floor in self.thermal_zone.floors)
-            + sum(ceiling.area for ceiling in self.thermal_zone.ceilings)
-            + sum(nzb.area for nzb in self.nzbs_for_iw)
-        )
+        iw = self._element_sums().add(
+            "inner_walls", "floors", "ceilings", "nzbs_for_iw")
 
-        self.ua_value_iw = (
-            sum(in_wall.ua_value for in_wall in self.thermal_zone.inner_walls)
-            + sum(floor.ua_value for floor in self.thermal_zone.floors)
-            + sum(ceiling.ua_value for ceiling in self.thermal_zone.ceilings)
-            + sum(nzb.ua_value for nzb in self.nzbs_for_iw)
-        )
-
-        # values facing the inside of the thermal zone
+        self.area_iw = iw.area
 
-        self.r_conv_inner_iw = 1 / (
-            sum(1 / in_wall.r_inner_conv for in_wall in self.thermal_zone.inner_walls)
-            + sum(1 / floor.r_inner_conv for floor in self.thermal_zone.floors)
-            + sum(1 / ceiling.r_inner_conv for ceiling in self.thermal_zone.ceilings)
-            + sum(1 / nzb.r_inner_conv for nzb in self.nzbs_for_iw)
-        )
+        self.ua_value_iw = iw.ua_value
 
-        self.r_rad_inner_iw = 1 / (
-            sum(1 / in_wall.r_inner_rad for in_wall in self.thermal_zone.inner_walls)
-            + sum(1 / floor.r_inner_rad for floor in self.thermal_zone.floors)
-            + sum(1 / ceiling.r_inner_rad for ceiling in self.thermal_zone.ceilings)
-            + sum(1 / nzb.r_inner_rad for nzb in self.nzbs_for_iw)
-        )
+        # values facing the inside of the thermal zone
 
-        self.r_comb_inner_iw = 1 / (
-            sum(1 / in_wall.r_inner_comb for in_wall in self.thermal_zone.inner_walls)
-            + sum(1 / floor.r_inner_comb for floor in self.thermal_zone.floors)
-            + sum(1 / ceiling.r_inner_comb for ceiling in self.thermal_zone.ceilings)
-            + sum(1 / nzb.r_inner_comb for nzb in self.nzbs_for_iw)
-        )
+        self.r_conv_inner_iw = iw.parallel("r_inner_conv")
+        self.r_rad_inner_iw = iw.parallel("r_inner_rad")
+        self.r_comb_inner_iw = iw.parallel("r_inner_comb")
 
-        self.ir_emissivity_inner_iw = (
-            sum(
-                in_wall.layer[0].material.ir_emissivity * in_wall.area
-                for in_wall in self.thermal_zone.inner_walls
-            )
-            + sum(
-                floor.layer[0].material.ir_emissivity * floor.area
-                for floor in self.thermal_zone.floors
-            )
-            + sum(
-                ceiling.layer[0].material.ir_emissivity * ceiling.area
-                for ceiling in self.thermal_zone.ceilings
-            )
-            + sum(
-                nzb.layer[0].material.ir_emissivity * nzb.area
-                for nzb in self.nzbs_for_iw
-            )
-        ) / self.area_iw
+        self.ir_emissivity_inner_iw = iw.area_weighted(
+            "ir_emissivity_inner")
 
         self.alpha_conv_inner_iw = 1 / (self.r_conv_inner_iw * self.area_iw)
         self.alpha_rad_inner_iw = 1 / (self.r_rad_inner_iw * self.area_iw)
@@ -1107,75 +992,35 @@ class FiveElement(object):
         Function is identical for TwoElement, ThreeElement, FourElement and
         FiveElement.
         """
+        win = self._element_sums()["windows"]
 
-        self.area_win = sum(win.area for win in self.thermal_zone.windows)
-        self.ua_value_win = sum(win.ua_value for win in self.thermal_zone.windows)
+        self.area_win = win.area
+        self.ua_value_win = win.ua_value
         self.u_value_win = self.ua_value_win / self.area_win
 
         # values facing the inside of the thermal zone
 
-        self.r_conv_inner_win = 1 / (
-            sum(1 / win.r_inner_conv for win in self.thermal_zone.windows)
-        )
-
-        self.r_rad_inner_win = 1 / (
-            sum(1 / win.r_inner_rad for win in self.thermal_zone.windows)
-        )
+        self.r_conv_inner_win = win.parallel("r_inner_conv")
+        self.r_rad_inner_win = win.parallel("r_inner_rad")
+        self.r_comb_inner_win = win.parallel("r_inner_comb")
 
-        self.r_comb_inner_win = 1 / (
-            sum(1 / win.r_inner_comb for win in self.thermal_zone.windows)
-        )
-
-        self.ir_emissivity_inner_win = (
-            sum(
-                win.layer[0].material.ir_emissivity * win.area
-                for win in self.thermal_zone.windows
-            )
-            / self.area_win
-        )
+        self.ir_emissivity_inner_win = win.area_weighted(
+            "ir_emissivity_inner")
 
         self.alpha_conv_inner_win = 1 / (self.r_conv_inner_win * self.area_win)
         self.alpha_rad_inner_win = 1 / (self.r_rad_inner_win * self.area_win)
         self.alpha_comb_inner_win = 1 / (self.r_comb_inner_win * self.area_win)
-        self.ratio_conv_rad_inner_win = (
-            sum(win.a_conv * win.area for win in self.thermal_zone.windows)
-            / self.area_win
-        )
+        self.ratio_conv_rad_inner_win = win.area_weighted("a_conv")
 
         # values facing the ambient
 
-        self.r_conv_outer_win = 1 / (
-            sum(1 / win.r_outer_conv for win in self.thermal_zone.windows)
-        )
-
-        self.r_rad_outer_win = 1 / (
-            sum(1 / win.r_outer_rad for win in self.thermal_zone.windows)
-        )
-
-        self.r_comb_outer_win = 1 / (
-            sum(1 / win.r_outer_comb for win in self.thermal_zone.windows)
-        )
+        self.r_conv_outer_win = win.parallel("r_outer_conv")
+        self.r_rad_outer_win = win.parallel("r_outer_rad")
+        self.r_comb_outer_win = win.parallel("r_outer_comb")
 
-        self.ir_emissivity_win = (
-            sum(
-                win.layer[-1].material.ir_emissivity * win.area
-                for win in self.thermal_zone.windows
-            )
-            / self.area_win
-        )
-
-        self.solar_absorp_win = (
-            sum(
-                win.layer[-1].material.solar_absorp * win.area
-                for win in self.thermal_zone.windows
-            )
-            / self.area_win
-        )
-
-        self.weighted_g_value = (
-            sum(win.g_value * win.area for win in self.thermal_zone.windows)
-            / self.area_win
-        )
+        self.ir_emissivity_win = win.area_weighted("ir_emissivity_outer")
+        self.solar_absorp_win = win.area_weighted("solar_absorp")
+        self.weighted_g_value = win.area_weighted("g_value")
 
         self.alpha_conv_outer_win = 1 / (self.r_conv_outer_win * self.area_win)
         self.alpha_rad_outer_win = 1 / (self.r_rad_outer_win * self.area_win)
@@ -1189,8 +1034,9 @@ class FiveElement(object):
         transfer, resistances, areas and UA-Values.
 
         """
+        nz_borders = self.thermal_zone.find_izes_outer(add_reversed=True)
         other_nz_indexes = set()
-        for nz_border in self.thermal_zone.find_izes_outer(add_reversed=True):
+        for nz_border in nz_borders:
             other_nz_indexes.add(self.thermal_zone.parent.thermal_zones.index(
                 nz_border.other_side
             ))
@@ -1199,33 +1045,30 @@ class FiveElement(object):
         for nz_index in self.other_nz_indexes:
             other_nz = self.thermal_zone.parent.thermal_zones[nz_index]
             self.nzbs_per_nz.append([])
-            for nz_border \
-                    in self.thermal_zone.find_izes_outer(add_reversed=True):
+            for nz_border in nz_borders:
                 if nz_border.other_side is other_nz:
                     self.nzbs_per_nz[-1].append(nz_border)
                     nz_border.idx_orientation = nz_index
 
-        self.area_nzb = _lump_sum(self.nzbs_per_nz, 'area')
+        nzb_sums = [ElementSums(nzbs) for nzbs in self.nzbs_per_nz]
 
-        self.ua_value_nzb = _lump_sum(self.nzbs_per_nz, 'ua_value')
+        self.area_nzb = [nzb.area for nzb in nzb_sums]
+
+        self.ua_value_nzb = [nzb.ua_value for nzb in nzb_sums]
 
         self.r_total_nzb = [1 / ua for ua in self.ua_value_nzb]
 
         # values facing the inside of the thermal zone
 
-        self.r_conv_inner_nzb = _lump_inverse_sum(self.nzbs_per_nz,
-                                                  'r_inner_conv')
-
-        self.r_rad_inner_nzb = _lump_inverse_sum(self.nzbs_per_nz,
-                                                 'r_inner_rad')
-
-        self.r_comb_inner_nzb = _lump_inverse_sum(self.nzbs_per_nz,
-                                                  'r_inner_comb')
+        self.r_conv_inner_nzb = [
+            nzb.parallel("r_inner_conv") for nzb in nzb_sums]
+        self.r_rad_inner_nzb = [
+            nzb.parallel("r_inner_rad") for nzb in nzb_sums]
+        self.r_comb_inner_nzb = [
+            nzb.parallel("r_inner_comb") for nzb in nzb_sums]
 
         self.ir_emissivity_inner_nzb = [
-            sum(el.layer[0].material.ir_emissivity * el.area for el in els) / a
-            for els, a in zip(self.nzbs_per_nz, self.area_nzb)
-        ]
+            nzb.area_weighted("ir_emissivity_inner") for nzb in nzb_sums]
 
         self.alpha_conv_inner_nzb = [
             1 / (rci * a)
@@ -1242,17 +1085,15 @@ class FiveElement(object):
 
         # values facing the other zone
 
-        self.r_conv_outer_nzb = _lump_inverse_sum(self.nzbs_per_nz,
-                                                  'r_outer_conv')
-        self.r_rad_outer_nzb = _lump_inverse_sum(self.nzbs_per_nz,
-                                                 'r_outer_rad')
-        self.r_comb_outer_nzb = _lump_inverse_sum(self.nzbs_per_nz,
-                                                  'r_outer_comb')
+        self.r_conv_outer_nzb = [
+            nzb.parallel("r_outer_conv") for nzb in nzb_sums]
+        self.r_rad_outer_nzb = [
+            nzb.parallel("r_outer_rad") for nzb in nzb_sums]
+        self.r_comb_outer_nzb = [
+            nzb.parallel("r_outer_comb") for nzb in nzb_sums]
 
         self.ir_emissivity_outer_nzb = [
-            sum(el.layer[-1].material.ir_emissivity * el.area for el in els) / a
-            for els, a in zip(self.nzbs_per_nz, self.area_nzb)
-        ]
+            nzb.area_weighted("ir_emissivity_outer") for nzb in nzb_sums]
 
         self.alpha_conv_outer_nzb = [
             1 / (rco * a)
@@ -1284,12 +1125,7 @@ class FiveElement(object):
 
         outer_walls = self.thermal_zone.outer_walls
 
-        if 0 < len(outer_walls) <= 1:
-            # only one outer wall, no need to calculate chain matrix
-            self.r1_ow = outer_walls[0].r1
-            self.c1_ow = outer_walls[0].c1_korr
-        elif len(outer_walls) > 1:
-            # more than one outer wall, calculate chain matrix
+        if len(outer_walls) > 0:
             self.r1_ow, self.c1_ow = self._calc_parallel_connection(
                 outer_walls, omega, mode='ow'
             )
@@ -1382,12 +1218,7 @@ class FiveElement(object):
         """
         omega = 2 * math.pi / 86400 / self.t_bt
 
-        if 0 < len(self.thermal_zone.ground_floors) <= 1:
-            # only one outer wall, no need to calculate chain matrix
-            self.r1_gf = self.thermal_zone.ground_floors[0].r1
-            self.c1_gf = self.thermal_zone.ground_floors[0].c1_korr
-        elif len(self.thermal_zone.ground_floors) > 1:
-            # more than one outer wall, calculate chain matrix
+        if len(self.thermal_zone.ground_floors) > 0:
             self.r1_gf, self.c1_gf = self._calc_parallel_connection(
                 self.thermal_zone.ground_floors, omega, mode='ow'
             )
@@ -1424,12 +1255,7 @@ class FiveElement(object):
 
         omega = 2 * math.pi / 86400 / self.t_bt
 
-        if 0 < len(self.thermal_zone.rooftops) <= 1:
-            # only one outer wall, no need to calculate chain matrix
-            self.r1_rt = self.thermal_zone.rooftops[0].r1
-            self.c1_rt = self.thermal_zone.rooftops[0].c1_korr
-        elif len(self.thermal_zone.rooftops) > 1:
-            # more than one outer wall, calculate chain matrix
+        if len(self.thermal_zone.rooftops) > 0:
             self.r1_rt, self.c1_rt = self._calc_parallel_connection(
                 self.thermal_zone.rooftops, omega, mode='ow'
             )
@@ -1472,9 +1298,7 @@ class FiveElement(object):
             + self.thermal_zone.ceilings
         )
 
-        for in_wall in inner_walls:
-            in_wall.calc_equivalent_res()
-            in_wall.calc_ua_value()
+        self._element_values().calc_walls(inner_walls)
 
         if 0 < len(inner_walls) <= 1:
             # only one inner wall, no need to calculate chain matrix
@@ -1506,37 +1330,40 @@ class FiveElement(object):
 
         omega = 2 * math.pi / 86400 / self.t_bt
 
-        any_nzb = False
         self.r1_nzb = []
         self.c1_nzb = []
-        for nz_borders in self.nzbs_per_nz:
-            if 0 < len(nz_borders) <= 1:
-                # only one nz border, no need to calculate chain matrix
-                self.c1_nzb.append(nz_borders[0].c1_korr)
-                conduction = nz_borders[0].r_conduc
-                if nz_borders[0].interzonal_type_export == 'outer_reversed':
-                    self.r_rest_nzb.append(nz_borders[0].r2)
-                    self.r1_nzb.append(conduction - self.r_rest_nzb[-1])
-                else:
-                    self.r1_nzb.append(nz_borders[0].r1)
-                    self.r_rest_nzb.append(conduction - self.r1_nzb[-1])
-            elif len(nz_borders) > 1:
-                # more than one nz border, calculate chain matrix
-                if nz_borders[0].interzonal_type_export == 'outer_reversed':
-                    parallel_mode = 'izw_backwards'
-                else:
-                    parallel_mode = 'ow'
-                r1_nzb, c1_nzb = self._calc_parallel_connection(
-                    nz_borders, omega, mode=parallel_mode
-                )
-                conduction = 1 / sum(1 / nzb.r_conduc for nzb in nz_borders)
-                if nz_borders[0].interzonal_type_export == 'outer_reversed':
-                    self.r_rest_nzb.append(r1_nzb)
-                    self.r1_nzb.append(conduction - self.r_rest_nzb[-1])
-                else:
-                    self.r1_nzb.append(r1_nzb)
-                    self.r_rest_nzb.append(conduction - self.r1_nzb[-1])
-                self.c1_nzb.append(c1_nzb)
+        nzbs_per_nz = [nzbs for nzbs in self.nzbs_per_nz if len(nzbs) > 0]
+        if not nzbs_per_nz:
+            return
+        # all neighboured zones in one parallel connection, shorter lists
+        # are padded with branches without capacity (no admittance)
+        r1 = np.zeros((len(nzbs_per_nz), max(map(len, nzbs_per_nz))))
+        c1 = np.zeros_like(r1)
+        for i, nz_borders in enumerate(nzbs_per_nz):
+            # heat flows towards this zone for reversed borders to unheated
+            # zones, so r2 is used instead of r1
+            if nz_borders[0].interzonal_type_export == 'outer_reversed':
+                r1[i, :len(nz_borders)] = [nzb.r2 for nzb in nz_borders]
+            else:
+                r1[i, :len(nz_borders)] = [nzb.r1 for nzb in nz_borders]
+            c1[i, :len(nz_borders)] = [nzb.c1_korr for nzb in nz_borders]
+        # neighboured zones on the last axis, an array of t_bt (see
+        # teaser.logic.sweep) on the axis in front of it
+        r1_par, c1_par = calc_parallel_connection(
+            r1, c1, np.asarray(omega)[..., np.newaxis])
+
+        for nz_borders, r1_nzb, c1_nzb in zip(
+                nzbs_per_nz,
+                np.moveaxis(r1_par, -1, 0),
+                np.moveaxis(c1_par, -1, 0)):
+            conduction = 1 / sum(1 / nzb.r_conduc for nzb in nz_borders)
+            if nz_borders[0].interzonal_type_export == 'outer_reversed':
+                self.r_rest_nzb.append(as_float(r1_nzb))
+                self.r1_nzb.append(conduction - self.r_rest_nzb[-1])
+            else:
+                self.r1_nzb.append(as_float(r1_nzb))
+                self.r_rest_nzb.append(conduction - self.r1_nzb[-1])
+            self.c1_nzb.append(as_float(c1_nzb))
 
     def _calc_wf(self):
         """Weightfactors for outer elements(walls, roof, ground floor, windows)
@@ -1623,16 +1450,12 @@ class FiveElement(object):
         elements and then creates lists for zone weightfactors, orientation,
         tilt, ares and sunblinds."""
 
-        outer_elements = self.thermal_zone.outer_walls + self.thermal_zone.windows
-
-        tilt_orient = []
-        for element in outer_elements:
-            tilt_orient.append((element.orientation, element.tilt))
-        tilt_orient = list(set(tilt_orient))
+        facades = self._element_sums().facades
+        tilt_orient = facades.tilt_orient("outer_walls", "windows")
 
         for i in tilt_orient:
-            walls = self.thermal_zone.find_walls(i[0], i[1])
-            wins = self.thermal_zone.find_wins(i[0], i[1])
+            walls = facades.find("outer_walls", i[0], i[1])
+            wins = facades.find("windows", i[0], i[1])
 
             if self.merge_windows is True:
                 self.facade_areas.append(
@@ -1658,19 +1481,20 @@ class FiveElement(object):
                 self.transparent_areas.append(0.0)
                 self.shading_max_irr.append(9999.9)
             else:
+                win_area = sum([win.area for win in wins])
                 self.weightfactor_win.append(sum([win.wf_out for win in wins]))
 
                 if self.merge_windows is False:
-                    self.window_areas.append(sum([win.area for win in wins]))
-                    self.transparent_areas.append(sum([win.area for win in wins]))
+                    self.window_areas.append(win_area)
+                    self.transparent_areas.append(win_area)
 
                 else:
                     self.window_areas.append(0)
-                    self.transparent_areas.append(sum([win.area for win in wins]))
+                    self.transparent_areas.append(win_area)
                 self.shading_g_total.append(
                     sum(
                         [
-                            win.shading_g_total * win.area / sum([w.area for w in wins])
+                            win.shading_g_total * win.area / win_area
                             for win in wins
                         ]
                     )
@@ -1678,19 +1502,16 @@ class FiveElement(object):
                 self.shading_max_irr.append(
                     sum(
                         [
-                            win.shading_max_irr * win.area / sum([w.area for w in wins])
+                            win.shading_max_irr * win.area / win_area
                             for win in wins
                         ]
                     )
                 )
 
-        tilt_orient_rt = []
-        for roof in self.thermal_zone.rooftops:
-            tilt_orient_rt.append((roof.orientation, roof.tilt))
-        tilt_orient_rt = list(set(tilt_orient_rt))
+        tilt_orient_rt = facades.tilt_orient("rooftops")
 
         for i in tilt_orient_rt:
-            rts = self.thermal_zone.find_rts(i[0], i[1])
+            rts = facades.find("rooftops", i[0], i[1])
 
             self.orientation_rt.append(i[0])
             self.tilt_rt.append(i[1])
@@ -2015,40 +1836,3 @@ class FiveElement(object):
                 pass
         return elements
 
-
-def _lump_sum(elements, parameter):
-    """calculates sums of the parameter of 2nd-level entries in a 2-level list
-
-    Parameters
-    ----------
-    elements : list
-        list of lists with building elements
-    parameter : str
-        parameter to lump
-
-    Returns
-    -------
-    lumped_sum : list
-        list of sums for each sub-list of elements
-    """
-    return [sum(eval('el.{}'.format(parameter)) for el in els)
-            for els in elements]
-
-
-def _lump_inverse_sum(elements, parameter):
-    """inverse sums of the parameter of 2nd-level entries in a 2-level list
-
-    Parameters
-    ----------
-    elements : list
-        list of lists with building elements
-    parameter : str
-        parameter to lump
-
-    Returns
-    -------
-    lumped_sum : list
-        list of sums of inverse entries for each sub-list of elements
-    """
-    return [1 / sum(1 / eval('el.{}'.format(parameter)) for el in els)
-            for els in elements]
@@ -2,8 +2,10 @@
 
 from __future__ import division
 import math
-import random
+import teaser.logic.utilities as utilities
 import warnings
+from teaser.logic.buildingobjects.calculation.aggregation import \
+    ElementCalculation, ZoneAggregator, parallel_connection
 
 
 class FourElement(object):
@@ -36,6 +38,10 @@ class FourElement(object):
         Time constant according to VDI 6007 (default t_bt = 5)
     t_bt_layer : float [d]
         Time constant according to VDI 6007 for aggragation of layers (default t_bt = 7)
+    element_calculation : ElementCalculation()
+        Calculates the element values, shared with the models of other
+        orders in ThermalZone.calc_zone_parameters(). Default is None, the
+        model calculates the elements on its own
 
     Attributes
     ----------
@@ -382,15 +388,19 @@ class FourElement(object):
 
     """
 
-    def __init__(self, thermal_zone, merge_windows, t_bt, t_bt_layer=7):
+    def __init__(self, thermal_zone, merge_windows, t_bt, t_bt_layer=7,
+                 element_calculation=None):
         """Constructor for FourElement"""
 
-        self.internal_id = random.random()
+        self.internal_id = utilities.get_id_allocator(
+            thermal_zone).next_id()
 
         self.thermal_zone = thermal_zone
         self.merge_windows = merge_windows
         self.t_bt = t_bt
         self.t_bt_layer = t_bt_layer
+        self._aggregator = None
+        self._element_calculation = element_calculation
 
         # Attributes of inner walls
         self.area_iw = 0.0
@@ -597,29 +607,30 @@ class FourElement(object):
 
     def calc_attributes(self):
         """Calls all necessary function to calculate model attributes"""
-        for out_wall in self.thermal_zone.outer_walls + self.thermal_zone.find_izes_outer():
-            out_wall.calc_equivalent_res(t_bt=self.t_bt_layer)
-            out_wall.calc_ua_value()
-        for rt in self.thermal_zone.rooftops:
-            rt.calc_equivalent_res(t_bt=self.t_bt_layer)
-            rt.calc_ua_value()
-        for gf in self.thermal_zone.ground_floors:
-            gf.calc_equivalent_res(t_bt=self.t_bt_layer)
-            gf.calc_ua_value()
-        for win in self.thermal_zone.windows:
-            win.calc_equivalent_res()
-            win.calc_ua_value()
-        for inner_wall in (
+        if self._element_calculation is None:
+            self._element_calculation = ElementCalculation()
+        elements = self._element_calculation
+        outer_walls = (
+                self.thermal_zone.outer_walls
+                + self.thermal_zone.find_izes_outer()
+        )
+        elements.calc_walls(outer_walls, t_bt=self.t_bt_layer)
+        elements.calc_walls(self.thermal_zone.rooftops, t_bt=self.t_bt_layer)
+        elements.calc_walls(
+            self.thermal_zone.ground_floors, t_bt=self.t_bt_layer)
+        elements.calc_windows(self.thermal_zone.windows)
+        inner_walls = (
                 self.thermal_zone.inner_walls
                 + self.thermal_zone.floors
                 + self.thermal_zone.ceilings
                 + self.nzbs_for_iw
-        ):
-            inner_wall.calc_equivalent_res()
-            inner_wall.calc_ua_value()
+        )
+        elements.calc_walls(inner_walls)
 
         self.set_calc_default()
-        if len(self.thermal_zone.outer_walls + self.thermal_zone.find_izes_outer()) < 1:
+        self._aggregator = ZoneAggregator(
+            self.thermal_zone, self.nzbs_for_iw)
+        if len(outer_walls) < 1:
             warnings.warn(
                 "No walls are defined as outer walls for thermal "
                 + "zone "
@@ -703,6 +714,8 @@ class FourElement(object):
             )
         self._calc_number_of_elements()
         self._fill_zone_lists()
+        self._aggregator = None
+        self._element_calculation = None
         self._calc_heat_load()
         self.cool_load = -self.heat_load
 
@@ -713,7 +726,8 @@ class FourElement(object):
         """Parallel connection of walls according to VDI 6007
 
         Calculates the parallel connection of wall elements according to VDI
-        6007, resulting in R1 and C1 (equation 23, 24).
+        6007, resulting in R1 and C1 (equation 23, 24), see
+        aggregation.parallel_connection().
 
         Parameters
         ----------
@@ -733,45 +747,42 @@ class FourElement(object):
             VDI 6007 capacity all for inner or outer walls
         """
 
-        for wall_count in range(len(element_list) - 1):
+        return parallel_connection(element_list, omega, mode)
 
-            if wall_count == 0:
-                r1_before = element_list[wall_count].r1
-                if mode == 'ow':
-                    c1_before = element_list[wall_count].c1_korr
-                else:
-                    c1_before = element_list[wall_count].c1
-            else:
-                r1_before = r1
-                c1_before = c1
-            r1_add = element_list[wall_count + 1].r1
-            if mode == 'ow':
-                c1_add = element_list[wall_count + 1].c1_korr
-            else:
-                c1_add = element_list[wall_count + 1].c1
-
-            r1 = (
-                r1_before * c1_before ** 2 + r1_add * c1_add ** 2
-                + omega ** 2 * r1_before * r1_add * (r1_before + r1_add)
-                * c1_before ** 2 * c1_add ** 2
-            ) / (
-                (c1_before + c1_add) ** 2
-                + omega ** 2 * (r1_before + r1_add) ** 2 * c1_before ** 2
-                * c1_add ** 2
-            )
+    def _element_sums(self):
+        """Returns the ZoneAggregator with the element sums of the zone
 
-            c1 = (
-                (c1_before + c1_add) ** 2
-                + omega ** 2 * (r1_before + r1_add) ** 2 * c1_before ** 2
-                * c1_add ** 2
-            ) / (
-                c1_before + c1_add
-                + omega ** 2
-                * (r1_before ** 2 * c1_before + r1_add ** 2 * c1_add)
-                * c1_before * c1_add
-            )
+        Within calc_attributes() all sum functions share one aggregator, so
+        the properties of each kind of element are collected only once.
+        Called on their own, the sum functions collect them anew.
+
+        Returns
+        -------
+        aggregator : ZoneAggregator()
+            Aggregator of the elements of self.thermal_zone
 
-        return r1, c1
+        """
+        if self._aggregator is not None:
+            return self._aggregator
+        return ZoneAggregator(self.thermal_zone, self.nzbs_for_iw)
+
+    def _element_values(self):
+        """Returns the ElementCalculation for the element values of the zone
+
+        Within calc_attributes() the equivalent resistances and UA-values of
+        each element are calculated only once (together with the models of
+        other orders, if the ElementCalculation is shared). Called on their
+        own, the calculation functions calculate them anew.
+
+        Returns
+        -------
+        element_calculation : ElementCalculation()
+            Element calculation of self.thermal_zone
+
+        """
+        if self._element_calculation is not None:
+            return self._element_calculation
+        return ElementCalculation()
 
     def _sum_outer_wall_elements(self):
         """Sum attributes for outer wall elements
@@ -785,37 +796,23 @@ class FourElement(object):
         as one kind of wall type.
 
         """
+        ow = self._element_sums().concatenate(
+            "outer_walls", "izes_outer")
 
-        outer_walls = self.thermal_zone.outer_walls + self.thermal_zone.find_izes_outer()
-
-        self.area_ow = sum(out_wall.area for out_wall in outer_walls)
+        self.area_ow = ow.area
 
-        self.ua_value_ow = sum(
-            out_wall.ua_value for out_wall in outer_walls
-        )
+        self.ua_value_ow = ow.ua_value
 
         self.r_total_ow = 1 / self.ua_value_ow
 
         # values facing the inside of the thermal zone
 
-        self.r_conv_inner_ow = 1 / (
-            sum(1 / out_wall.r_inner_conv for out_wall in outer_walls)
-        )
-
-        self.r_rad_inner_ow = 1 / (
-            sum(1 / out_wall.r_inner_rad for out_wall in outer_walls)
-        )
-
-        self.r_comb_inner_ow = 1 / (
-            sum(1 / out_wall.r_inner_comb for out_wall in outer_walls)
-        )
+        self.r_conv_inner_ow = ow.parallel("r_inner_conv")
+        self.r_rad_inner_ow = ow.parallel("r_inner_rad")
+        self.r_comb_inner_ow = ow.parallel("r_inner_comb")
 
-        self.ir_emissivity_inner_ow = (
-            sum(
-                out_wall.layer[0].material.ir_emissivity * out_wall.area
-                for out_wall in outer_walls
-            )
-        ) / self.area_ow
+        self.ir_emissivity_inner_ow = ow.area_weighted(
+            "ir_emissivity_inner")
 
         self.alpha_conv_inner_ow = 1 / (self.r_conv_inner_ow * self.area_ow)
         self.alpha_rad_inner_ow = 1 / (self.r_rad_inner_ow * self.area_ow)
@@ -824,33 +821,12 @@ class FourElement(object):
         # values facing the ambient
         # ground floor does not have any coefficients on ambient side
 
-        self.r_conv_outer_ow = 1 / (
-            sum(1 / out_wall.r_outer_conv for out_wall in outer_walls)
-        )
-        self.r_rad_outer_ow = 1 / (
-            sum(1 / out_wall.r_outer_rad for out_wall in outer_walls)
-        )
-        self.r_comb_outer_ow = 1 / (
-            sum(1 / out_wall.r_outer_comb for out_wall in outer_walls)
-        )
+        self.r_conv_outer_ow = ow.parallel("r_outer_conv")
+        self.r_rad_outer_ow = ow.parallel("r_outer_rad")
+        self.r_comb_outer_ow = ow.parallel("r_outer_comb")
 
-        self.ir_emissivity_outer_ow = (
-            (
-                sum(
-                    out_wall.layer[-1].material.ir_emissivity * out_wall.area
-                    for out_wall in outer_walls
-                )
-            )
-        ) / self.area_ow
-
-        self.solar_absorp_ow = (
-            (
-                sum(
-                    out_wall.layer[-1].material.solar_absorp * out_wall.area
-                    for out_wall in outer_walls
-                )
-            )
-        ) / self.area_ow
+        self.ir_emissivity_outer_ow = ow.area_weighted("ir_emissivity_outer")
+        self.solar_absorp_ow = ow.area_weighted("solar_absorp")
 
         self.alpha_conv_outer_ow = 1 / (self.r_conv_outer_ow * self.area_ow)
         self.alpha_rad_outer_ow = 1 / (self.r_rad_outer_ow * self.area_ow)
@@ -864,36 +840,22 @@ class FourElement(object):
         transfer, resistances, areas and UA-Values.
 
         """
+        gf = self._element_sums()["ground_floors"]
 
-        self.area_gf = sum(ground.area for ground in self.thermal_zone.ground_floors)
+        self.area_gf = gf.area
 
-        self.ua_value_gf = sum(
-            ground.ua_value for ground in self.thermal_zone.ground_floors
-        )
+        self.ua_value_gf = gf.ua_value
 
         self.r_total_gf = 1 / self.ua_value_gf
 
         # values facing the inside of the thermal zone
 
-        self.r_conv_inner_gf = 1 / sum(
-            1 / ground.r_inner_conv for ground in self.thermal_zone.ground_floors
-        )
-
-        self.r_rad_inner_gf = 1 / sum(
-            1 / ground.r_inner_rad for ground in self.thermal_zone.ground_floors
-        )
+        self.r_conv_inner_gf = gf.parallel("r_inner_conv")
+        self.r_rad_inner_gf = gf.parallel("r_inner_rad")
+        self.r_comb_inner_gf = gf.parallel("r_inner_comb")
 
-        self.r_comb_inner_gf = 1 / sum(
-            1 / ground.r_inner_comb for ground in self.thermal_zone.ground_floors
-        )
-
-        self.ir_emissivity_inner_gf = (
-            sum(
-                ground.layer[0].material.ir_emissivity * ground.area
-                for ground in self.thermal_zone.ground_floors
-            )
-            / self.area_gf
-        )
+        self.ir_emissivity_inner_gf = gf.area_weighted(
+            "ir_emissivity_inner")
 
         self.alpha_conv_inner_gf = 1 / (self.r_conv_inner_gf * self.area_gf)
         self.alpha_rad_inner_gf = 1 / (self.r_rad_inner_gf * self.area_gf)
@@ -911,34 +873,22 @@ class FourElement(object):
         as one kind of wall type.
 
         """
+        rt = self._element_sums()["rooftops"]
 
-        self.area_rt = sum(roof.area for roof in self.thermal_zone.rooftops)
+        self.area_rt = rt.area
 
-        self.ua_value_rt = sum(roof.ua_value for roof in self.thermal_zone.rooftops)
+        self.ua_value_rt = rt.ua_value
 
         self.r_total_rt = 1 / self.ua_value_rt
 
         # values facing the inside of the thermal zone
 
-        self.r_conv_inner_rt = 1 / sum(
-            1 / roof.r_inner_conv for roof in self.thermal_zone.rooftops
-        )
-
-        self.r_rad_inner_rt = 1 / sum(
-            1 / roof.r_inner_rad for roof in self.thermal_zone.rooftops
-        )
-
-        self.r_comb_inner_rt = 1 / sum(
-            1 / roof.r_inner_comb for roof in self.thermal_zone.rooftops
-        )
+        self.r_conv_inner_rt = rt.parallel("r_inner_conv")
+        self.r_rad_inner_rt = rt.parallel("r_inner_rad")
+        self.r_comb_inner_rt = rt.parallel("r_inner_comb")
 
-        self.ir_emissivity_inner_rt = (
-            sum(
-                roof.layer[0].material.ir_emissivity * roof.area
-                for roof in self.thermal_zone.rooftops
-            )
-            / self.area_rt
-        )
+        self.ir_emissivity_inner_rt = rt.area_weighted(
+            "ir_emissivity_inner")
 
         self.alpha_conv_inner_rt = 1 / (self.r_conv_inner_rt * self.area_rt)
         self.alpha_rad_inner_rt = 1 / (self.r_rad_inner_rt * self.area_rt)
@@ -947,31 +897,12 @@ class FourElement(object):
         # values facing the ambient
         # ground floor does not have any coefficients on ambient side
 
-        self.r_conv_outer_rt = 1 / sum(
-            1 / roof.r_outer_conv for roof in self.thermal_zone.rooftops
-        )
-        self.r_rad_outer_rt = 1 / sum(
-            1 / roof.r_outer_rad for roof in self.thermal_zone.rooftops
-        )
-        self.r_comb_outer_rt = 1 / sum(
-            1 / roof.r_outer_comb for roof in self.thermal_zone.rooftops
-        )
+        self.r_conv_outer_rt = rt.parallel("r_outer_conv")
+        self.r_rad_outer_rt = rt.parallel("r_outer_rad")
+        self.r_comb_outer_rt = rt.parallel("r_outer_comb")
 
-        self.ir_emissivity_outer_rt = (
-            sum(
-                roof.layer[-1].material.ir_emissivity * roof.area
-                for roof in self.thermal_zone.rooftops
-            )
-            / self.area_rt
-        )
-
-        self.solar_absorp_rt = (
-            sum(
-                roof.layer[-1].material.solar_absorp * roof.area
-                for roof in self.thermal_zone.rooftops
-            )
-            / self.area_rt
-        )
+        self.ir_emissivity_outer_rt = rt.area_weighted("ir_emissivity_outer")
+        self.solar_absorp_rt = rt.area_weighted("solar_absorp")
 
         self.alpha_conv_outer_rt = 1 / (self.r_conv_outer_rt * self.area_rt)
         self.alpha_rad_outer_rt = 1 / (self.r_rad_outer_rt * self.area_rt)
@@ -992,68 +923,26 @@ class FourElement(object):
         currently not supported.
 
         """
-        self.area_iw = (
-                sum(in_wall.area for in_wall in self.thermal_zone.inner_walls)
-                + sum(floor.area for floor in self.thermal_zone.floors)
-                + sum(ceiling.area for ceiling in self.thermal_zone.ceilings)
-                + sum(nzb.area for nzb in self.nzbs_for_iw)
-        )
+        iw = self._element_sums().add(
+            "inner_walls", "floors", "ceilings", "nzbs_for_iw")
 
-        self.ua_value_iw = (
-                sum(in_wall.ua_value for in_wall in self.thermal_zone.inner_walls)
-                + sum(floor.ua_value for floor in self.thermal_zone.floors)
-                + sum(ceiling.ua_value for ceiling in self.thermal_zone.ceilings)
-                + sum(nzb.ua_value for nzb in self.nzbs_for_iw)
-        )
+        self.area_iw = iw.area
 
-        # values facing the inside of the thermal zone
+        self.ua_value_iw = iw.ua_value
 
-        self.r_conv_inner_iw = 1 / (
-                sum(1 / in_wall.r_inner_conv for in_wall in self.thermal_zone.inner_walls)
-                + sum(1 / floor.r_inner_conv for floor in self.thermal_zone.floors)
-                + sum(1 / ceiling.r_inner_conv for ceiling in self.thermal_zone.ceilings)
-                + sum(1 / nzb.r_inner_conv for nzb in self.nzbs_for_iw)
-        )
-
-        self.r_rad_inner_iw = 1 / (
-                sum(1 / in_wall.r_inner_rad for in_wall in self.thermal_zone.inner_walls)
-                + sum(1 / floor.r_inner_rad for floor in self.thermal_zone.floors)
-                + sum(1 / ceiling.r_inner_rad for ceiling in self.thermal_zone.ceilings)
-                + sum(1 / nzb.r_inner_rad for nzb in self.nzbs_for_iw)
-        )
+        # values facing the inside of the thermal zone
 
-        self.r_comb_inner_iw = 1 / (
-                sum(1 / in_wall.r_inner_comb for in_wall in self.thermal_zone.inner_walls)
-                + sum(1 / floor.r_inner_comb for floor in self.thermal_zone.floors)
-                + sum(1 / ceiling.r_inner_comb for ceiling in self.thermal_zone.ceilings)
-                + sum(1 / nzb.r_inner_comb for nzb in self.nzbs_for_iw)
-        )
+        self.r_conv_inner_iw = iw.parallel("r_inner_conv")
+        self.r_rad_inner_iw = iw.parallel("r_inner_rad")
+        self.r_comb_inner_iw = iw.parallel("r_inner_comb")
 
-        self.ir_emissivity_inner_iw = (
-                                              sum(
-                                                  in_wall.layer[0].material.ir_emissivity * in_wall.area
-                                                  for in_wall in self.thermal_zone.inner_walls
-                                              )
-                                              + sum(
-                                          floor.layer[0].material.ir_emissivity * floor.area
-                                          for floor in self.thermal_zone.floors
-                                      )
-                                              + sum(
-                                          ceiling.layer[0].material.ir_emissivity * ceiling.area
-                                          for ceiling in self.thermal_zone.ceilings
-                                      )
-                                              + sum(
-                                          nzb.layer[0].material.ir_emissivity * nzb.area
-                                          for nzb in self.nzbs_for_iw
-                                      )
-                                      ) / self.area_iw
+        self.ir_emissivity_inner_iw = iw.area_weighted(
+            "ir_emissivity_inner")
 
         self.alpha_conv_inner_iw = 1 / (self.r_conv_inner_iw * self.area_iw)
         self.alpha_rad_inner_iw = 1 / (self.r_rad_inner_iw * self.area_iw)
         self.alpha_comb_inner_iw = 1 / (self.r_comb_inner_iw * self.area_iw)
 
-        # adjacent thermal zones are not supported!
-
     def _sum_window_elements(self):
         """Sum attributes for window elements
 
@@ -1063,75 +952,35 @@ class FourElement(object):
 
         Function is identical for TwoElement, ThreeElement and FourElement.
         """
+        win = self._element_sums()["windows"]
 
-        self.area_win = sum(win.area for win in self.thermal_zone.windows)
-        self.ua_value_win = sum(win.ua_value for win in self.thermal_zone.windows)
+        self.area_win = win.area
+        self.ua_value_win = win.ua_value
         self.u_value_win = self.ua_value_win / self.area_win
 
         # values facing the inside of the thermal zone
 
-        self.r_conv_inner_win = 1 / (
-            sum(1 / win.r_inner_conv for win in self.thermal_zone.windows)
-        )
-
-        self.r_rad_inner_win = 1 / (
-            sum(1 / win.r_inner_rad for win in self.thermal_zone.windows)
-        )
+        self.r_conv_inner_win = win.parallel("r_inner_conv")
+        self.r_rad_inner_win = win.parallel("r_inner_rad")
+        self.r_comb_inner_win = win.parallel("r_inner_comb")
 
-        self.r_comb_inner_win = 1 / (
-            sum(1 / win.r_inner_comb for win in self.thermal_zone.windows)
-        )
-
-        self.ir_emissivity_inner_win = (
-            sum(
-                win.layer[0].material.ir_emissivity * win.area
-                for win in self.thermal_zone.windows
-            )
-            / self.area_win
-        )
+        self.ir_emissivity_inner_win = win.area_weighted(
+            "ir_emissivity_inner")
 
         self.alpha_conv_inner_win = 1 / (self.r_conv_inner_win * self.area_win)
         self.alpha_rad_inner_win = 1 / (self.r_rad_inner_win * self.area_win)
         self.alpha_comb_inner_win = 1 / (self.r_comb_inner_win * self.area_win)
-        self.ratio_conv_rad_inner_win = (
-            sum(win.a_conv * win.area for win in self.thermal_zone.windows)
-            / self.area_win
-        )
+        self.ratio_conv_rad_inner_win = win.area_weighted("a_conv")
 
         # values facing the ambient
 
-        self.r_conv_outer_win = 1 / (
-            sum(1 / win.r_outer_conv for win in self.thermal_zone.windows)
-        )
+        self.r_conv_outer_win = win.parallel("r_outer_conv")
+        self.r_rad_outer_win = win.parallel("r_outer_rad")
+        self.r_comb_outer_win = win.parallel("r_outer_comb")
 
-        self.r_rad_outer_win = 1 / (
-            sum(1 / win.r_outer_rad for win in self.thermal_zone.windows)
-        )
-
-        self.r_comb_outer_win = 1 / (
-            sum(1 / win.r_outer_comb for win in self.thermal_zone.windows)
-        )
-
-        self.ir_emissivity_win = (
-            sum(
-                win.layer[-1].material.ir_emissivity * win.area
-                for win in self.thermal_zone.windows
-            )
-            / self.area_win
-        )
-
-        self.solar_absorp_win = (
-            sum(
-                win.layer[-1].material.solar_absorp * win.area
-                for win in self.thermal_zone.windows
-            )
-            / self.area_win
-        )
-
-        self.weighted_g_value = (
-            sum(win.g_value * win.area for win in self.thermal_zone.windows)
-            / self.area_win
-        )
+        self.ir_emissivity_win = win.area_weighted("ir_emissivity_outer")
+        self.solar_absorp_win = win.area_weighted("solar_absorp")
+        self.weighted_g_value = win.area_weighted("g_value")
 
         self.alpha_conv_outer_win = 1 / (self.r_conv_outer_win * self.area_win)
         self.alpha_rad_outer_win = 1 / (self.r_rad_outer_win * self.area_win)
@@ -1156,12 +1005,7 @@ class FourElement(object):
 
         outer_walls = self.thermal_zone.outer_walls + self.thermal_zone.find_izes_outer()
 
-        if 0 < len(outer_walls) <= 1:
-            # only one outer wall, no need to calculate chain matrix
-            self.r1_ow = outer_walls[0].r1
-            self.c1_ow = outer_walls[0].c1_korr
-        elif len(outer_walls) > 1:
-            # more than one outer wall, calculate chain matrix
+        if len(outer_walls) > 0:
             self.r1_ow, self.c1_ow = self._calc_parallel_connection(
                 outer_walls, omega, mode='ow'
             )
@@ -1255,12 +1099,7 @@ class FourElement(object):
 
         omega = 2 * math.pi / 86400 / self.t_bt
 
-        if 0 < len(self.thermal_zone.ground_floors) <= 1:
-            # only one outer wall, no need to calculate chain matrix
-            self.r1_gf = self.thermal_zone.ground_floors[0].r1
-            self.c1_gf = self.thermal_zone.ground_floors[0].c1_korr
-        elif len(self.thermal_zone.ground_floors) > 1:
-            # more than one outer wall, calculate chain matrix
+        if len(self.thermal_zone.ground_floors) > 0:
             self.r1_gf, self.c1_gf = self._calc_parallel_connection(
                 self.thermal_zone.ground_floors, omega, mode='ow'
             )
@@ -1297,12 +1136,7 @@ class FourElement(object):
 
         omega = 2 * math.pi / 86400 / self.t_bt
 
-        if 0 < len(self.thermal_zone.rooftops) <= 1:
-            # only one outer wall, no need to calculate chain matrix
-            self.r1_rt = self.thermal_zone.rooftops[0].r1
-            self.c1_rt = self.thermal_zone.rooftops[0].c1_korr
-        elif len(self.thermal_zone.rooftops) > 1:
-            # more than one outer wall, calculate chain matrix
+        if len(self.thermal_zone.rooftops) > 0:
             self.r1_rt, self.c1_rt = self._calc_parallel_connection(
                 self.thermal_zone.rooftops, omega, mode='ow'
             )
@@ -1346,9 +1180,7 @@ class FourElement(object):
                 + self.nzbs_for_iw
         )
 
-        for in_wall in inner_walls:
-            in_wall.calc_equivalent_res()
-            in_wall.calc_ua_value()
+        self._element_values().calc_walls(inner_walls)
 
         if 0 < len(inner_walls) <= 1:
             # only one inner wall, no need to calculate chain matrix
@@ -1455,24 +1287,17 @@ class FourElement(object):
         elements and then creates lists for zone weightfactors, orientation,
         tilt, ares and sunblinds."""
 
-        outer_elements = (
-            self.thermal_zone.outer_walls
-            + self.thermal_zone.find_izes_outer()
-            + self.thermal_zone.windows
+        facades = self._element_sums().facades
+        tilt_orient = facades.tilt_orient(
+            "outer_walls", "izes_outer", "windows"
         )
 
-        tilt_orient = []
-        for element in outer_elements:
-            tilt_orient.append((element.orientation, element.tilt))
-        tilt_orient = list(set(tilt_orient))
-
         for i in tilt_orient:
-            wall_nzb = self.thermal_zone.find_walls(
-                i[0], i[1]
-            ) + self.thermal_zone.find_izes_outer(
-                i[0], i[1]
+            wall_nzb = (
+                facades.find("outer_walls", i[0], i[1])
+                + facades.find("izes_outer", i[0], i[1])
             )
-            wins = self.thermal_zone.find_wins(i[0], i[1])
+            wins = facades.find("windows", i[0], i[1])
 
             if self.merge_windows is True:
                 self.facade_areas.append(
@@ -1501,19 +1326,20 @@ class FourElement(object):
                 self.transparent_areas.append(0.0)
                 self.shading_max_irr.append(9999.9)
             else:
+                win_area = sum([win.area for win in wins])
                 self.weightfactor_win.append(sum([win.wf_out for win in wins]))
 
                 if self.merge_windows is False:
-                    self.window_areas.append(sum([win.area for win in wins]))
-                    self.transparent_areas.append(sum([win.area for win in wins]))
+                    self.window_areas.append(win_area)
+                    self.transparent_areas.append(win_area)
 
                 else:
                     self.window_areas.append(0)
-                    self.transparent_areas.append(sum([win.area for win in wins]))
+                    self.transparent_areas.append(win_area)
                 self.shading_g_total.append(
                     sum(
                         [
-                            win.shading_g_total * win.area / sum([w.area for w in wins])
+                            win.shading_g_total * win.area / win_area
                             for win in wins
                         ]
                     )
@@ -1521,19 +1347,16 @@ class FourElement(object):
                 self.shading_max_irr.append(
                     sum(
                         [
-                            win.shading_max_irr * win.area / sum([w.area for w in wins])
+                            win.shading_max_irr * win.area / win_area
                             for win in wins
                         ]
                     )
                 )
 
-        tilt_orient_rt = []
-        for roof in self.thermal_zone.rooftops:
-            tilt_orient_rt.append((roof.orientation, roof.tilt))
-        tilt_orient_rt = list(set(tilt_orient_rt))
+        tilt_orient_rt = facades.tilt_orient("rooftops")
 
         for i in tilt_orient_rt:
-            rts = self.thermal_zone.find_rts(i[0], i[1])
+            rts = facades.find("rooftops", i[0], i[1])
 
             self.orientation_rt.append(i[0])
             self.tilt_rt.append(i[1])
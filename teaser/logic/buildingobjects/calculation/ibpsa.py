@@ -1,7 +1,7 @@
 """This module includes IBPSA calculation class."""
 
 import os
-import pandas as pd
+import numpy as np
 import teaser.logic.utilities as utilities
 
 
@@ -83,42 +83,40 @@ class IBPSA(object):
         utilities.create_path(path)
         path = os.path.join(path, self.file_internal_gains)
 
-        export = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760, freq="h")
-            .to_series()
-            .dt.strftime("%m-%d %H:%M:%S")
-        )
-
-        export["person_rad_{}".format(zone.name)] = (
-            zone.use_conditions.schedules["persons_profile"]
-            * (1 - zone.use_conditions.ratio_conv_rad_persons)
-            * zone.use_conditions.fixed_heat_flow_rate_persons
-            * zone.use_conditions.persons
-            * zone.area
-        )
-        export["person_conv_{}".format(zone.name)] = (
-            zone.use_conditions.schedules["persons_profile"]
-            * zone.use_conditions.ratio_conv_rad_persons
-            * zone.use_conditions.fixed_heat_flow_rate_persons
-            * zone.use_conditions.persons
-            * zone.area
-        )
-        export["machines_conv_{}".format(zone.name)] = (
-            zone.use_conditions.schedules["machines_profile"]
-            * zone.use_conditions.ratio_conv_rad_machines
-            * zone.use_conditions.machines
-            * zone.area
-        )
+        use_cond = zone.use_conditions
+        persons = use_cond.get_profile("persons_profile")
+        machines = use_cond.get_profile("machines_profile")
+        period = utilities.get_table_period([persons.period, machines.period])
+        persons = np.resize(persons.values, period)
+        machines = np.resize(machines.values, period)
+
+        columns = [
+            persons
+            * (1 - use_cond.ratio_conv_rad_persons)
+            * use_cond.fixed_heat_flow_rate_persons
+            * use_cond.persons
+            * zone.area,
+            persons
+            * use_cond.ratio_conv_rad_persons
+            * use_cond.fixed_heat_flow_rate_persons
+            * use_cond.persons
+            * zone.area,
+            machines
+            * use_cond.ratio_conv_rad_machines
+            * use_cond.machines
+            * zone.area,
+        ]
 
-        export.index = [(i + 1) * 3600 for i in range(8760)]
         self._delete_file(path=path)
-        with open(path, "a") as f:
-            f.write("#1\n")
-            # The size of the dataset is always 4 columns as each thermal zone has its own data file.
-            f.write("double Internals(8761, 4)\n")
-            # write the first row with t=0
-            f.write("0\t{}".format(export.iloc[:1, :].to_csv(sep="\t", header=False, index=False)))
-            export.to_csv(f, sep="\t", header=False, index_label=False)
+        # The size of the dataset is always 4 columns as each thermal zone has
+        # its own data file. Tables of one year get a first row with t=0.
+        utilities.write_table(
+            path=path,
+            table_name="Internals",
+            columns=columns,
+            period=period,
+            zero_row=True,
+        )
 
     def _delete_file(self, path):
         """Delete a file before new information is written to it.
@@ -2,8 +2,10 @@
 
 from __future__ import division
 import math
-import random
+import teaser.logic.utilities as utilities
 import warnings
+from teaser.logic.buildingobjects.calculation.aggregation import \
+    ElementCalculation, ZoneAggregator, parallel_connection
 
 
 class OneElement(object):
@@ -33,6 +35,10 @@ class OneElement(object):
         Time constant according to VDI 6007 (default t_bt = 5)
     t_bt_layer : float [d]
         Time constant according to VDI 6007 for aggragation of layers (default t_bt = 7)
+    element_calculation : ElementCalculation()
+        Calculates the element values, shared with the models of other
+        orders in ThermalZone.calc_zone_parameters(). Default is None, the
+        model calculates the elements on its own
 
     Attributes
     ----------
@@ -233,15 +239,19 @@ class OneElement(object):
 
     """
 
-    def __init__(self, thermal_zone, merge_windows, t_bt, t_bt_layer=7):
+    def __init__(self, thermal_zone, merge_windows, t_bt, t_bt_layer=7,
+                 element_calculation=None):
         """Constructor for TwoElement"""
 
-        self.internal_id = random.random()
+        self.internal_id = utilities.get_id_allocator(
+            thermal_zone).next_id()
 
         self.thermal_zone = thermal_zone
         self.merge_windows = merge_windows
         self.t_bt = t_bt
         self.t_bt_layer = t_bt_layer
+        self._aggregator = None
+        self._element_calculation = element_calculation
 
         # Attributes for outer walls (OuterWall, Rooftop, GroundFloor)
         self.area_ow = 0.0
@@ -344,6 +354,9 @@ class OneElement(object):
 
     def calc_attributes(self):
         """Calls all necessary function to calculate model attributes"""
+        if self._element_calculation is None:
+            self._element_calculation = ElementCalculation()
+        elements = self._element_calculation
 
         outer_walls = (
             self.thermal_zone.outer_walls
@@ -352,21 +365,17 @@ class OneElement(object):
             + self.thermal_zone.find_izes_outer()
         )
 
-        for out_wall in outer_walls:
-            out_wall.calc_equivalent_res(t_bt=self.t_bt_layer)
-            out_wall.calc_ua_value()
-        for win in self.thermal_zone.windows:
-            win.calc_equivalent_res()
-            win.calc_ua_value()
-        for inner_wall in (
+        elements.calc_walls(outer_walls, t_bt=self.t_bt_layer)
+        elements.calc_windows(self.thermal_zone.windows)
+        inner_walls = (
             self.thermal_zone.inner_walls
             + self.thermal_zone.floors
             + self.thermal_zone.ceilings
-        ):
-            inner_wall.calc_equivalent_res(t_bt=self.t_bt_layer)
-            inner_wall.calc_ua_value()
+        )
+        elements.calc_walls(inner_walls, t_bt=self.t_bt_layer)
 
         self.set_calc_default()
+        self._aggregator = ZoneAggregator(self.thermal_zone)
         if len(outer_walls) < 1:
             warnings.warn(
                 "No walls are defined as outer walls for thermal "
@@ -406,6 +415,8 @@ class OneElement(object):
             )
         self._calc_number_of_elements()
         self._fill_zone_lists()
+        self._aggregator = None
+        self._element_calculation = None
         self._calc_heat_load()
         self.cool_load = -self.heat_load
 
@@ -414,7 +425,8 @@ class OneElement(object):
         """Parallel connection of walls according to VDI 6007
 
         Calculates the parallel connection of wall elements according to VDI
-        6007, resulting in R1 and C1 (equation 23, 24).
+        6007, resulting in R1 and C1 (equation 23, 24), see
+        aggregation.parallel_connection().
 
         Parameters
         ----------
@@ -431,39 +443,42 @@ class OneElement(object):
             VDI 6007 capacity all for inner or outer walls
         """
 
-        for wall_count in range(len(element_list) - 1):
+        return parallel_connection(element_list, omega, mode="ow")
 
-            if wall_count == 0:
-                r1_before = element_list[wall_count].r1
-                c1_before = element_list[wall_count].c1_korr
-            else:
-                r1_before = r1
-                c1_before = c1
-            r1_add = element_list[wall_count + 1].r1
-            c1_add = element_list[wall_count + 1].c1_korr
-
-            r1 = (
-                r1_before * c1_before ** 2 + r1_add * c1_add ** 2
-                + omega ** 2 * r1_before * r1_add * (r1_before + r1_add)
-                * c1_before ** 2 * c1_add ** 2
-            ) / (
-                (c1_before + c1_add) ** 2
-                + omega ** 2 * (r1_before + r1_add) ** 2 * c1_before ** 2
-                * c1_add ** 2
-            )
+    def _element_sums(self):
+        """Returns the ZoneAggregator with the element sums of the zone
 
-            c1 = (
-                (c1_before + c1_add) ** 2
-                + omega ** 2 * (r1_before + r1_add) ** 2 * c1_before ** 2
-                * c1_add ** 2
-            ) / (
-                c1_before + c1_add
-                + omega ** 2
-                * (r1_before ** 2 * c1_before + r1_add ** 2 * c1_add)
-                * c1_before * c1_add
-            )
+        Within calc_attributes() all sum functions share one aggregator, so
+        the properties of each kind of element are collected only once.
+        Called on their own, the sum functions collect them anew.
+
+        Returns
+        -------
+        aggregator : ZoneAggregator()
+            Aggregator of the elements of self.thermal_zone
+
+        """
+        if self._aggregator is not None:
+            return self._aggregator
+        return ZoneAggregator(self.thermal_zone)
 
-        return r1, c1
+    def _element_values(self):
+        """Returns the ElementCalculation for the element values of the zone
+
+        Within calc_attributes() the equivalent resistances and UA-values of
+        each element are calculated only once (together with the models of
+        other orders, if the ElementCalculation is shared). Called on their
+        own, the calculation functions calculate them anew.
+
+        Returns
+        -------
+        element_calculation : ElementCalculation()
+            Element calculation of self.thermal_zone
+
+        """
+        if self._element_calculation is not None:
+            return self._element_calculation
+        return ElementCalculation()
 
     def _sum_outer_wall_elements(self):
         """Sum attributes for outer wall elements
@@ -476,45 +491,24 @@ class OneElement(object):
         as one kind of wall type.
 
         """
-        # treat all outer wall types identical
-
-        outer_walls = (
-            self.thermal_zone.outer_walls
-            + self.thermal_zone.ground_floors
-            + self.thermal_zone.rooftops
-            + self.thermal_zone.find_izes_outer()
-        )
+        sums = self._element_sums()
+        ow = sums.concatenate(
+            "outer_walls", "ground_floors", "rooftops", "izes_outer")
 
-        self.area_ow = (
-            sum(out_wall.area for out_wall in outer_walls)
-        )
+        self.area_ow = ow.area
 
-        self.ua_value_ow = (
-            sum(out_wall.ua_value for out_wall in outer_walls)
-        )
+        self.ua_value_ow = ow.ua_value
 
         self.r_total_ow = 1 / self.ua_value_ow
 
         # values facing the inside of the thermal zone
 
-        self.r_conv_inner_ow = 1 / (
-            sum(1 / out_wall.r_inner_conv for out_wall in outer_walls)
-        )
-
-        self.r_rad_inner_ow = 1 / (
-            sum(1 / out_wall.r_inner_rad for out_wall in outer_walls)
-        )
-
-        self.r_comb_inner_ow = 1 / (
-            sum(1 / out_wall.r_inner_comb for out_wall in outer_walls)
-        )
+        self.r_conv_inner_ow = ow.parallel("r_inner_conv")
+        self.r_rad_inner_ow = ow.parallel("r_inner_rad")
+        self.r_comb_inner_ow = ow.parallel("r_inner_comb")
 
-        self.ir_emissivity_inner_ow = (
-            sum(
-                out_wall.layer[0].material.ir_emissivity * out_wall.area
-                for out_wall in outer_walls
-            )
-        ) / self.area_ow
+        self.ir_emissivity_inner_ow = ow.area_weighted(
+            "ir_emissivity_inner")
 
         self.alpha_conv_inner_ow = 1 / (self.r_conv_inner_ow * self.area_ow)
         self.alpha_rad_inner_ow = 1 / (self.r_rad_inner_ow * self.area_ow)
@@ -523,53 +517,16 @@ class OneElement(object):
         # values facing the ambient
         # ground floor does not have any coefficients on ambient side
 
-        _area_ow_rt = sum(
-            out_wall.area for out_wall in self.thermal_zone.outer_walls
-        ) + sum(
-            roof.area for roof in self.thermal_zone.rooftops
-        )
+        ow_rt = sums.add("outer_walls", "rooftops")
+        ow_rt_nzb = sums.add("outer_walls", "rooftops", "izes_outer")
+        _area_ow_rt_nzb = ow_rt_nzb.area
 
-        _area_ow_rt_nzb = _area_ow_rt + sum(
-            roof.area for roof in self.thermal_zone.find_izes_outer()
-        )
+        self.r_conv_outer_ow = ow_rt_nzb.parallel("r_outer_conv")
+        self.r_rad_outer_ow = ow_rt_nzb.parallel("r_outer_rad")
+        self.r_comb_outer_ow = ow_rt_nzb.parallel("r_outer_comb")
 
-        self.r_conv_outer_ow = 1 / (
-            sum(1 / out_wall.r_outer_conv for out_wall in self.thermal_zone.outer_walls)
-            + sum(1 / roof.r_outer_conv for roof in self.thermal_zone.rooftops)
-            + sum(1 / nzb.r_outer_conv for nzb in self.thermal_zone.find_izes_outer())
-        )
-        self.r_rad_outer_ow = 1 / (
-            sum(1 / out_wall.r_outer_rad for out_wall in self.thermal_zone.outer_walls)
-            + sum(1 / roof.r_outer_rad for roof in self.thermal_zone.rooftops)
-            + sum(1 / nzb.r_outer_rad for nzb in self.thermal_zone.find_izes_outer())
-        )
-        self.r_comb_outer_ow = 1 / (
-            sum(1 / out_wall.r_outer_comb for out_wall in self.thermal_zone.outer_walls)
-            + sum(1 / roof.r_outer_comb for roof in self.thermal_zone.rooftops)
-            + sum(1 / nzb.r_outer_comb for nzb in self.thermal_zone.find_izes_outer())
-        )
-
-        self.ir_emissivity_outer_ow = (
-            sum(
-                out_wall.layer[-1].material.ir_emissivity * out_wall.area
-                for out_wall in self.thermal_zone.outer_walls
-            )
-            + sum(
-                roof.layer[-1].material.ir_emissivity * roof.area
-                for roof in self.thermal_zone.rooftops
-            )
-        ) / _area_ow_rt
-
-        self.solar_absorp_ow = (
-            sum(
-                out_wall.layer[-1].material.solar_absorp * out_wall.area
-                for out_wall in self.thermal_zone.outer_walls
-            )
-            + sum(
-                roof.layer[-1].material.solar_absorp * roof.area
-                for roof in self.thermal_zone.rooftops
-            )
-        ) / _area_ow_rt
+        self.ir_emissivity_outer_ow = ow_rt.area_weighted("ir_emissivity_outer")
+        self.solar_absorp_ow = ow_rt.area_weighted("solar_absorp")
 
         self.alpha_conv_outer_ow = 1 / (self.r_conv_outer_ow * _area_ow_rt_nzb)
         self.alpha_rad_outer_ow = 1 / (self.r_rad_outer_ow * _area_ow_rt_nzb)
@@ -584,76 +541,36 @@ class OneElement(object):
 
         Function is identical for TwoElement, ThreeElement and FourElement.
         """
+        win = self._element_sums()["windows"]
 
-        self.area_win = sum(win.area for win in self.thermal_zone.windows)
-        self.ua_value_win = sum(win.ua_value for win in self.thermal_zone.windows)
+        self.area_win = win.area
+        self.ua_value_win = win.ua_value
         self.u_value_win = self.ua_value_win / self.area_win
 
         self.r_total_win = 1 / self.ua_value_win
         # values facing the inside of the thermal zone
 
-        self.r_conv_inner_win = 1 / (
-            sum(1 / win.r_inner_conv for win in self.thermal_zone.windows)
-        )
-
-        self.r_rad_inner_win = 1 / (
-            sum(1 / win.r_inner_rad for win in self.thermal_zone.windows)
-        )
-
-        self.r_comb_inner_win = 1 / (
-            sum(1 / win.r_inner_comb for win in self.thermal_zone.windows)
-        )
+        self.r_conv_inner_win = win.parallel("r_inner_conv")
+        self.r_rad_inner_win = win.parallel("r_inner_rad")
+        self.r_comb_inner_win = win.parallel("r_inner_comb")
 
-        self.ir_emissivity_inner_win = (
-            sum(
-                win.layer[0].material.ir_emissivity * win.area
-                for win in self.thermal_zone.windows
-            )
-            / self.area_win
-        )
+        self.ir_emissivity_inner_win = win.area_weighted(
+            "ir_emissivity_inner")
 
         self.alpha_conv_inner_win = 1 / (self.r_conv_inner_win * self.area_win)
         self.alpha_rad_inner_win = 1 / (self.r_rad_inner_win * self.area_win)
         self.alpha_comb_inner_win = 1 / (self.r_comb_inner_win * self.area_win)
-        self.ratio_conv_rad_inner_win = (
-            sum(win.a_conv * win.area for win in self.thermal_zone.windows)
-            / self.area_win
-        )
+        self.ratio_conv_rad_inner_win = win.area_weighted("a_conv")
 
         # values facing the ambient
 
-        self.r_conv_outer_win = 1 / (
-            sum(1 / win.r_outer_conv for win in self.thermal_zone.windows)
-        )
+        self.r_conv_outer_win = win.parallel("r_outer_conv")
+        self.r_rad_outer_win = win.parallel("r_outer_rad")
+        self.r_comb_outer_win = win.parallel("r_outer_comb")
 
-        self.r_rad_outer_win = 1 / (
-            sum(1 / win.r_outer_rad for win in self.thermal_zone.windows)
-        )
-
-        self.r_comb_outer_win = 1 / (
-            sum(1 / win.r_outer_comb for win in self.thermal_zone.windows)
-        )
-
-        self.ir_emissivity_win = (
-            sum(
-                win.layer[-1].material.ir_emissivity * win.area
-                for win in self.thermal_zone.windows
-            )
-            / self.area_win
-        )
-
-        self.solar_absorp_win = (
-            sum(
-                win.layer[-1].material.solar_absorp * win.area
-                for win in self.thermal_zone.windows
-            )
-            / self.area_win
-        )
-
-        self.weighted_g_value = (
-            sum(win.g_value * win.area for win in self.thermal_zone.windows)
-            / self.area_win
-        )
+        self.ir_emissivity_win = win.area_weighted("ir_emissivity_outer")
+        self.solar_absorp_win = win.area_weighted("solar_absorp")
+        self.weighted_g_value = win.area_weighted("g_value")
 
         self.alpha_conv_outer_win = 1 / (self.r_conv_outer_win * self.area_win)
         self.alpha_rad_outer_win = 1 / (self.r_rad_outer_win * self.area_win)
@@ -683,12 +600,7 @@ class OneElement(object):
             + self.thermal_zone.find_izes_outer()
         )
 
-        if 0 < len(outer_walls) <= 1:
-            # only one outer wall, no need to calculate chain matrix
-            self.r1_ow = outer_walls[0].r1
-            self.c1_ow = outer_walls[0].c1_korr
-        elif len(outer_walls) > 1:
-            # more than one outer wall, calculate chain matrix
+        if len(outer_walls) > 0:
             self.r1_ow, self.c1_ow = self._calc_parallel_connection(
                 outer_walls, omega
             )
@@ -857,29 +769,19 @@ class OneElement(object):
         elements and then creates lists for zone weightfactors, orientation,
         tilt, ares and sunblinds."""
 
-        outer_elements = (
-            self.thermal_zone.outer_walls
-            + self.thermal_zone.find_izes_outer()
-            + self.thermal_zone.ground_floors
-            + self.thermal_zone.rooftops
-            + self.thermal_zone.windows
+        facades = self._element_sums().facades
+        tilt_orient = facades.tilt_orient(
+            "outer_walls", "izes_outer", "ground_floors", "rooftops", "windows"
         )
 
-        tilt_orient = []
-        for element in outer_elements:
-            tilt_orient.append((element.orientation, element.tilt))
-        tilt_orient = list(set(tilt_orient))
-
         for i in tilt_orient:
-            wall_rt_nzb = self.thermal_zone.find_walls(
-                i[0], i[1]
-            ) + self.thermal_zone.find_rts(
-                i[0], i[1]
-            ) + self.thermal_zone.find_izes_outer(
-                i[0], i[1]
+            wall_rt_nzb = (
+                facades.find("outer_walls", i[0], i[1])
+                + facades.find("rooftops", i[0], i[1])
+                + facades.find("izes_outer", i[0], i[1])
             )
-            wins = self.thermal_zone.find_wins(i[0], i[1])
-            gf = self.thermal_zone.find_gfs(i[0], i[1])
+            wins = facades.find("windows", i[0], i[1])
+            gf = facades.find("ground_floors", i[0], i[1])
 
             if self.merge_windows is True:
                 self.facade_areas.append(
@@ -916,18 +818,19 @@ class OneElement(object):
                 self.transparent_areas.append(0.0)
                 self.shading_max_irr.append(9999.9)
             else:
+                win_area = sum([win.area for win in wins])
                 self.weightfactor_win.append(sum([win.wf_out for win in wins]))
                 if self.merge_windows is False:
-                    self.window_areas.append(sum([win.area for win in wins]))
-                    self.transparent_areas.append(sum([win.area for win in wins]))
+                    self.window_areas.append(win_area)
+                    self.transparent_areas.append(win_area)
 
                 else:
                     self.window_areas.append(0)
-                    self.transparent_areas.append(sum([win.area for win in wins]))
+                    self.transparent_areas.append(win_area)
                 self.shading_g_total.append(
                     sum(
                         [
-                            win.shading_g_total * win.area / sum([w.area for w in wins])
+                            win.shading_g_total * win.area / win_area
                             for win in wins
                         ]
                     )
@@ -935,7 +838,7 @@ class OneElement(object):
                 self.shading_max_irr.append(
                     sum(
                         [
-                            win.shading_max_irr * win.area / sum([w.area for w in wins])
+                            win.shading_max_irr * win.area / win_area
                             for win in wins
                         ]
                     )
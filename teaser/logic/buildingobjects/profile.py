@@ -0,0 +1,96 @@
+# created October 2026
+
+"""This module contains the Profile class for hourly profiles."""
+
+import hashlib
+import weakref
+import numpy as np
+
+# interned profiles by key, entries are dropped with the last reference
+_profiles = weakref.WeakValueDictionary()
+
+
+def intern_profile(values):
+    """Returns the shared Profile for the given values
+
+    Profiles with identical values are the same object, so memory scales
+    with the number of distinct profiles and identical profiles can be
+    found by their key.
+
+    Parameters
+    ----------
+    values : list or numpy.ndarray
+        Hourly values
+
+    Returns
+    -------
+    profile : Profile
+        Interned profile with a copy of the values
+    """
+    values = np.array(values, dtype=float)
+    values.flags.writeable = False
+    key = hashlib.blake2b(values.tobytes(), digest_size=16).hexdigest()
+    profile = _profiles.get(key)
+    if profile is not None and np.array_equal(profile.values, values):
+        return profile
+    profile = Profile(values, key)
+    if key not in _profiles:
+        _profiles[key] = profile
+    return profile
+
+
+class Profile(object):
+    """Immutable hourly profile, shared by all owners with the same values
+
+    Create profiles with intern_profile(), which returns the existing
+    profile for known values.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Read-only hourly values
+    key : str
+        Hash of the values
+
+    Attributes
+    ----------
+    values : numpy.ndarray
+        Read-only hourly values, the length is the period of the profile
+    key : str
+        Hash of the values, equal for profiles with equal values
+    """
+
+    __slots__ = ("values", "key", "_hourly", "__weakref__")
+
+    def __init__(self, values, key):
+        self.values = values
+        self.key = key
+        self._hourly = None
+
+    def __reduce__(self):
+        # unpickled profiles are interned in the loading process
+        return intern_profile, (self.values,)
+
+    def __len__(self):
+        return len(self.values)
+
+    @property
+    def period(self):
+        """Period of the profile in hours"""
+        return len(self.values)
+
+    def hourly(self):
+        """Returns the profile repeated to one year (8760 hours)
+
+        The array is calculated once and shared, it is read-only.
+
+        Returns
+        -------
+        hourly : numpy.ndarray
+            Hourly values of one year
+        """
+        if self._hourly is None:
+            hourly = np.resize(self.values, 8760)
+            hourly.flags.writeable = False
+            self._hourly = hourly
+        return self._hourly
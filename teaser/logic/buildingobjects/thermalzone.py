@@ -5,7 +5,7 @@
 """
 from __future__ import division
 import math
-import random
+import teaser.logic.utilities as utilities
 import re
 import warnings
 from teaser.logic.buildingobjects.calculation.one_element import OneElement
@@ -13,6 +13,8 @@ from teaser.logic.buildingobjects.calculation.two_element import TwoElement
 from teaser.logic.buildingobjects.calculation.three_element import ThreeElement
 from teaser.logic.buildingobjects.calculation.four_element import FourElement
 from teaser.logic.buildingobjects.calculation.five_element import FiveElement
+from teaser.logic.buildingobjects.calculation.aggregation import \
+    ElementCalculation, FacadeIndex
 
 
 class ThermalZone(object):
@@ -34,8 +36,9 @@ class ThermalZone(object):
     Attributes
     ----------
 
-    internal_id : float
-        Random id for the distinction between different zones.
+    internal_id : int or float
+        Id for the distinction between different zones, drawn from the
+        id_allocator of the project.
     name : str
         Individual name.
     area : float [m2]
@@ -72,6 +75,9 @@ class ThermalZone(object):
         Instance of OneElement(), TwoElement(), ThreeElement(),
         FourElement(), or FiveElement() that holds all calculation functions
         and attributes needed for the specific model.
+    model_attrs : dict
+        Calculated models by their number of elements, holds all model orders
+        of calc_zone_parameters(number_of_elements=[...])
     t_inside : float [K]
         Normative indoor temperature for static heat load calculation.
         The input of t_inside is ALWAYS in Kelvin
@@ -108,7 +114,7 @@ class ThermalZone(object):
 
         self.parent = parent
 
-        self.internal_id = random.random()
+        self.internal_id = utilities.get_id_allocator(parent).next_id()
         self.name = None
         self._area = None
         self._volume = None
@@ -134,13 +140,16 @@ class ThermalZone(object):
 
         self._number_of_floors = None
         self._height_of_floors = None
+        self.model_attrs = {}
+        self._calc_signature = None
 
     def calc_zone_parameters(
             self,
             number_of_elements=2,
             merge_windows=False,
             t_bt=5,
-            t_bt_layer=7
+            t_bt_layer=7,
+            incremental=False
     ):
         """RC-Calculation for the thermal zone
 
@@ -160,11 +169,19 @@ class ThermalZone(object):
         For all four options we can choose if the thermal conduction through
         the window is considered in a separate resistance or not.
 
+        Several model orders can be calculated in one pass by passing a list
+        (e.g. [1, 2, 3, 4, 5]) as number_of_elements. The equivalent
+        resistances and UA-values of the elements are then calculated once
+        and shared by all models. The models are stored side by side in
+        model_attrs, model_attr is the model of the first order of the list
+        (see select_model_attr()).
+
         Parameters
         ----------
-        number_of_elements : int
+        number_of_elements : int or list
             defines the number of elements, that area aggregated, between 1
-            and 5, default is 2
+            and 5, default is 2. A list of numbers calculates all of these
+            model orders
 
         merge_windows : bool
             True for merging the windows into the outer walls, False for
@@ -175,43 +192,176 @@ class ThermalZone(object):
             Time constant according to VDI 6007 (default t_bt = 5)
         t_bt_layer: float
             Time constant according to VDI 6007 for aggragation of layers (default t_bt = 7)
+        incremental : bool
+            If True, the calculation is skipped if the zone has been
+            calculated before and its inputs (see calc_signature()) didn't
+            change since then. Default is False
+
+        Returns
+        -------
+        calculated : bool
+            False if the calculation was skipped, True otherwise
         """
+        signature = self.calc_signature(
+            number_of_elements=number_of_elements,
+            merge_windows=merge_windows,
+            t_bt=t_bt,
+            t_bt_layer=t_bt_layer)
+        if incremental and signature == self._calc_signature \
+                and getattr(self, "model_attr", None) is not None:
+            return False
+        self._calc_signature = None
+
+        element_calculation = ElementCalculation()
+        model_attrs = {}
+        for order in self._model_orders(number_of_elements):
+            if order == 1:
+                model_attr = OneElement(
+                    thermal_zone=self,
+                    merge_windows=merge_windows,
+                    t_bt=t_bt,
+                    t_bt_layer=t_bt_layer,
+                    element_calculation=element_calculation)
+            elif order == 2:
+                model_attr = TwoElement(
+                    thermal_zone=self,
+                    merge_windows=merge_windows,
+                    t_bt=t_bt,
+                    t_bt_layer=t_bt_layer,
+                    element_calculation=element_calculation)
+            elif order == 3:
+                model_attr = ThreeElement(
+                    thermal_zone=self,
+                    merge_windows=merge_windows,
+                    t_bt=t_bt,
+                    t_bt_layer=t_bt_layer,
+                    element_calculation=element_calculation)
+            elif order == 4:
+                model_attr = FourElement(
+                    thermal_zone=self,
+                    merge_windows=merge_windows,
+                    t_bt=t_bt,
+                    t_bt_layer=t_bt_layer,
+                    element_calculation=element_calculation)
+            elif order == 5:
+                model_attr = FiveElement(
+                    thermal_zone=self,
+                    merge_windows=merge_windows,
+                    t_bt=t_bt,
+                    element_calculation=element_calculation)
+            else:
+                continue
+            if not model_attrs:
+                self.model_attr = model_attr
+            model_attrs[order] = model_attr
+            model_attr.calc_attributes()
+        if model_attrs:
+            self.model_attrs = model_attrs
+        self._calc_signature = signature
+        return True
+
+    def select_model_attr(self, number_of_elements):
+        """Selects the model of one order as model_attr
+
+        The model has to be calculated before, see calc_zone_parameters().
+        Exports use model_attr, so this picks the model order of the export
+        without calculating the zone again.
 
-        if number_of_elements == 1:
-            self.model_attr = OneElement(
-                thermal_zone=self,
-                merge_windows=merge_windows,
-                t_bt=t_bt,
-                t_bt_layer=t_bt_layer)
-            self.model_attr.calc_attributes()
-        elif number_of_elements == 2:
-            self.model_attr = TwoElement(
-                thermal_zone=self,
-                merge_windows=merge_windows,
-                t_bt=t_bt,
-                t_bt_layer=t_bt_layer)
-            self.model_attr.calc_attributes()
-        elif number_of_elements == 3:
-            self.model_attr = ThreeElement(
-                thermal_zone=self,
-                merge_windows=merge_windows,
-                t_bt=t_bt,
-                t_bt_layer=t_bt_layer)
-            self.model_attr.calc_attributes()
-        elif number_of_elements == 4:
-            self.model_attr = FourElement(
-                thermal_zone=self,
-                merge_windows=merge_windows,
-                t_bt=t_bt,
-                t_bt_layer=t_bt_layer
-            )
-            self.model_attr.calc_attributes()
-        elif number_of_elements == 5:
-            self.model_attr = FiveElement(
-                thermal_zone=self,
-                merge_windows=merge_windows,
-                t_bt=t_bt)
-            self.model_attr.calc_attributes()
+        Parameters
+        ----------
+        number_of_elements : int
+            Model order (1 to 5) in model_attrs
+        """
+        try:
+            self.model_attr = self.model_attrs[number_of_elements]
+        except KeyError:
+            raise ValueError(
+                "Model with " + str(number_of_elements) + " elements has not "
+                "been calculated for thermal zone " + str(self.name)
+                + ", calculated are: " + str(sorted(self.model_attrs)))
+
+    @staticmethod
+    def _model_orders(number_of_elements):
+        """Returns number_of_elements of calc_zone_parameters() as a list"""
+        if isinstance(number_of_elements, (list, tuple)):
+            return list(number_of_elements)
+        return [number_of_elements]
+
+    def calc_signature(
+            self,
+            number_of_elements=2,
+            merge_windows=False,
+            t_bt=5,
+            t_bt_layer=7
+    ):
+        """Returns the inputs of calc_zone_parameters() for change tracking
+
+        The signature holds the calculation options, the zone attributes
+        that are used by the calculation and the signatures of all building
+        elements (see BuildingElement.calc_signature()). The signature of
+        the last calculation is stored in the zone, a zone whose signature
+        is still the same doesn't need to be calculated again. The
+        signature is a snapshot of values, so it also detects changes of
+        plain attributes and of layers and materials.
+
+        Parameters
+        ----------
+        number_of_elements : int or list
+            defines the number of elements, that area aggregated, between 1
+            and 5, default is 2
+        merge_windows : bool
+            True for merging the windows into the outer walls, False for
+            separate resistance for window, default is False
+        t_bt : float
+            Time constant according to VDI 6007 (default t_bt = 5)
+        t_bt_layer: float
+            Time constant according to VDI 6007 for aggragation of layers
+            (default t_bt = 7)
+
+        Returns
+        -------
+        signature : tuple
+            Inputs of the calculation of this zone
+        """
+        use_cond = self._use_conditions
+        if use_cond is not None:
+            use_cond_signature = (
+                use_cond.base_infiltration,
+                use_cond.normative_infiltration,
+                use_cond.with_heating)
+        else:
+            use_cond_signature = None
+        project = self.parent.parent if self.parent is not None else None
+        orders = tuple(self._model_orders(number_of_elements))
+        if 5 in orders and self.parent is not None:
+            # heating of the adjacent zones enters the heat load
+            neighbours = tuple(
+                (zone, zone.use_conditions is not None
+                 and zone.use_conditions.with_heating)
+                for zone in self.parent.thermal_zones)
+        else:
+            neighbours = None
+        return (
+            orders, merge_windows, t_bt, t_bt_layer,
+            self._volume, self._t_inside, self._t_outside, self._t_ground,
+            self._t_ground_amplitude, self.density_air, self.heat_capac_air,
+            project.t_soil_mode if project is not None else None,
+            use_cond_signature, neighbours,
+            tuple(element.calc_signature() for element in self._outer_walls),
+            tuple(element.calc_signature() for element in self._doors),
+            tuple(element.calc_signature() for element in self._rooftops),
+            tuple(element.calc_signature()
+                  for element in self._ground_floors),
+            tuple(element.calc_signature() for element in self._windows),
+            tuple(element.calc_signature() for element in self._inner_walls),
+            tuple(element.calc_signature() for element in self._floors),
+            tuple(element.calc_signature() for element in self._ceilings),
+            tuple(element.calc_signature()
+                  for element in self._interzonal_walls),
+            tuple(element.calc_signature()
+                  for element in self._interzonal_floors),
+            tuple(element.calc_signature()
+                  for element in self._interzonal_ceilings))
 
     def find_walls(self, orientation, tilt):
         """Returns all outer walls with given orientation and tilt
@@ -379,6 +529,22 @@ class ThermalZone(object):
                 pass
         return elements
 
+    def facade_index(self):
+        """Returns the outer elements grouped by orientation and tilt
+
+        Groups outer walls, rooftops, ground floors, windows and the
+        interzonal elements lumped with them (see find_izes_outer()) in one
+        pass. Use it instead of the find functions when looking up many
+        facades, as the calculation models do in _fill_zone_lists(). The
+        index is not updated if elements are added or changed afterwards.
+
+        Returns
+        -------
+        facades : FacadeIndex()
+            Elements of this zone grouped by kind, orientation and tilt.
+        """
+        return FacadeIndex(self)
+
     def set_inner_wall_area(self):
         """Sets the inner wall area according to zone area
 
@@ -537,9 +703,11 @@ class ThermalZone(object):
         thermal_zones list in the parent Building.
         """
         for index, tz in enumerate(self.parent.thermal_zones):
-            if tz.internal_id == self.internal_id:
+            if tz is self:
                 self.parent.net_leased_area -= self.area
                 self.parent.thermal_zones.pop(index)
+                self.parent.fill_outer_area_dict()
+                self.parent.fill_window_area_dict()
 
                 break
 
@@ -597,8 +765,17 @@ class ThermalZone(object):
         import inspect
         if value is not None:
             if inspect.isclass(Building):
+                if hasattr(self, "internal_id"):
+                    # keep ids unique within the project
+                    utilities.renew_internal_ids(
+                        self, utilities.get_id_allocator(value))
                 self.__parent = value
                 self.__parent.thermal_zones.append(self)
+                if hasattr(self, "_windows"):
+                    # zone with elements is moved to a building
+                    for element in (self.outer_walls + self.rooftops
+                                    + self.ground_floors + self.windows):
+                        element.update_building_area()
 
     @property
     def name(self):
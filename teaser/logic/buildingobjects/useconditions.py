@@ -1,15 +1,51 @@
 """This module contains UseConditions class."""
-import random
 from builtins import ValueError
 
+import numpy as np
 import pandas as pd
-from itertools import cycle, islice
-from collections import OrderedDict
 
 import teaser.data.input.usecond_input as usecond_input
 import teaser.data.output.usecond_output as usecond_output
+import teaser.logic.utilities as utilities
 from teaser.logic.utilities import division_from_json
 import warnings
+from teaser.logic.buildingobjects.profile import intern_profile
+
+# columns of UseConditions.schedules
+_profile_names = (
+    "heating_profile",
+    "cooling_profile",
+    "persons_profile",
+    "lighting_profile",
+    "machines_profile",
+)
+
+def _make_profile(value, name):
+    """Returns the interned profile for the given values
+
+    Parameters
+    ----------
+    value : list, numpy.ndarray or float
+        Hourly values of the profile or one value for all hours
+    name : str
+        Name of the profile for the error message
+
+    Returns
+    -------
+    profile : Profile
+        Shared profile with a period of 24, 168 or 8760 hours
+    """
+    if isinstance(value, (list, tuple, np.ndarray)):
+        profile = np.asarray(value, dtype=float)
+    else:
+        profile = np.full(24, value, dtype=float)
+    if profile.ndim != 1 or not UseConditions.is_periodic(profile):
+        raise ValueError(
+            f"{name} should be periodic (24h, 168h pr 8760h), "
+            f"but length is {len(profile)}"
+        )
+    return intern_profile(profile)
+
 
 class UseConditions(object):
     """UseConditions class contains all zone specific boundary conditions.
@@ -212,7 +248,10 @@ class UseConditions(object):
           - heating_set_back
           - cooling_set_back
         To take adjustments into account you need to call calc_schedules()
-        function afterwards.
+        function afterwards. The DataFrame is cached until the profiles
+        change, each use condition has its own frame. Edits of the frame
+        are not written back to the profiles, setting schedules sets the
+        profiles from the columns of the given DataFrame.
         Note: python attribute, not customizable by user (derived from Json)
     adjusted_opening_times: list
         Sets the first and last hour of opening. These will cut or extend the
@@ -239,7 +278,7 @@ class UseConditions(object):
 
     def __init__(self, parent=None):
         """Construct UseConditions."""
-        self.internal_id = random.random()
+        self.internal_id = utilities.get_id_allocator(parent).next_id()
 
         self.parent = parent
         self.usage = "Single office"
@@ -291,7 +330,7 @@ class UseConditions(object):
 
         self._with_ideal_thresholds = False
 
-        self._heating_profile = [
+        self.heating_profile = [
             294.15,
             294.15,
             294.15,
@@ -317,7 +356,7 @@ class UseConditions(object):
             294.15,
             294.15,
         ]
-        self._cooling_profile = [
+        self.cooling_profile = [
             294.15,
             294.15,
             294.15,
@@ -343,7 +382,7 @@ class UseConditions(object):
             294.15,
             294.15,
         ]
-        self._persons_profile = [
+        self.persons_profile = [
             0.0,
             0.0,
             0.0,
@@ -369,7 +408,7 @@ class UseConditions(object):
             0.0,
             0.0,
         ]
-        self._machines_profile = [
+        self.machines_profile = [
             0.1,
             0.1,
             0.1,
@@ -395,7 +434,7 @@ class UseConditions(object):
             0.1,
             0.1,
         ]
-        self._lighting_profile = [
+        self.lighting_profile = [
             0.0,
             0.0,
             0.0,
@@ -424,61 +463,59 @@ class UseConditions(object):
 
         self._schedules = None
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # the schedules are rebuilt from the profiles, not pickled
+        state["_schedules"] = None
+        return state
+
     def adjust_profile_by_opening(self, profile):
         """Adjusts the given profile by opening times specified for use
-        condition with the parameter self.set_back_times.
+        condition with the parameter self.adjusted_opening_times.
+
+        Every day of the profile is adjusted: outside of the opening times
+        the values are set to the baseload (first value of the day), inside
+        of them baseload values are replaced by the first (first half of
+        the day) or last value above the baseload.
 
         Parameters
         ----------
         profile : list
             list with the given profile (lighting, machines, persons)
+
+        Returns
+        -------
+        new_profile : list
+            adjusted profile
         """
-        new_profile = []
-        # split profile into daily profiles
-        profile_len = len(profile)
-        n_sublists = profile_len // 24
-        daily_profiles = (profile[i * 24:(i + 1) * 24] for i in
-                          range(n_sublists))
+        return self._adjust_by_opening(np.asarray(profile, dtype=float)) \
+            .tolist()
+
+    def _adjust_by_opening(self, profile):
+        """Array version of adjust_profile_by_opening()
+
+        The hours are processed in order as the replacement values depend
+        on the hours adjusted before, all days at once.
+        """
+        days = profile.reshape(-1, 24).copy()
+        baseload = days[:, 0].copy()
+        rows = np.arange(len(days))
         opening_hour_index = self.adjusted_opening_times[0] - 1
         closing_hour_index = self.adjusted_opening_times[1] - 1
-
-        for profile_day in daily_profiles:
-            baseload = profile_day[0]
-            for i, value in enumerate(profile_day):
-                # check if runtime variable(time) is inside opening times
-                #  +/- delta times
-                if opening_hour_index <= i <= closing_hour_index:
-                    if value == baseload:
-                        # start new iteration of profile_day from beginning
-                        for j, value2 in enumerate(profile_day):
-                            # search first value which is > baseload
-                            # if
-                            if (
-                                    value2 > baseload and i < (
-                                    closing_hour_index - opening_hour_index) / 2
-                            ):
-                                profile_day[i] = profile_day[j]
-                                break
-                            elif (
-                                    value2 > baseload and i >= (
-                                    closing_hour_index - opening_hour_index) / 2
-                            ):
-                                # value is overwritten every time,
-                                # so that last value that is > baseload
-                                # is used
-                                profile_day[i] = value2
-                            else:
-                                pass
-                    else:
-                        pass
-                elif not (
-                        opening_hour_index <= i <= closing_hour_index) and \
-                        value != baseload:
-                    # if time is not inside opening times, set value to
-                    # baseload
-                    profile_day[i] = baseload
-            new_profile.extend(profile_day)
-            return new_profile
+        half = (closing_hour_index - opening_hour_index) / 2
+
+        for i in range(24):
+            if not opening_hour_index <= i <= closing_hour_index:
+                days[:, i] = baseload
+                continue
+            above = days > baseload[:, np.newaxis]
+            if i < half:
+                source = above.argmax(axis=1)
+            else:
+                source = 23 - above[:, ::-1].argmax(axis=1)
+            replace = (days[:, i] == baseload) & above.any(axis=1)
+            days[replace, i] = days[rows[replace], source[replace]]
+        return days.ravel()
 
     def adjust_profile_by_weekend(self, profile):
         """Scales the given profile on weekends. Factor for scaling is taken
@@ -488,26 +525,35 @@ class UseConditions(object):
         ----------
         profile : list
             list with the given profile (lighting, machines, persons)
+
+        Returns
+        -------
+        new_profile : list
+            scaled profile, at least one week long
         """
-        new_profile = []
+        return self._adjust_by_weekend(np.asarray(profile, dtype=float)) \
+            .tolist()
+
+    def _adjust_by_weekend(self, profile):
+        """Array version of adjust_profile_by_weekend()"""
         # check if profile is at least week profile (other cases
         # than 24, 168,8760 are excluded already)
         if len(profile) == 24:
-            profile = profile * 7
-        n_sublists = len(profile) // 24
-        daily_profiles = (profile[i * 24:(i + 1) * 24] for i in
-                          range(n_sublists))
-        weekend_days = []
-        for i in range(self.first_saturday_of_year, 365, 7):
-            weekend_days.append(i)
-            weekend_days.append(i + 1)
-        for day_nr, profile_day in enumerate(daily_profiles, 1):
-            if day_nr in weekend_days:
-                profile_day = \
-                    [round((x * self.profiles_weekend_factor), 3)
-                     for x in profile_day]
-            new_profile.extend(profile_day)
-        return new_profile
+            profile = np.tile(profile, 7)
+        days = profile.reshape(-1, 24).copy()
+        # saturdays start at first_saturday_of_year, the following sundays
+        # are weekend days as well
+        day_nr = np.arange(1, len(days) + 1)
+        saturday = (day_nr >= self.first_saturday_of_year) & (day_nr < 365) \
+            & ((day_nr - self.first_saturday_of_year) % 7 == 0)
+        weekend = saturday | np.concatenate([[False], saturday[:-1]])
+        # round() is exact for decimal ties, np.round() is not. Profiles
+        # have few distinct values, so only these are rounded
+        values, inverse = np.unique(
+            days[weekend] * self.profiles_weekend_factor, return_inverse=True)
+        rounded = np.array([round(value, 3) for value in values.tolist()])
+        days[weekend] = rounded[inverse].reshape(-1, 24)
+        return days.ravel()
 
     def load_use_conditions(self, zone_usage, data_class=None):
         """Load typical use conditions from JSON data base.
@@ -552,11 +598,9 @@ class UseConditions(object):
 
         Parameters
         ----------
-        profile_list: list
+        profile_list: list or numpy.ndarray
             given profile as list of hourly values.
         """
-        if not isinstance(profile_list, list):
-            profile_list = list(profile_list)
         profile_len = len(profile_list)
         if profile_len in [24, 168, 8760]:
             return True
@@ -569,7 +613,7 @@ class UseConditions(object):
 
     @persons.setter
     def persons(self, value):
-        if isinstance(value, OrderedDict):
+        if isinstance(value, dict):
             self._persons = division_from_json(value)
         else:
             self._persons = value
@@ -584,108 +628,98 @@ class UseConditions(object):
 
     @property
     def heating_profile(self):
-        return self._heating_profile
+        return self._heating_profile.values.tolist()
 
     @heating_profile.setter
     def heating_profile(self, value):
-        if not isinstance(value, list):
-            value = [value] * 24
-        if self.is_periodic(value):
-            self._heating_profile = value
-        else:
-            raise ValueError(
-                f"heating profile should be periodic (24h, 168h pr 8760h), "
-                f"but length is {len(value)}"
-            )
+        self._heating_profile = _make_profile(value, "heating profile")
+        self._schedules = None
 
     @property
     def cooling_profile(self):
-        return self._cooling_profile
+        return self._cooling_profile.values.tolist()
 
     @cooling_profile.setter
     def cooling_profile(self, value):
-        if not isinstance(value, list):
-            value = [value] * 24
-        if self.is_periodic(value):
-            self._cooling_profile = value
-        else:
-            raise ValueError(
-                f"cooling profile should be periodic (24h, 168h pr 8760h), "
-                f"but length is {len(value)}"
-            )
+        self._cooling_profile = _make_profile(value, "cooling profile")
+        self._schedules = None
 
     @property
     def persons_profile(self):
-        return self._persons_profile
+        return self._persons_profile.values.tolist()
 
     @persons_profile.setter
     def persons_profile(self, value):
-        if not isinstance(value, list):
-            value = [value] * 24
-        if self.is_periodic(value):
-            self._persons_profile = value
-        else:
-            raise ValueError(
-                f"persons profile should be periodic (24h, 168h pr 8760h), "
-                f"but length is {len(value)}"
-            )
+        self._persons_profile = _make_profile(value, "persons profile")
+        self._schedules = None
 
     @property
     def machines_profile(self):
-        return self._machines_profile
+        return self._machines_profile.values.tolist()
 
     @machines_profile.setter
     def machines_profile(self, value):
-        if not isinstance(value, list):
-            value = [value] * 24
-        if self.is_periodic(value):
-            self._machines_profile = value
-        else:
-            raise ValueError(
-                f"machines profile should be periodic (24h, 168h pr 8760h), "
-                "but length is {len(value)}"
-            )
+        self._machines_profile = _make_profile(value, "machines profile")
+        self._schedules = None
 
     @property
     def lighting_profile(self):
-        return self._lighting_profile
+        return self._lighting_profile.values.tolist()
 
     @lighting_profile.setter
     def lighting_profile(self, value):
-        if not isinstance(value, list):
-            value = [value] * 24
-        if self.is_periodic(value):
-            self._lighting_profile = value
-        else:
-            raise ValueError(
-                f"lighting profile should be periodic (24h, 168h pr 8760h), "
-                "but length is {len(value)}"
-            )
+        self._lighting_profile = _make_profile(value, "lighting profile")
+        self._schedules = None
 
     @property
     def schedules(self):
-        self._schedules = pd.DataFrame(
-            index=pd.date_range("2019-01-01 00:00:00", periods=8760,
-                                freq="h").to_series().dt.strftime(
-                "%m-%d %H:%M:%S"),
-            data={
-                "heating_profile": list(
-                    islice(cycle(self._heating_profile), 8760)),
-                "cooling_profile": list(
-                    islice(cycle(self._cooling_profile), 8760)),
-                "persons_profile": list(
-                    islice(cycle(self._persons_profile), 8760)),
-                "lighting_profile": list(
-                    islice(cycle(self._lighting_profile), 8760)),
-                "machines_profile": list(
-                    islice(cycle(self._machines_profile), 8760)),
-            },
-        )
+        # workers of parallel calculations may hold a placeholder instead
+        if not isinstance(self._schedules, pd.DataFrame):
+            # each zone gets its own (editable) frame, only the index and
+            # the read-only profile arrays are shared
+            self._schedules = pd.DataFrame(
+                index=utilities.get_hourly_index(),
+                data={
+                    name: getattr(self, "_" + name).hourly()
+                    for name in _profile_names
+                },
+                copy=True,
+            )
         return self._schedules
 
     @schedules.setter
     def schedules(self, value):
-        self._schedules = value
+        if value is not None:
+            for name in _profile_names:
+                if name in value:
+                    setattr(self, name, value[name].tolist())
+        self._schedules = None
+
+    @property
+    def schedules_key(self):
+        """Key of the profiles, equal for use conditions with equal schedules
+
+        Exporters can use it to detect identical schedules of zones.
+        """
+        return tuple(getattr(self, "_" + name).key for name in _profile_names)
+
+    def get_profile(self, name):
+        """Returns the profile of the given name as Profile
+
+        The values of the Profile hold one period of the profile, exporters
+        can write them without expanding the schedules to one year.
+
+        Parameters
+        ----------
+        name : str
+            Name of the profile (e.g. "heating_profile")
+
+        Returns
+        -------
+        profile : Profile
+            Read-only profile (see teaser.logic.buildingobjects.profile)
+        """
+        return getattr(self, "_" + name)
 
     def calc_adj_schedules(self):
         """calculates adjusted schedules for use conditions. When called the
@@ -694,40 +728,32 @@ class UseConditions(object):
         with 8760 h.
 
         """
-        if self.adjusted_opening_times:
-            self._machines_profile = self.adjust_profile_by_opening(
-                self._machines_profile)
-            self._lighting_profile = self.adjust_profile_by_opening(
-                self._lighting_profile)
-            self._persons_profile = self.adjust_profile_by_opening(
-                self._persons_profile)
-
-        if self.profiles_weekend_factor:
-            self._machines_profile = self.adjust_profile_by_weekend(
-                self._machines_profile)
-            self._lighting_profile = self.adjust_profile_by_weekend(
-                self._lighting_profile)
-            self._persons_profile = self.adjust_profile_by_weekend(
-                self._persons_profile)
+        adjusted = {}
+        for name in ("machines_profile", "lighting_profile",
+                     "persons_profile"):
+            profile = getattr(self, "_" + name).values
+            if self.adjusted_opening_times:
+                profile = self._adjust_by_opening(profile)
+            if self.profiles_weekend_factor:
+                profile = self._adjust_by_weekend(profile)
+            adjusted[name] = profile
 
         if self.set_back_times:
             set_back_index_morning, set_back_index_evening = \
                 self.set_back_times[0] - 1, self.set_back_times[1] - 1
-            heating_profile, cooling_profile = [], []
-            for i, value in enumerate(self._heating_profile):
-                if 0 <= i <= set_back_index_morning \
-                        or set_back_index_evening <= i <= 24:
-                    heating_profile.append(value + self.heating_set_back)
-                else:
-                    heating_profile.append(value)
-            self._heating_profile = heating_profile
-            for i, value in enumerate(self._cooling_profile):
-                if 0 <= i <= set_back_index_morning \
-                        or set_back_index_evening <= i <= 24:
-                    cooling_profile.append(value + self.cooling_set_back)
-                else:
-                    cooling_profile.append(value)
-            self._cooling_profile = cooling_profile
+            for name, set_back in (
+                    ("heating_profile", self.heating_set_back),
+                    ("cooling_profile", self.cooling_set_back)):
+                profile = getattr(self, "_" + name).values
+                hour = np.arange(len(profile)) % 24
+                adjusted[name] = np.where(
+                    (hour <= set_back_index_morning)
+                    | (hour >= set_back_index_evening),
+                    profile + set_back,
+                    profile)
+
+        for name, profile in adjusted.items():
+            setattr(self, name, profile)
 
     @property
     def adjusted_opening_times(self):
@@ -0,0 +1,200 @@
+# created October 2026
+
+import numpy as np
+import pandas as pd
+
+
+class HeatLoadTable(object):
+    """Static heat loads of many zones for many temperatures
+
+    Collects heat_load_outside_factor and heat_load_ground_factor of the
+    calculated models (model_attr) of all zones once. Heat loads are then
+    evaluated for arrays of temperatures without accessing the buildings
+    again:
+
+        heat_load = heat_load_outside_factor * (t_inside - t_outside)
+            + heat_load_ground_factor * (t_inside - t_ground)
+
+    with t_ground reduced by t_ground_amplitude for t_soil_mode 2, as in
+    the _calc_heat_load() of the models. Changes of the buildings after the
+    table was created are not reflected, create a new table after
+    recalculating them.
+
+    Temperatures broadcast against the zones on the last axis: a scalar
+    applies to all zones, an array of shape (n_zones,) gives one value per
+    zone (see building_values() for one value per building) and a column
+    of shape (n, 1) evaluates n scenarios for all zones.
+
+    Parameters
+    ----------
+
+    buildings : list
+        Calculated buildings (see Building.calc_building_parameter())
+
+    Attributes
+    ----------
+
+    building_names : list
+        Names of the buildings
+    zone_names : list
+        Names of the zones, in the order of the zone axis
+    building_index : numpy.ndarray
+        Index of the building (in building_names) of each zone
+    outside_factor : numpy.ndarray [W/K]
+        heat_load_outside_factor of each zone
+    ground_factor : numpy.ndarray [W/K]
+        heat_load_ground_factor of each zone
+    t_inside : numpy.ndarray [K]
+        Normative indoor temperature of each zone
+    t_outside : numpy.ndarray [K]
+        Normative outdoor temperature of each zone, used if no t_outside is
+        given
+    t_ground : numpy.ndarray [K]
+        Temperature at the outer side of ground floors of each zone, used if
+        no t_ground is given
+    t_ground_amplitude : numpy.ndarray [K]
+        Amplitude of the ground temperature of each zone
+    t_soil_mode : numpy.ndarray
+        t_soil_mode of the project of each zone, used if no t_soil_mode is
+        given
+
+    """
+
+    def __init__(self, buildings):
+        self.building_names = []
+        self.zone_names = []
+        building_index = []
+        columns = []
+        for index, bldg in enumerate(buildings):
+            self.building_names.append(bldg.name)
+            for zone in bldg.thermal_zones:
+                model_attr = getattr(zone, "model_attr", None)
+                if model_attr is None:
+                    raise ValueError(
+                        "Thermal zone " + str(zone.name) + " in building "
+                        + str(bldg.name) + " has not been calculated")
+                self.zone_names.append(zone.name)
+                building_index.append(index)
+                columns.append((
+                    model_attr.heat_load_outside_factor,
+                    model_attr.heat_load_ground_factor,
+                    zone.t_inside,
+                    zone.t_outside,
+                    zone.t_ground,
+                    zone.t_ground_amplitude,
+                    bldg.parent.t_soil_mode if bldg.parent is not None
+                    else 1))
+        self.building_index = np.array(building_index, dtype=int)
+        (self.outside_factor,
+         self.ground_factor,
+         self.t_inside,
+         self.t_outside,
+         self.t_ground,
+         self.t_ground_amplitude,
+         self.t_soil_mode) = np.array(
+            columns, dtype=float).reshape(-1, 7).T
+        # zone x building matrix that sums the zones of each building
+        self._membership = np.zeros(
+            (len(self.zone_names), len(self.building_names)))
+        self._membership[
+            np.arange(len(self.zone_names)), self.building_index] = 1.0
+
+    def building_values(self, values):
+        """Maps values per building to the zones
+
+        Parameters
+        ----------
+
+        values : array_like
+            Values with one entry per building on the last axis, e.g.
+            t_outside of the location of each building
+
+        Returns
+        -------
+
+        zone_values : numpy.ndarray
+            Values with one entry per zone on the last axis
+
+        """
+        return np.asarray(values, dtype=float)[..., self.building_index]
+
+    def zone_heat_load(self, t_outside=None, t_ground=None, t_soil_mode=None):
+        """Static heat load of each zone
+
+        Parameters
+        ----------
+
+        t_outside : array_like [K]
+            Normative outdoor temperatures, default is None, which uses
+            the t_outside of the zones
+        t_ground : array_like [K]
+            Temperatures at the outer side of ground floors, default is
+            None, which uses the t_ground of the zones
+        t_soil_mode : array_like
+            t_soil_mode (1, 2 or 3), default is None, which uses the
+            t_soil_mode of the projects
+
+        Returns
+        -------
+
+        heat_load : numpy.ndarray [W]
+            Heat loads with the zones on the last axis, the other axes
+            follow from broadcasting the temperatures
+
+        """
+        if t_outside is None:
+            t_outside = self.t_outside
+        if t_ground is None:
+            t_ground = self.t_ground
+        if t_soil_mode is None:
+            t_soil_mode = self.t_soil_mode
+        t_ground = np.where(
+            np.asarray(t_soil_mode) == 2,
+            t_ground - self.t_ground_amplitude,
+            t_ground)
+        return (self.outside_factor * (self.t_inside - t_outside)
+                + self.ground_factor * (self.t_inside - t_ground))
+
+    def building_heat_load(
+            self, t_outside=None, t_ground=None, t_soil_mode=None):
+        """Static heat load of each building (sum of its zones)
+
+        Parameters are the same as for zone_heat_load().
+
+        Returns
+        -------
+
+        heat_load : numpy.ndarray [W]
+            Heat loads with the buildings on the last axis
+
+        """
+        return self.zone_heat_load(
+            t_outside=t_outside,
+            t_ground=t_ground,
+            t_soil_mode=t_soil_mode) @ self._membership
+
+    def to_dataframe(self):
+        """Returns the collected factors and temperatures as DataFrame
+
+        Returns
+        -------
+
+        table : pandas.DataFrame
+            One row per zone, indexed by the names of building and zone
+
+        """
+        return pd.DataFrame(
+            {
+                "heat_load_outside_factor": self.outside_factor,
+                "heat_load_ground_factor": self.ground_factor,
+                "t_inside": self.t_inside,
+                "t_outside": self.t_outside,
+                "t_ground": self.t_ground,
+                "t_ground_amplitude": self.t_ground_amplitude,
+                "t_soil_mode": self.t_soil_mode,
+                "heat_load": self.zone_heat_load(),
+            },
+            index=pd.MultiIndex.from_arrays(
+                [[self.building_names[i] for i in self.building_index],
+                 self.zone_names],
+                names=["building", "zone"]))
@@ -0,0 +1,395 @@
+# created October 2026
+
+import copy
+import io
+import math
+import multiprocessing
+import pickle
+import sys
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+
+# Pickler.reducer_override(), which writes the references to the objects
+# of the calling process, exists from Python 3.8 on. Without it the
+# workers' results would be detached copies, so calc_all_buildings()
+# calculates sequentially on older versions.
+supported = sys.version_info >= (3, 8)
+
+# objects that references in pickles resolve to, see _resolve()
+_context = {}
+
+
+def calc_buildings(project, buildings, n_workers, **calc_kwargs):
+    """Calculates buildings in a pool of worker processes
+
+    Splits the buildings into chunks, the workers run
+    Building.calc_building_parameter() on copies of them. Where processes
+    can be forked, the workers inherit the buildings, otherwise the chunks
+    are pickled and shipped to them. The calculated state of the buildings,
+    their thermal zones and building elements is merged back into the
+    original objects, so references to them (e.g. the return value of
+    Project.add_residential()) stay valid. The new model_attr objects draw
+    their internal_id from the project in the order of the buildings, so
+    the results (including ids) do not depend on the number of workers.
+
+    The results are merged one building after the other while iterating
+    over the returned generator. Warnings of the calculation are issued
+    again in the calling process, exceptions are returned instead of
+    raised, and buildings whose calculation raised are not merged.
+    Zones that are skipped by an incremental calculation keep their
+    models (model_attr and model_attrs) and their internal_id.
+
+    Parameters
+    ----------
+
+    project : Project()
+        Project the buildings belong to
+    buildings : list
+        Buildings to calculate, in the order in which the results are merged
+    n_workers : int
+        Number of worker processes
+    calc_kwargs : dict
+        Keyword arguments of Building.calc_building_parameter()
+
+    Yields
+    ------
+
+    bldg : Building()
+        Building with merged results, in the order of buildings
+    result : int
+        Return value of Building.calc_building_parameter(), None on error
+    error : Exception
+        Exception raised by the calculation of bldg, None on success
+
+    """
+    buildings = list(buildings)
+    n_chunks = min(len(buildings), 4 * n_workers)
+    if n_chunks == 0:
+        return
+    chunk_size = int(math.ceil(len(buildings) / n_chunks))
+    chunks = [buildings[i:i + chunk_size]
+              for i in range(0, len(buildings), chunk_size)]
+    # the objects that the results of the workers refer to
+    shared = [_shared_objects(project, chunk) for chunk in chunks]
+
+    if "fork" in multiprocessing.get_all_start_methods():
+        # forked workers find the chunks in _context, nothing is shipped
+        _context.clear()
+        _context["project"] = project
+        _context["chunks"] = chunks
+        pool = ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=multiprocessing.get_context("fork"))
+        payloads = range(len(chunks))
+    else:
+        pool = ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_worker,
+            initargs=(_dump_project(project),))
+        payloads = []
+        for chunk, chunk_shared in zip(chunks, shared):
+            payload, frames = _dump_chunk(project, chunk)
+            payloads.append(payload)
+            chunk_shared.update(frames)
+    try:
+        with pool as executor:
+            futures = [executor.submit(_calc_chunk, payload, calc_kwargs)
+                       for payload in payloads]
+            results = [future.result() for future in futures]
+    finally:
+        _context.clear()
+
+    for chunk, chunk_shared, chunk_result in zip(chunks, shared, results):
+        outcomes = _load_result(chunk_shared, chunk_result)
+        for bldg, (result, error, caught, states) in zip(chunk, outcomes):
+            for message, category, filename, lineno in caught:
+                warnings.warn_explicit(message, category, filename, lineno)
+            if error is None:
+                # keeps the former models alive, so their ids stay unique
+                former = {id(model_attr): model_attr
+                          for zone in bldg.thermal_zones
+                          for model_attr in _model_attrs(zone)}
+                for key, state in states:
+                    _set_state(chunk_shared[key], state)
+                for zone in bldg.thermal_zones:
+                    for model_attr in zone.model_attrs.values():
+                        if id(model_attr) not in former:
+                            model_attr.internal_id = \
+                                project.id_allocator.next_id()
+            yield bldg, result, error
+
+
+def _shared_objects(project, chunk):
+    """Objects of a chunk that exist in the calling process and the worker
+
+    Both processes number the objects in the same order, the results of
+    the worker refer to them by these numbers.
+
+    Returns
+    -------
+
+    shared : dict
+        Dictionary with number: object
+
+    """
+    objects = [project]
+    if project.data is not None:
+        objects.append(project.data)
+    for bldg in chunk:
+        objects.append(bldg)
+        if bldg.library_attr is not None:
+            objects.append(bldg.library_attr)
+        if bldg.central_ahu is not None:
+            objects.append(bldg.central_ahu)
+        for zone in bldg.thermal_zones:
+            objects.append(zone)
+            objects.extend(_model_attrs(zone))
+            if zone.use_conditions is not None:
+                objects.append(zone.use_conditions)
+            for element in _elements(zone):
+                objects.append(element)
+                for layer in element.layer:
+                    objects.append(layer)
+                    objects.append(layer.material)
+    return dict(enumerate(objects))
+
+
+def _model_attrs(zone):
+    """Returns model_attr and the other calculated models of a zone"""
+    model_attr = getattr(zone, "model_attr", None)
+    model_attrs = [model_attr] if model_attr is not None else []
+    for other in zone.model_attrs.values():
+        if other is not model_attr:
+            model_attrs.append(other)
+    return model_attrs
+
+
+def _elements(zone):
+    return (zone.outer_walls + zone.doors + zone.rooftops + zone.ground_floors
+            + zone.windows + zone.inner_walls + zone.floors + zone.ceilings
+            + zone.interzonal_walls + zone.interzonal_floors
+            + zone.interzonal_ceilings)
+
+
+def _calculated_objects(bldg):
+    """Objects whose state is changed by Building.calc_building_parameter"""
+    yield bldg
+    for zone in bldg.thermal_zones:
+        yield zone
+        for element in _elements(zone):
+            yield element
+
+
+class _NotShipped(object):
+    """Placeholder for a DataFrame that is not shipped to the workers
+
+    Schedules (DataFrames with 8760 rows) are not needed for the
+    calculation, but make up most of the pickled size of a building. They
+    stay in the calling process and the workers get this placeholder.
+
+    """
+
+    def __init__(self, key):
+        self.key = key
+
+    def __getattr__(self, name):
+        raise RuntimeError(
+            "Schedules are not available in the worker processes of "
+            "calc_all_buildings(n_workers=...)")
+
+    def __getitem__(self, key):
+        self.__getattr__(key)
+
+
+class _Pickler(pickle.Pickler):
+    """Pickler that writes references instead of some objects
+
+    Objects in references (id(obj): key) are written as _resolve(key), the
+    unpickling process resolves them with its own _context. If frames is a
+    dict, DataFrames are added to it and written as references as well.
+
+    """
+
+    def __init__(self, file, references, frames=None):
+        super(_Pickler, self).__init__(
+            file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.references = references
+        self.frames = frames
+
+    def reducer_override(self, obj):
+        key = self.references.get(id(obj))
+        if key is not None:
+            return _resolve, (key,)
+        if isinstance(obj, _NotShipped):
+            return _resolve, (obj.key,)
+        if self.frames is not None and isinstance(obj, pd.DataFrame):
+            key = ("frame", len(self.frames))
+            self.frames[key] = obj
+            return _resolve, (key,)
+        return NotImplemented
+
+
+def _resolve(key):
+    """Returns the object of a reference written by _Pickler"""
+    try:
+        return _context[key]
+    except KeyError:
+        if isinstance(key, tuple) and key[0] == "frame":
+            return _NotShipped(key)
+        raise
+
+
+def _dump_project(project):
+    """Pickles the project without its buildings for the workers"""
+    stand_in = copy.copy(project)
+    stand_in.buildings = []
+    stand_in._building_index = {}
+    return pickle.dumps(stand_in, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _init_worker(project_payload):
+    _context.clear()
+    _context["project"] = pickle.loads(project_payload)
+
+
+def _dump_chunk(project, chunk):
+    """Pickles a chunk of buildings to ship it to a worker
+
+    The project and DataFrames are not pickled. Returns the pickled
+    buildings and the DataFrames by their keys ("frame", number).
+
+    """
+    references = {id(project): "project"}
+    if project.data is not None:
+        references[id(project.data)] = "data"
+    stream = io.BytesIO()
+    frames = {}
+    _Pickler(stream, references, frames).dump(chunk)
+    return stream.getvalue(), frames
+
+
+def _load_chunk(payload):
+    """Unpickles a chunk shipped by _dump_chunk() in a worker"""
+    project = _context["project"]
+    _context["data"] = project.data
+    return pickle.loads(payload)
+
+
+def _load_result(shared, result):
+    """Unpickles the result of a chunk, see _calc_chunk()"""
+    _context.clear()
+    _context.update(shared)
+    try:
+        return pickle.loads(result)
+    finally:
+        _context.clear()
+
+
+def _calc_chunk(chunk, calc_kwargs):
+    """Calculates a chunk of buildings in a worker process
+
+    chunk is the number of the chunk in _context for forked workers and
+    the pickled chunk otherwise.
+
+    Returns, pickled, a tuple (result, error, warnings, states) for each
+    building.
+    states holds the state of the building, its zones and elements after
+    the calculation. Objects of _shared_objects() are pickled as references
+    to the objects of the calling process, new objects (e.g. model_attr)
+    are pickled as a whole.
+
+    """
+    if isinstance(chunk, bytes):
+        chunk = _load_chunk(chunk)
+    else:
+        chunk = _context["chunks"][chunk]
+    shared = _shared_objects(_context["project"], chunk)
+    references = {id(obj): key for key, obj in shared.items()}
+
+    outcomes = []
+    for bldg in chunk:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            try:
+                result = bldg.calc_building_parameter(**calc_kwargs)
+                error = None
+            # any error is returned to the calling process, which raises it
+            # or removes the building as the sequential calculation does
+            except Exception as e:  # noqa: BLE001
+                result = None
+                error = e
+        if error is None:
+            states = [(references[id(obj)], _get_state(obj))
+                      for obj in _calculated_objects(bldg)]
+        else:
+            states = []
+        outcomes.append((
+            result,
+            error,
+            [(w.message, w.category, w.filename, w.lineno) for w in caught],
+            states))
+
+    stream = io.BytesIO()
+    _Pickler(stream, references).dump(outcomes)
+    return stream.getvalue()
+
+
+def _get_state(obj):
+    """Returns the state of obj as pickling does
+
+    object.__getstate__() only exists from Python 3.11 on, so the state
+    of classes without their own __getstate__ is built from the instance
+    dict and the slots, as a tuple (dict, slots) for slotted classes.
+
+    """
+    getstate = getattr(type(obj), "__getstate__", None)
+    if getstate is not None and getstate is not getattr(
+            object, "__getstate__", None):
+        return obj.__getstate__()
+    state = getattr(obj, "__dict__", None)
+    state = dict(state) if state else None
+    slot_state = {}
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name in ("__dict__", "__weakref__"):
+                continue
+            name = _mangle(cls, name)
+            # the slot descriptor of the class, a KeyError here is a bug
+            descriptor = cls.__dict__[name]
+            try:
+                slot_state[name] = descriptor.__get__(obj, cls)
+            except AttributeError:
+                # slot that was never set
+                continue
+    if slot_state:
+        return state, slot_state
+    return state
+
+
+def _mangle(cls, name):
+    """Returns the attribute name of a private slot as the compiler does"""
+    if name.startswith("__") and not name.endswith("__"):
+        class_name = cls.__name__.lstrip("_")
+        if class_name:
+            return "_" + class_name + name
+    return name
+
+
+def _set_state(obj, state):
+    """Sets the state of obj as unpickling does"""
+    setstate = getattr(obj, "__setstate__", None)
+    if setstate is not None:
+        setstate(state)
+        return
+    slot_state = None
+    if isinstance(state, tuple):
+        state, slot_state = state
+    if state:
+        vars(obj).update(state)
+    if slot_state:
+        for name, value in slot_state.items():
+            setattr(obj, name, value)
@@ -0,0 +1,151 @@
+# created October 2026
+
+import numpy as np
+import pandas as pd
+from teaser.logic.buildingobjects.calculation.one_element import OneElement
+from teaser.logic.buildingobjects.calculation.two_element import TwoElement
+from teaser.logic.buildingobjects.calculation.three_element import \
+    ThreeElement
+from teaser.logic.buildingobjects.calculation.four_element import FourElement
+from teaser.logic.buildingobjects.calculation.five_element import FiveElement
+from teaser.logic.parallel import _elements
+
+_model_classes = {
+    1: OneElement,
+    2: TwoElement,
+    3: ThreeElement,
+    4: FourElement,
+    5: FiveElement,
+}
+
+# lumped RC parameters of the models, i.e. attributes with these prefixes
+_rc_prefixes = ("r1_", "c1_", "r_rest_", "r_total_")
+
+# values of the building elements that are overwritten by calc_attributes()
+_element_results = (
+    "r1", "r2", "r3", "c1", "c2", "c1_korr", "ua_value", "u_value",
+    "r_conduc", "r_inner_conv", "r_inner_rad", "r_inner_comb",
+    "r_outer_conv", "r_outer_rad", "r_outer_comb", "wf_out",
+    "idx_orientation")
+
+# marks values that are not set on an element
+_missing = object()
+
+
+def sweep_time_constants(
+        buildings,
+        t_bt,
+        t_bt_layer=None,
+        number_of_elements=None,
+        merge_windows=None):
+    """Lumped RC parameters of all zones for a range of time constants
+
+    Evaluates the zone models for all values of t_bt in one calculation:
+    t_bt only enters the parallel connection of the RC branches (VDI 6007),
+    which is calculated for an array of frequencies at once (see
+    aggregation.calc_parallel_connection()). t_bt_layer changes the
+    equivalent resistances of the elements, so the models are calculated
+    once per value of t_bt_layer. The buildings are not changed, their
+    model_attr and the values of their elements stay as they are.
+
+    Parameters
+    ----------
+
+    buildings : list
+        Buildings to evaluate, their zones need use conditions and elements
+        as for Building.calc_building_parameter()
+    t_bt : array_like
+        Time constants according to VDI 6007 in days
+    t_bt_layer : float or array_like
+        Time constants according to VDI 6007 for the aggregation of layers
+        in days, every value is combined with every value of t_bt. Not used
+        by FiveElement. Default is None, which uses Building.t_bt_layer
+    number_of_elements : int
+        Model order (1 to 5). Default is None, which uses
+        Building.number_of_elements_calc
+    merge_windows : bool
+        Default is None, which uses Building.merge_windows_calc
+
+    Returns
+    -------
+
+    rc_parameters : pandas.DataFrame
+        One row per building, zone, t_bt and t_bt_layer (MultiIndex with
+        the names of buildings and zones), one column per lumped RC
+        parameter of the model (e.g. r1_ow, c1_ow, r_rest_ow, r1_iw,
+        c1_iw). Parameters of FiveElement per adjacent zone get the index
+        of the zone as suffix (e.g. r1_nzb_0). Parameters that a zone
+        doesn't have are NaN.
+
+    """
+    t_bt = np.atleast_1d(np.asarray(t_bt, dtype=float))
+    blocks = []
+    for bldg in buildings:
+        order = (number_of_elements if number_of_elements is not None
+                 else bldg.number_of_elements_calc)
+        windows = (merge_windows if merge_windows is not None
+                   else bldg.merge_windows_calc)
+        layer_values = (t_bt_layer if t_bt_layer is not None
+                        else bldg.t_bt_layer)
+        for zone in bldg.thermal_zones:
+            for t_bt_layer_value in np.atleast_1d(layer_values):
+                t_bt_layer_value = float(t_bt_layer_value)
+                model = _calc_model(
+                    zone, order, windows, t_bt, t_bt_layer_value)
+                blocks.append(pd.DataFrame(
+                    dict(_rc_parameters(model, len(t_bt))),
+                    index=pd.MultiIndex.from_arrays(
+                        [[bldg.name] * len(t_bt),
+                         [zone.name] * len(t_bt),
+                         t_bt,
+                         [t_bt_layer_value] * len(t_bt)],
+                        names=["building", "zone", "t_bt", "t_bt_layer"])))
+    if not blocks:
+        return pd.DataFrame(index=pd.MultiIndex.from_arrays(
+            [[], [], [], []], names=["building", "zone", "t_bt", "t_bt_layer"]))
+    return pd.concat(blocks)
+
+
+def _calc_model(zone, number_of_elements, merge_windows, t_bt, t_bt_layer):
+    """Calculates a model of the zone for an array of t_bt
+
+    The model is not assigned to the zone, the values of the elements that
+    the calculation overwrites are restored afterwards.
+
+    """
+    elements = _elements(zone)
+    saved = [[getattr(element, name, _missing) for name in _element_results]
+             for element in elements]
+    try:
+        model_class = _model_classes[number_of_elements]
+        if model_class is FiveElement:
+            model = model_class(
+                thermal_zone=zone,
+                merge_windows=merge_windows,
+                t_bt=t_bt)
+        else:
+            model = model_class(
+                thermal_zone=zone,
+                merge_windows=merge_windows,
+                t_bt=t_bt,
+                t_bt_layer=t_bt_layer)
+        model.calc_attributes()
+    finally:
+        for element, values in zip(elements, saved):
+            for name, value in zip(_element_results, values):
+                if value is not _missing:
+                    setattr(element, name, value)
+    return model
+
+
+def _rc_parameters(model, n_t_bt):
+    """Yields name and values (one per t_bt) of the RC parameters"""
+    for name, value in sorted(vars(model).items()):
+        if not name.startswith(_rc_prefixes):
+            continue
+        if isinstance(value, list):
+            for i, item in enumerate(value):
+                yield (name + "_" + str(i),
+                       np.broadcast_to(np.asarray(item, dtype=float), n_t_bt))
+        else:
+            yield name, np.broadcast_to(np.asarray(value, dtype=float), n_t_bt)
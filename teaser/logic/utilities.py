@@ -5,13 +5,221 @@
 classes
 """
 
+import itertools
 import os
+import random
 import shutil
 import operator
+import uuid
+import pandas as pd
 
 ops = {"/": operator.truediv}
 
 
+class IdAllocator(object):
+    """Allocator of internal ids for building objects
+
+    Each Project has its own IdAllocator (Project.id_allocator). Building
+    objects draw their internal_id from the allocator of the project they
+    belong to (see get_id_allocator()), so identical runs lead to identical
+    ids. Objects without project draw negative ids from the process-wide
+    default_id_allocator, which never overlap ids of a project. When a
+    building or zone is attached to a project, it and all objects below it
+    get new ids of the project (see renew_internal_ids()).
+
+    Parameters
+    ----------
+    seed : int
+        If None (default), ids are consecutive integers starting at 1. If
+        given, ids are pseudo random floats in [0, 1) of a random number
+        generator initialized with this seed. These are reproducible as
+        well, but differ between projects with different seeds.
+    step : int
+        Step of the consecutive integer ids, the first id is step (default
+        1). default_id_allocator uses -1.
+
+    """
+
+    def __init__(self, seed=None, step=1):
+        self.seed = seed
+        self._count = itertools.count(step, step)
+        if seed is None:
+            self._random = None
+        else:
+            self._random = random.Random(seed)
+
+    def next_id(self):
+        """Returns the next internal id"""
+        if self._random is None:
+            return next(self._count)
+        return self._random.random()
+
+    def next_uuid(self):
+        """Returns a new UUID string, e.g. for material ids
+
+        Material ids are keys in the JSON catalogs, so they need to be unique
+        across runs. Without seed, uuid1 is used, with seed a version 4 UUID
+        from the random number generator of the allocator.
+        """
+        if self._random is None:
+            return str(uuid.uuid1())
+        return str(uuid.UUID(int=self._random.getrandbits(128), version=4))
+
+
+default_id_allocator = IdAllocator(step=-1)
+
+
+def get_id_allocator(parent):
+    """Returns the IdAllocator for an object with the given parent
+
+    Follows the parent chain (e.g. Layer, BuildingElement, ThermalZone,
+    Building) up to the Project. Objects without Project use
+    default_id_allocator.
+
+    Parameters
+    ----------
+    parent : object
+        Parent of the object (e.g. ThermalZone for BuildingElements)
+
+    Returns
+    -------
+    id_allocator : IdAllocator
+        IdAllocator of the project or default_id_allocator
+
+    """
+    while parent is not None:
+        id_allocator = getattr(parent, "id_allocator", None)
+        if id_allocator is not None:
+            return id_allocator
+        parent = getattr(parent, "parent", None)
+    return default_id_allocator
+
+
+def renew_internal_ids(zone, id_allocator):
+    """Draws new internal ids for a thermal zone and the objects below it
+
+    Used when a zone or its building is attached to a new parent, so that
+    the ids of the zone, its use conditions, building elements, layers and
+    calculation models are unique within the new project.
+
+    Parameters
+    ----------
+    zone : ThermalZone
+        Thermal zone whose ids are renewed
+    id_allocator : IdAllocator
+        Allocator of the new parent
+
+    """
+    zone.internal_id = id_allocator.next_id()
+    if zone.use_conditions is not None:
+        zone.use_conditions.internal_id = id_allocator.next_id()
+    for element in (zone.outer_walls + zone.doors + zone.rooftops
+                    + zone.ground_floors + zone.windows + zone.inner_walls
+                    + zone.floors + zone.ceilings + zone.interzonal_walls
+                    + zone.interzonal_floors + zone.interzonal_ceilings):
+        element.internal_id = id_allocator.next_id()
+        for layer in element.layer:
+            layer.internal_id = id_allocator.next_id()
+    model_attrs = list(zone.model_attrs.values())
+    model_attr = getattr(zone, "model_attr", None)
+    if model_attr is not None and model_attr not in model_attrs:
+        model_attrs.insert(0, model_attr)
+    for model_attr in model_attrs:
+        model_attr.internal_id = id_allocator.next_id()
+
+
+_hourly_index = None
+
+
+def get_hourly_index():
+    """Returns the index of hourly schedules for one year
+
+    The index holds the 8760 hours of a year as strings "%m-%d %H:%M:%S".
+    It is built on the first call and shared afterwards (pandas Index
+    objects are immutable).
+
+    Returns
+    -------
+    hourly_index : pandas.Index
+        Index with 8760 strings
+
+    """
+    global _hourly_index
+    if _hourly_index is None:
+        _hourly_index = pd.Index(
+            pd.date_range("2019-01-01 00:00:00", periods=8760, freq="h")
+            .to_series()
+            .dt.strftime("%m-%d %H:%M:%S"))
+    return _hourly_index
+
+
+def get_table_period(periods):
+    """Returns the period of a table of periodic profiles
+
+    Profiles repeating every 24 h or every week can be exported as one
+    period, Modelica repeats tables with periodic extrapolation.
+
+    Parameters
+    ----------
+    periods : list
+        Periods of the profiles of the table in hours
+
+    Returns
+    -------
+    period : int
+        24 or 168 if all profiles repeat with that period, else 8760
+
+    """
+    for period in (24, 168):
+        if all(period % profile_period == 0 for profile_period in periods):
+            return period
+    return 8760
+
+
+def write_table(path, table_name, columns, period=8760, zero_row=False):
+    """Writes hourly profiles as Modelica table (CombiTimeTable, text format)
+
+    The rows are formatted and written one by one, the profiles are not
+    expanded to a DataFrame. Tables of one year (period 8760) hold the
+    values of hour i at time (i + 1) * 3600 s. Tables with a shorter period
+    hold one period from time 0 to period * 3600 s, the first and the last
+    row are both the value of the last hour. With periodic extrapolation
+    they are equal to the yearly table from the first hour on and repeat
+    with exactly the period afterwards.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file, an existing file is overwritten
+    table_name : str
+        Name of the table in the file (tableName in Modelica)
+    columns : list
+        Profiles of the table, numpy arrays with at least period values
+    period : int
+        Period of the profiles in hours (see get_table_period()), default
+        is 8760
+    zero_row : bool
+        Adds a row at time 0 with the values of the first hour to tables of
+        one year, default is False
+
+    """
+    values = [
+        column[:period].astype(str).tolist() for column in columns]
+    if period == 8760:
+        rows = [(str((i + 1) * 3600), i) for i in range(8760)]
+        if zero_row:
+            rows.insert(0, ("0", 0))
+    else:
+        rows = [(str(k * 3600), (k - 1) % period) for k in range(period + 1)]
+    with open(path, "w") as f:
+        f.write("#1\n")
+        f.write("double {}({}, {})\n".format(
+            table_name, len(rows), len(columns) + 1))
+        f.writelines(
+            "\t".join([time] + [column[i] for column in values]) + "\n"
+            for time, i in rows)
+
+
 def celsius_to_kelvin(value):
     try:
         f_value = float(value)
@@ -3,8 +3,12 @@
 import warnings
 import os
 import re
+from contextlib import contextmanager, ExitStack
 from typing import Optional, Union, List, Dict
 import teaser.logic.utilities as utilities
+import teaser.logic.parallel as parallel
+import teaser.logic.sweep as sweep
+from teaser.logic.heatload import HeatLoadTable
 import teaser.data.utilities as datahandling
 import teaser.data.input.teaserjson_input as tjson_in
 import teaser.data.output.teaserjson_output as tjson_out
@@ -33,6 +37,10 @@ class Project(object):
         should be loaded. default = False but will be automatically loaded
         once you add a archetype building. For building generation from
         scratch, set to True
+    id_seed : int
+        Seed for the internal ids of the building objects of this project.
+        If None (default), ids are consecutive integers, otherwise
+        reproducible pseudo random floats (see utilities.IdAllocator)
 
     Attributes
     ----------
@@ -46,6 +54,13 @@ class Project(object):
         List of all buildings in one project, instances of Building()
     data : instance of DataClass
         TEASER instance of DataClass containing JSON binding classes
+    id_allocator : instance of IdAllocator
+        Allocator of the internal ids of all building objects of this
+        project
+    intern_materials : bool
+        If True, archetype buildings added to the project use shared,
+        read-only materials for the layers of their type elements (see
+        DataClass.intern_materials). Default is False.
     weather_file_path : str
         Absolute path to weather file used for Modelica simulation. Default
         weather file can be found in inputdata/weatherdata.
@@ -107,9 +122,11 @@ class Project(object):
         InnerWall from the other side.
     """
 
-    def __init__(self, load_data=False):
+    def __init__(self, load_data=False, id_seed=None):
         """Constructor of Project Class.
         """
+        self.id_allocator = utilities.IdAllocator(seed=id_seed)
+        self._building_index = {}
         self._name = "Project"
         self.modelica_info = ModelicaInfo()
 
@@ -146,6 +163,7 @@ class Project(object):
         if load_data:
             raise ValueError("This option was deprecated")
         self.data = None
+        self.intern_materials = False
 
         self.dir_reference_results = None
 
@@ -165,7 +183,28 @@ class Project(object):
         return DataClass(
             construction_data=datahandling.ConstructionData.iwu_heavy)
 
-    def calc_all_buildings(self, raise_errors=False):
+    @contextmanager
+    def bulk_edit(self):
+        """Defers recalculations of elements while editing all buildings
+
+        Enters Building.bulk_edit() for all buildings of the project, so
+        the UA-Values of changed elements and the outer_area and window_area
+        of the buildings are recalculated once when the context is left.
+
+        Example
+        -------
+        >>> with prj.bulk_edit():
+        ...     for bldg in prj.buildings:
+        ...         bldg.set_outer_wall_area(100.0, 0.0)
+
+        """
+        with ExitStack() as stack:
+            for bldg in self.buildings:
+                stack.enter_context(bldg.bulk_edit())
+            yield self
+
+    def calc_all_buildings(self, raise_errors=False, n_workers=None,
+                           incremental=False):
         """Calculates values for all project buildings
 
         You need to set the following parameters in the Project class.
@@ -183,30 +222,127 @@ class Project(object):
         used_library_calc : str
             used library (AixLib and IBPSA are supported)
 
+        Parameters
+        ----------
+
+        raise_errors : bool
+            If True, errors of the calculation are raised. If False
+            (default), buildings that can't be calculated (ZeroDivisionError,
+            TypeError) are removed from the buildings list with a warning.
+        n_workers : int
+            If larger than 1, the buildings are calculated in a pool of
+            n_workers processes (see teaser.logic.parallel) and the results
+            are merged back into the buildings. Results and error handling
+            are the same as for the sequential calculation. On platforms
+            that spawn processes (e.g. Windows) the calling script needs an
+            if __name__ == "__main__" guard. Needs Python 3.8 or newer,
+            older versions calculate sequentially with a warning. Default
+            is None (sequential)
+        incremental : bool
+            If True, only zones whose inputs (elements, layers, materials,
+            zone and use conditions) changed since their last calculation
+            are calculated again, the results of the other zones are kept.
+            Default is False
+
+        Returns
+        -------
+        skipped : int
+            Number of zones whose calculation was skipped because nothing
+            changed (always 0 if incremental is False)
+
         """
-        if raise_errors is True:
+        calc_kwargs = dict(
+            number_of_elements=self._number_of_elements_calc,
+            merge_windows=self._merge_windows_calc,
+            used_library=self._used_library_calc,
+            incremental=incremental,
+        )
+        skipped = 0
+        if n_workers is not None and n_workers > 1 \
+                and not parallel.supported:
+            warnings.warn(
+                "calc_all_buildings(n_workers=...) needs Python 3.8 or "
+                "newer, the buildings are calculated sequentially")
+            n_workers = None
+        if n_workers is not None and n_workers > 1:
+            for bldg, bldg_skipped, error in parallel.calc_buildings(
+                    self, reversed(self.buildings), n_workers, **calc_kwargs):
+                if error is None:
+                    skipped += bldg_skipped
+                    continue
+                if raise_errors is True or not isinstance(
+                        error, (ZeroDivisionError, TypeError)):
+                    raise error
+                self._remove_failed_building(bldg)
+        elif raise_errors is True:
             for bldg in reversed(self.buildings):
-                bldg.calc_building_parameter(
-                    number_of_elements=self._number_of_elements_calc,
-                    merge_windows=self._merge_windows_calc,
-                    used_library=self._used_library_calc,
-                )
+                skipped += bldg.calc_building_parameter(**calc_kwargs)
         else:
             for bldg in reversed(self.buildings):
                 try:
-                    bldg.calc_building_parameter(
-                        number_of_elements=self._number_of_elements_calc,
-                        merge_windows=self._merge_windows_calc,
-                        used_library=self._used_library_calc,
-                    )
+                    skipped += bldg.calc_building_parameter(**calc_kwargs)
                 except (ZeroDivisionError, TypeError):
-                    warnings.warn(
-                        "Following building can't be calculated and is "
-                        "removed from buildings list. Use raise_errors=True "
-                        "to get python errors and stop TEASER from deleting "
-                        "this building:" + bldg.name
-                    )
-                    self.buildings.remove(bldg)
+                    self._remove_failed_building(bldg)
+        return skipped
+
+    def sweep_time_constants(self, t_bt, t_bt_layer=None):
+        """Lumped RC parameters of all zones for a range of time constants
+
+        Evaluates the models of number_of_elements_calc and
+        merge_windows_calc for all combinations of t_bt and t_bt_layer
+        without changing the buildings (see
+        teaser.logic.sweep.sweep_time_constants()).
+
+        Parameters
+        ----------
+
+        t_bt : array_like
+            Time constants according to VDI 6007 in days
+        t_bt_layer : float or array_like
+            Time constants according to VDI 6007 for the aggregation of
+            layers in days. Default is None, which uses the t_bt_layer of
+            each building
+
+        Returns
+        -------
+
+        rc_parameters : pandas.DataFrame
+            One row per building, zone, t_bt and t_bt_layer, one column per
+            lumped RC parameter
+
+        """
+        return sweep.sweep_time_constants(
+            self.buildings,
+            t_bt,
+            t_bt_layer=t_bt_layer,
+            number_of_elements=self._number_of_elements_calc,
+            merge_windows=self._merge_windows_calc)
+
+    def heat_load_table(self):
+        """Collects the static heat load factors of all calculated zones
+
+        The returned table evaluates the heat loads of all zones and
+        buildings for arrays of t_outside, t_ground and t_soil_mode without
+        recalculating the buildings (see teaser.logic.heatload).
+
+        Returns
+        -------
+
+        table : HeatLoadTable
+            Heat load factors and temperatures of all zones
+
+        """
+        return HeatLoadTable(self.buildings)
+
+    def _remove_failed_building(self, bldg):
+        """Removes a building that can't be calculated, with a warning"""
+        warnings.warn(
+            "Following building can't be calculated and is "
+            "removed from buildings list. Use raise_errors=True "
+            "to get python errors and stop TEASER from deleting "
+            "this building:" + bldg.name
+        )
+        self.buildings.remove(bldg)
 
     def retrofit_all_buildings(
         self,
@@ -428,7 +564,8 @@ class Project(object):
         assert geometry_data in datahandling.allowed_geometries.get(
             construction_data, []), ass_error_geometry_data
 
-        self.data = DataClass(construction_data)
+        self.data = DataClass(
+            construction_data, intern_materials=self.intern_materials)
 
         type_bldg = datahandling.geometries[geometry_data](
             parent=self,
@@ -621,7 +758,8 @@ class Project(object):
                 and number_of_apartments is not None):
             warnings.warn(ass_error_apart)
 
-        self.data = DataClass(construction_data)
+        self.data = DataClass(
+            construction_data, intern_materials=self.intern_materials)
 
         ass_error_geometry_data = (
             "geometry_data does not match the construction_data")
@@ -777,9 +915,37 @@ class Project(object):
         """
         if not self.buildings:
             raise ValueError("The project includes no buildings to export.")
-        if internal_id is not None and not any(bldg.internal_id == internal_id for bldg in self.buildings):
+        if internal_id is not None and self.get_building(internal_id) is None:
             raise ValueError(f"Building with internal_id {internal_id} not found in the project.")
 
+    def get_building(self, internal_id):
+        """Returns the building with the given internal_id
+
+        The buildings are looked up in a dictionary of internal ids and list
+        positions, which is rebuilt if the buildings list has changed.
+
+        Parameters
+        ----------
+        internal_id : int or float
+            internal_id of the building
+
+        Returns
+        -------
+        building : Building
+            Building instance or None if no building has this internal_id
+
+        """
+        position = self._building_index.get(internal_id)
+        if position is None or position >= len(self.buildings) or \
+                self.buildings[position].internal_id != internal_id:
+            self._building_index = {
+                bldg.internal_id: position
+                for position, bldg in enumerate(self.buildings)}
+            position = self._building_index.get(internal_id)
+            if position is None:
+                return None
+        return self.buildings[position]
+
     def export_aixlib(
         self,
         building_model=None,
@@ -806,7 +972,7 @@ class Project(object):
         Parameters
         ----------
 
-        internal_id : float
+        internal_id : int or float
             setter of a specific building which will be exported, if None then
             all buildings will be exported
         path : string
@@ -852,15 +1018,13 @@ class Project(object):
                 export_vars=export_vars
             )
         else:
-            for bldg in self.buildings:
-                if bldg.internal_id == internal_id:
-                    aixlib_output.export_multizone(
-                        buildings=[bldg], prj=self, path=path,
-                        custom_multizone_template_path
-                        =custom_multizone_template_path,
-                        use_postprocessing_calc=use_postprocessing_calc,
-                        export_vars=export_vars
-                    )
+            aixlib_output.export_multizone(
+                buildings=[self.get_building(internal_id)], prj=self,
+                path=path,
+                custom_multizone_template_path=custom_multizone_template_path,
+                use_postprocessing_calc=use_postprocessing_calc,
+                export_vars=export_vars
+            )
 
         if report:
             self._write_report(path)
@@ -936,13 +1100,11 @@ class Project(object):
                 custom_examples=custom_examples, custom_script=custom_script
             )
         else:
-            for bldg in self.buildings:
-                if bldg.internal_id == internal_id:
-                    besmod_output.export_besmod(
-                        buildings=[bldg], prj=self, path=path, examples=examples, THydSup_nominal=THydSup_nominal,
-                        QBuiOld_flow_design=QBuiOld_flow_design, THydSupOld_design=THydSupOld_design,
-                        custom_examples=custom_examples, custom_script=custom_script
-                    )
+            besmod_output.export_besmod(
+                buildings=[self.get_building(internal_id)], prj=self, path=path, examples=examples,
+                THydSup_nominal=THydSup_nominal, QBuiOld_flow_design=QBuiOld_flow_design,
+                THydSupOld_design=THydSupOld_design, custom_examples=custom_examples, custom_script=custom_script
+            )
 
         if report:
             self._write_report(path)
@@ -974,7 +1136,7 @@ class Project(object):
             just a core set of models and should not be used standalone.
             Valid values are 'AixLib' (default), 'Buildings',
             'BuildingSystems' and 'IDEAS'.
-        internal_id : float
+        internal_id : int or float
             setter of a specific building which will be exported, if None then
             all buildings will be exported
         path : string
@@ -1008,9 +1170,9 @@ class Project(object):
                 buildings=self.buildings, prj=self, path=path, library=library
             )
         else:
-            for bldg in self.buildings:
-                if bldg.internal_id == internal_id:
-                    ibpsa_output.export_ibpsa(buildings=[bldg], prj=self, path=path)
+            ibpsa_output.export_ibpsa(
+                buildings=[self.get_building(internal_id)], prj=self,
+                path=path)
         return path
 
     def set_default(self, load_data=None):
@@ -470,3 +470,31 @@ def interzonal_test2(prj, connect_to_index=-2, add_heated=False):
     iz_wall_2.load_type_element(year=iz_wall_2.year_of_construction,
                                 construction=iz_wall_2.construction_data)
     return bldg
+
+
+def residential_test(prj, name="Residential", year_of_construction=1960):
+    """
+    adds a single family dwelling archetype (iwu_heavy) to the project
+    """
+    return prj.add_residential(
+        construction_data="iwu_heavy",
+        geometry_data="iwu_single_family_dwelling",
+        name=name,
+        year_of_construction=year_of_construction,
+        number_of_floors=2,
+        height_of_floors=3.0,
+        net_leased_area=150)
+
+
+def office_test(prj, name="Office", year_of_construction=1980):
+    """
+    adds a multi zone office archetype (iwu_heavy) to the project
+    """
+    return prj.add_non_residential(
+        construction_data="iwu_heavy",
+        geometry_data="bmvbs_office",
+        name=name,
+        year_of_construction=year_of_construction,
+        number_of_floors=3,
+        height_of_floors=3.0,
+        net_leased_area=1500)
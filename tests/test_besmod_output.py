@@ -114,6 +114,33 @@ class Test_besmod_output(unittest.TestCase):
                           custom_script=custom_script)
         prj.export_besmod(custom_examples=custom_example_template)
 
+    def test_export_besmod_internal_gains(self):
+        """test that BESMod gets internal gains tables of one year"""
+        prj = Project()
+        prj.name = "BESModInternalGains"
+        prj.add_residential(
+            construction_data='iwu_heavy',
+            geometry_data='iwu_single_family_dwelling',
+            name="ResidentialBuilding",
+            year_of_construction=1988,
+            number_of_floors=2,
+            height_of_floors=3.2,
+            net_leased_area=200.0)
+        prj.used_library_calc = "AixLib"
+        prj.number_of_elements_calc = 4
+        prj.calc_all_buildings()
+        bldg = prj.buildings[-1]
+        use_cond = bldg.thermal_zones[-1].use_conditions
+        self.assertEqual(
+            use_cond.get_profile("persons_profile").period, 24)
+
+        path = prj.export_besmod()
+        with open(os.path.join(
+                path, bldg.name, bldg.library_attr.file_internal_gains)) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[1], "double Internals(8760, 4)")
+        self.assertEqual(len(lines), 8762)
+
     def test_convert_heating_profile(self):
         """Test the conversion of heating profiles for BESMod"""
         with self.assertRaises(ValueError):
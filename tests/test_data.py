@@ -18,7 +18,9 @@ from teaser.logic.buildingobjects.buildingphysics.interzonalwall \
     import InterzonalWall
 import math
 import os
+import numpy as np
 import helptest
+import pytest
 from pytest import approx
 
 prj = Project(False)
@@ -4263,3 +4265,912 @@ class Test_teaser(object):
         assert tz1.name == "living"
         assert tz2.name == "kitchen"
         assert tz3.name == "living_1"
+
+    def test_data_class_binding_cache(self):
+        """Tests that DataClass instances share the cached JSON bindings"""
+        dat_a = DataClass(construction_data=ConstructionData.tabula_de_standard)
+        dat_b = DataClass(construction_data=ConstructionData.tabula_de_standard)
+        assert dat_a.element_bind is dat_b.element_bind
+        assert dat_a.material_bind is dat_b.material_bind
+        assert dat_a.conditions_bind is dat_b.conditions_bind
+
+        dat_c = DataClass(
+            construction_data=ConstructionData.tabula_de_standard,
+            use_cache=False)
+        assert dat_c.element_bind is not dat_a.element_bind
+        assert dat_c.element_bind == dat_a.element_bind
+
+        private_bind = dat_b.detach_binding("element_bind")
+        private_bind["UnitTest"] = {}
+        assert dat_b.element_bind is private_bind
+        assert "UnitTest" not in dat_a.element_bind
+
+    def test_data_class_cache_invalidation(self):
+        """Tests that the binding cache notices changed JSON files"""
+        import json
+
+        utilities.create_path(utilities.get_default_path())
+        path = os.path.join(utilities.get_default_path(), "CacheUT.json")
+        with open(path, "w") as file:
+            json.dump({"first": 1}, file)
+
+        dat = DataClass(construction_data=ConstructionData.iwu_heavy)
+        dat.path_mat = path
+        dat.load_mat_binding()
+        assert list(dat.material_bind.keys()) == ["first"]
+
+        with open(path, "w") as file:
+            json.dump({"first": 1, "second": 2}, file)
+        dat.load_mat_binding()
+        assert list(dat.material_bind.keys()) == ["first", "second"]
+
+    def test_type_element_index(self):
+        """Tests the age group index against a scan of the binding"""
+        for construction_data in [ConstructionData.iwu_heavy,
+                                  ConstructionData.tabula_de_standard,
+                                  ConstructionData.tabula_dk_standard,
+                                  ConstructionData.kfw_40]:
+            dat = DataClass(construction_data=construction_data)
+            for key, element_in in dat.element_bind.items():
+                element_type = key.split("_")[0]
+                construction = element_in["construction_data"]
+                for year in set(element_in["building_age_group"]):
+                    expected = next(
+                        k for k, e in dat.element_bind.items()
+                        if e["building_age_group"][0] <= year
+                        <= e["building_age_group"][1]
+                        and e["construction_data"] == construction
+                        and k.startswith(element_type))
+                    assert dat.find_type_element_key(
+                        element_type, construction, year) == expected
+        assert dat.find_type_element_key("OuterWall", "kfw_40", 1500) is None
+
+    def test_type_element_index_save_delete(self):
+        """Tests that saving and deleting type elements updates the index"""
+        prj.set_default(load_data=True)
+        helptest.building_test2(prj)
+        wall = prj.buildings[-1].thermal_zones[-1].outer_walls[0]
+        wall.building_age_group = [2400, 2500]
+        wall.construction_data = "index_test"
+
+        path = os.path.join(utilities.get_default_path(), "IndexUT.json")
+        if os.path.exists(path):
+            os.remove(path)
+        prj.data.path_tb = path
+        prj.data.load_tb_binding()
+        assert prj.data.find_type_element_key(
+            "OuterWall", "index_test", 2450) is None
+        wall.save_type_element(data_class=prj.data)
+        assert prj.data.find_type_element_key(
+            "OuterWall", "index_test", 2450) == \
+            "OuterWall_[2400, 2500]_index_test"
+        wall.delete_type_element(data_class=prj.data)
+        assert prj.data.find_type_element_key(
+            "OuterWall", "index_test", 2450) is None
+
+    def test_material_index(self):
+        """Tests material lookup by name and id and the index updates"""
+        import shutil
+        from teaser.logic.buildingobjects.buildingphysics.material import \
+            Material
+
+        dat = DataClass(construction_data=ConstructionData.iwu_heavy)
+        for mat_id, mat in dat.material_bind.items():
+            expected = [k for k, m in dat.material_bind.items()
+                        if m["name"] == mat["name"]][-1]
+            assert dat.find_material_id(mat["name"]) == expected
+        assert dat.find_material_id("NoSuchMaterial") is None
+
+        mat = Material(parent=None)
+        mat.load_material_template(
+            mat_name="roof_tiles_including_battens", data_class=dat)
+        assert mat.density > 0.0
+        by_id = Material(parent=None)
+        import teaser.data.input.material_input_json as mat_input
+        mat_input.load_material_id(by_id, mat.material_id, dat)
+        assert by_id.density == mat.density
+        assert by_id.material_id == mat.material_id
+
+        utilities.create_path(utilities.get_default_path())
+        path = os.path.join(utilities.get_default_path(), "MatIndexUT.json")
+        shutil.copyfile(dat.path_mat, path)
+        dat.path_mat = path
+        dat.load_mat_binding()
+        assert dat.find_material_id("roof_tiles_including_battens") == mat.material_id
+
+        new_mat = Material(parent=None)
+        new_mat.name = "IndexTestMaterial"
+        new_mat.density = 1.0
+        new_mat.thermal_conduc = 1.0
+        new_mat.heat_capac = 1.0
+        new_mat.save_material_template(data_class=dat)
+        assert dat.find_material_id("IndexTestMaterial") == \
+            new_mat.material_id
+
+        new_mat.name = "IndexTestMaterialModified"
+        new_mat.modify_material_template(data_class=dat)
+        assert dat.find_material_id("IndexTestMaterial") is None
+        assert dat.find_material_id("IndexTestMaterialModified") == \
+            new_mat.material_id
+        assert dat.material_bind[new_mat.material_id]["name"] == \
+            "IndexTestMaterialModified"
+
+    def test_catalog_snapshot(self, tmp_path, monkeypatch):
+        """Tests writing, reading and rebuilding binary catalog snapshots"""
+        import json
+        import teaser.data.dataclass as dataclass
+
+        monkeypatch.setenv("TEASER_CACHE_DIR", str(tmp_path / "cache"))
+        path = str(tmp_path / "SnapshotUT.json")
+        with open(path, "w") as file:
+            json.dump({"first": {"name": "first"}}, file)
+
+        content = dataclass._load_catalog(path)
+        snapshot = dataclass._snapshot_path(path)
+        assert os.path.isfile(snapshot)
+        assert content == {"first": {"name": "first"}}
+
+        # a snapshot with matching hash is used instead of the JSON
+        import marshal
+        with open(snapshot, "rb") as file:
+            version, source_hash, _ = marshal.load(file)
+        with open(snapshot, "wb") as file:
+            marshal.dump((version, source_hash, {"from": "snapshot"}), file)
+        assert dataclass._load_catalog(path) == {"from": "snapshot"}
+
+        # snapshots that others can write to are not used
+        os.chmod(snapshot, 0o666)
+        assert dataclass._load_catalog(path) == {"first": {"name": "first"}}
+        os.chmod(snapshot, 0o644)
+
+        # changed JSON content invalidates the snapshot
+        with open(path, "w") as file:
+            json.dump({"second": {"name": "second"}}, file)
+        assert dataclass._load_catalog(path) == {"second": {"name": "second"}}
+        with open(snapshot, "rb") as file:
+            assert marshal.load(file)[1] != source_hash
+
+        dataclass.clear_binding_cache()
+        dat = DataClass(construction_data=ConstructionData.iwu_heavy)
+        dat_json = DataClass(
+            construction_data=ConstructionData.iwu_heavy, use_cache=False)
+        assert dat.element_bind == dat_json.element_bind
+        assert dat.material_bind == dat_json.material_bind
+        assert dat.conditions_bind == dat_json.conditions_bind
+
+    def test_data_class_lazy_loading(self):
+        """Tests that bindings are only loaded on first access"""
+        dat = DataClass(construction_data=ConstructionData.tabula_dk_standard)
+        assert dat._element_bind is not None
+        assert not isinstance(dat._element_bind, dict)
+        assert not isinstance(dat._material_bind, dict)
+        assert not isinstance(dat._conditions_bind, dict)
+
+        assert "Living" in dat.conditions_bind
+        assert not isinstance(dat._element_bind, dict)
+        assert not isinstance(dat._material_bind, dict)
+
+        dat.warm_up(["element_bind"])
+        assert isinstance(dat._element_bind, dict)
+        assert not isinstance(dat._material_bind, dict)
+
+        dat.warm_up()
+        assert isinstance(dat._material_bind, dict)
+
+    def test_intern_materials(self):
+        """Tests shared read-only materials for type element layers"""
+        from teaser.logic.buildingobjects.buildingphysics.outerwall import \
+            OuterWall
+
+        dat = DataClass(
+            construction_data=ConstructionData.iwu_heavy,
+            intern_materials=True)
+        dat_private = DataClass(construction_data=ConstructionData.iwu_heavy)
+        walls = []
+        for data_class in (dat, dat, dat_private):
+            wall = OuterWall()
+            wall.area = 10.0
+            wall.inner_convection = 1.7
+            wall.inner_radiation = 5.0
+            wall.outer_convection = 20.0
+            wall.outer_radiation = 5.0
+            wall.load_type_element(
+                year=1990, construction="iwu_heavy", data_class=data_class)
+            walls.append(wall)
+
+        for layer_a, layer_b, layer_c in zip(*[w.layer for w in walls]):
+            assert layer_a.material is layer_b.material
+            assert layer_a.material is not layer_c.material
+            assert layer_a.material.is_shared
+            assert not layer_c.material.is_shared
+            assert layer_a.material.thermal_conduc == \
+                layer_c.material.thermal_conduc
+        assert walls[0].ua_value == walls[2].ua_value
+        assert walls[0].u_value == walls[2].u_value
+
+        layer = walls[0].layer[0]
+        shared = layer.material
+        with pytest.raises(AttributeError):
+            shared.thermal_conduc = 1.0
+        material = shared.copy(parent=layer)
+        assert layer.material is material
+        assert material.material_id == shared.material_id
+        material.thermal_conduc = shared.thermal_conduc * 2
+        assert walls[1].layer[0].material is shared
+        assert walls[0].ua_value > walls[1].ua_value
+
+    def test_calc_equivalent_res_batch(self):
+        """Tests the batched VDI 6007 calculation against the per wall path"""
+        from teaser.logic.buildingobjects.buildingphysics.layer import Layer
+        from teaser.logic.buildingobjects.buildingphysics.wall import \
+            calc_equivalent_res_batch
+
+        prj.set_default()
+        helptest.building_test2(prj)
+        walls = []
+        for zone in prj.buildings[-1].thermal_zones:
+            walls += (zone.outer_walls + zone.rooftops + zone.ground_floors
+                      + zone.inner_walls + zone.floors + zone.ceilings)
+        walls[1].interzonal_type_export = "outer_reversed"
+        walls[-1].layer[0].thickness = 0.3
+        layer = Layer(walls[0])
+        layer.thickness = 0.05
+        walls[0].layer[0].material.copy(parent=layer)
+        attributes = ["r1", "r2", "r3", "c1", "c2", "c1_korr"]
+
+        for t_bt in [5, 7]:
+            expected = []
+            for wall in walls:
+                wall.calc_equivalent_res(t_bt=t_bt)
+                expected.append([getattr(wall, a) for a in attributes])
+
+            calc_equivalent_res_batch(walls, t_bt=t_bt)
+            for wall, values in zip(walls, expected):
+                for attribute, value in zip(attributes, values):
+                    assert getattr(wall, attribute) == approx(
+                        value, rel=1e-9)
+        assert len(set(len(wall.layer) for wall in walls)) > 1
+
+    def test_equivalent_res_cache(self):
+        """Tests the LRU cache of area-normalized VDI 6007 parameters"""
+        from teaser.logic.buildingobjects.buildingphysics.wall import \
+            calc_equivalent_res_batch, equivalent_res_cache, \
+            EquivalentResCache
+
+        prj.set_default()
+        helptest.building_test2(prj)
+        zone = prj.buildings[-1].thermal_zones[0]
+        wall = zone.outer_walls[0]
+        twin = zone.outer_walls[1]
+        twin.area = wall.area * 3
+        assert [(lay.thickness, lay.material.thermal_conduc)
+                for lay in wall.layer] \
+            == [(lay.thickness, lay.material.thermal_conduc)
+                for lay in twin.layer]
+
+        equivalent_res_cache.clear()
+        calc_equivalent_res_batch([wall, twin], t_bt=5)
+        assert (equivalent_res_cache.hits, equivalent_res_cache.misses) \
+            == (0, 1)
+        assert twin.r1 * 3 == approx(wall.r1)
+        assert twin.c1 == approx(wall.c1 * 3)
+
+        calc_equivalent_res_batch([wall], t_bt=5)
+        assert equivalent_res_cache.hits == 1
+        calc_equivalent_res_batch([wall], t_bt=7)
+        assert equivalent_res_cache.misses == 2
+
+        # changed layers lead to a new entry
+        wall.layer[0].thickness = wall.layer[0].thickness * 2
+        calc_equivalent_res_batch([wall], t_bt=5)
+        assert equivalent_res_cache.misses == 3
+        assert len(equivalent_res_cache) == 3
+        wall.calc_equivalent_res(t_bt=5)
+        r1 = wall.r1
+        calc_equivalent_res_batch([wall], t_bt=5)
+        assert wall.r1 == approx(r1)
+
+        cache = EquivalentResCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert len(cache) == 2
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_equivalent_res_batch_small_cache(self):
+        """Tests a batch with more layer stacks than the cache can hold"""
+        from teaser.logic.buildingobjects.buildingphysics import wall as \
+            wall_module
+
+        prj.set_default()
+        helptest.building_test2(prj)
+        zone = prj.buildings[-1].thermal_zones[0]
+        walls = zone.outer_walls + zone.inner_walls + zone.rooftops
+        walls = walls[:7]
+        assert len(walls) == 7
+        for index, wall in enumerate(walls[:4]):
+            wall.layer[0].thickness = 0.01 * (index + 1)
+        expected = []
+        for wall in walls:
+            wall.calc_equivalent_res(t_bt=5)
+            expected.append((wall.r1, wall.c1))
+
+        cache = wall_module.EquivalentResCache(maxsize=2)
+        default_cache = wall_module.equivalent_res_cache
+        wall_module.equivalent_res_cache = cache
+        try:
+            wall_module.calc_equivalent_res_batch(walls[:1], t_bt=5)
+            wall_module.calc_equivalent_res_batch(walls, t_bt=5)
+        finally:
+            wall_module.equivalent_res_cache = default_cache
+        assert cache.hits >= 1
+        assert len(cache) == 2
+        for wall, (r1, c1) in zip(walls, expected):
+            assert wall.r1 == approx(r1)
+            assert wall.c1 == approx(c1)
+
+    def test_area_dict_bookkeeping(self):
+        """Tests the incremental update of outer_area and window_area"""
+        prj.set_default()
+        helptest.building_test2(prj)
+        bldg = prj.buildings[-1]
+
+        def check():
+            assert bldg.outer_area == approx(
+                {key: bldg.get_outer_wall_area(key)
+                 for key in bldg.outer_area})
+            assert bldg.window_area == approx(
+                {key: bldg.get_window_area(key)
+                 for key in bldg.window_area})
+
+        check()
+        wall = bldg.thermal_zones[0].outer_walls[0]
+        orientation = wall.orientation
+        wall.area = wall.area + 3.0
+        check()
+        wall.orientation = 45.0
+        check()
+        assert 45.0 in bldg.outer_area
+        wall.orientation = orientation
+        assert 45.0 not in bldg.outer_area
+        check()
+
+        bldg.set_outer_wall_area(100.0, orientation)
+        assert bldg.outer_area[orientation] == approx(100.0)
+        window = bldg.thermal_zones[0].windows[0]
+        bldg.set_window_area(20.0, window.orientation)
+        assert bldg.window_area[window.orientation] == approx(20.0)
+        check()
+
+        # estimates set by archetypes stay until an area changes
+        bldg.outer_area = {orientation: 1.0}
+        assert bldg.outer_area == {orientation: 1.0}
+        wall.area = 10.0
+        check()
+
+        bldg.thermal_zones[0].delete()
+        check()
+        bldg.fill_outer_area_dict()
+        bldg.fill_window_area_dict()
+        check()
+
+    def test_bulk_edit(self):
+        """Tests deferred recalculation in Building/Project.bulk_edit()"""
+        prj.set_default()
+        helptest.building_test2(prj)
+        bldg = prj.buildings[-1]
+        wall = bldg.thermal_zones[0].outer_walls[0]
+        window = bldg.thermal_zones[0].windows[0]
+        ua_value = wall.ua_value
+        outer_area = dict(bldg.outer_area)
+
+        with prj.bulk_edit():
+            with bldg.bulk_edit():
+                wall.area = wall.area * 2
+                wall.inner_convection = wall.inner_convection * 2
+                wall.layer[0].thickness = wall.layer[0].thickness * 2
+                window.area = window.area + 1.0
+                assert wall.ua_value == ua_value
+                assert bldg.outer_area == outer_area
+            assert wall.ua_value == ua_value
+        assert wall.ua_value != ua_value
+        assert bldg.outer_area[wall.orientation] == approx(
+            bldg.get_outer_wall_area(wall.orientation))
+        assert bldg.window_area[window.orientation] == approx(
+            bldg.get_window_area(window.orientation))
+
+        ua_value = wall.ua_value
+        wall.calc_ua_value()
+        assert wall.ua_value == ua_value
+
+        # outside of the context changes are calculated at once
+        wall.area = wall.area / 2
+        assert wall.ua_value != ua_value
+
+    def test_slots_building_physics(self):
+        """Tests that building physics objects don't carry a __dict__"""
+        prj.set_default()
+        helptest.building_test2(prj)
+        zone = prj.buildings[-1].thermal_zones[0]
+        for element in (zone.outer_walls + zone.rooftops + zone.ground_floors
+                        + zone.windows + zone.inner_walls + zone.floors
+                        + zone.ceilings):
+            assert not hasattr(element, "__dict__")
+            for layer in element.layer:
+                assert not hasattr(layer, "__dict__")
+                assert not hasattr(layer.material, "__dict__")
+        wall = zone.outer_walls[0]
+        with pytest.raises(AttributeError):
+            wall.not_an_attribute = 1.0
+
+    def test_slots_base_classes(self):
+        """Tests that the slotted base classes can be constructed"""
+        from teaser.logic.buildingobjects.buildingphysics.buildingelement \
+            import BuildingElement
+        from teaser.logic.buildingobjects.buildingphysics.wall import Wall
+
+        for cls in (BuildingElement, Wall):
+            element = cls()
+            assert element.parent is None
+            assert not hasattr(element, "__dict__")
+        prj.set_default()
+        helptest.building_test2(prj)
+        zone = prj.buildings[-1].thermal_zones[0]
+        element = BuildingElement(parent=zone)
+        assert element.parent is zone
+
+    def test_id_allocator(self):
+        """Tests reproducible internal ids and the building lookup"""
+        from teaser.logic.buildingobjects.buildingphysics.material import \
+            Material
+
+        def internal_ids(id_seed):
+            project = Project(id_seed=id_seed)
+            project.data = prj.data
+            helptest.building_test2(project)
+            helptest.building_test2(project)
+            ids = []
+            for bldg in project.buildings:
+                ids.append(bldg.internal_id)
+                for zone in bldg.thermal_zones:
+                    ids.append(zone.internal_id)
+                    for element in zone.outer_walls + zone.windows:
+                        ids.append(element.internal_id)
+                        ids += [layer.internal_id for layer in element.layer]
+            return project, ids
+
+        project, ids = internal_ids(None)
+        assert ids == internal_ids(None)[1]
+        assert len(set(ids)) == len(ids)
+        assert all(isinstance(id, int) for id in ids)
+
+        seeded = internal_ids(42)[1]
+        assert seeded == internal_ids(42)[1]
+        assert seeded != internal_ids(43)[1]
+        assert all(0 <= id < 1 for id in seeded)
+
+        bldg = project.buildings[1]
+        assert project.get_building(bldg.internal_id) is bldg
+        assert project.get_building(-1) is None
+        project.buildings.pop(0)
+        assert project.get_building(bldg.internal_id) is bldg
+        with pytest.raises(ValueError):
+            project._check_buildings(-1)
+
+        material = Material()
+        assert material.material_id == material.material_id
+        assert material.material_id != Material().material_id
+
+    def test_id_allocator_attach(self):
+        """Tests unique ids of zones attached to a project later"""
+        from teaser.logic.buildingobjects.building import Building
+        from teaser.logic.buildingobjects.thermalzone import ThermalZone
+
+        project = Project()
+        bldg = Building(parent=None)
+        zone_1 = ThermalZone(parent=bldg)
+        assert bldg.internal_id < 0 and zone_1.internal_id < 0
+        bldg.parent = project
+        zone_2 = ThermalZone(parent=bldg)
+        assert zone_1.internal_id > 0
+        assert zone_1.internal_id != zone_2.internal_id
+        zone_2.area = 0.0
+        zone_2.delete()
+        assert bldg.thermal_zones == [zone_1]
+
+        other = Project()
+        moved = helptest.residential_test(other)
+        moved.parent = project
+        assert project.get_building(moved.internal_id) is moved
+        ids = []
+        for building in project.buildings:
+            ids.append(building.internal_id)
+            for zone in building.thermal_zones:
+                ids.append(zone.internal_id)
+                for element in zone.outer_walls + zone.windows:
+                    ids.append(element.internal_id)
+                    ids += [layer.internal_id for layer in element.layer]
+        assert len(set(ids)) == len(ids)
+
+    def test_zone_aggregator(self):
+        """Tests the element sums shared by the calculation models"""
+        from teaser.logic.buildingobjects.calculation.aggregation import \
+            ElementSums, ZoneAggregator
+
+        prj.set_default()
+        helptest.building_test2(prj)
+        therm_zone = prj.buildings[-1].thermal_zones[-1]
+        for element in (therm_zone.outer_walls + therm_zone.rooftops
+                        + therm_zone.ground_floors + therm_zone.windows):
+            element.calc_equivalent_res()
+            element.calc_ua_value()
+
+        sums = ZoneAggregator(therm_zone)
+        outer_walls = therm_zone.outer_walls + therm_zone.rooftops
+        ow_rt = sums.concatenate("outer_walls", "rooftops")
+        assert ow_rt.area == sum(wall.area for wall in outer_walls)
+        assert ow_rt.parallel("r_outer_comb") == 1 / sum(
+            1 / wall.r_outer_comb for wall in outer_walls)
+        assert ow_rt.area_weighted("solar_absorp") == sum(
+            wall.layer[-1].material.solar_absorp * wall.area
+            for wall in outer_walls) / ow_rt.area
+        added = sums.add("outer_walls", "rooftops")
+        assert added.ua_value == (
+            sum(wall.ua_value for wall in therm_zone.outer_walls)
+            + sum(roof.ua_value for roof in therm_zone.rooftops))
+        assert sums.add("outer_walls", "rooftops") is added
+
+        ow_gf = sums.concatenate("outer_walls", "ground_floors")
+        assert ow_gf.columns == ElementSums.inner_columns
+        with pytest.raises(IndexError):
+            ow_gf.parallel("r_outer_conv")
+
+        windows = sums["windows"]
+        assert windows.area_weighted("g_value") == sum(
+            win.g_value * win.area
+            for win in therm_zone.windows) / windows.area
+        assert ElementSums([]).area == 0
+
+    def test_calc_parallel_connection(self):
+        """Tests the admittance sum against the pairwise VDI 6007 formulas"""
+        from teaser.logic.buildingobjects.calculation.aggregation import \
+            calc_parallel_connection
+
+        omega = 2 * math.pi / 86400 / 5
+
+        def pairwise(r1_list, c1_list):
+            r1, c1 = r1_list[0], c1_list[0]
+            for r1_add, c1_add in zip(r1_list[1:], c1_list[1:]):
+                r1_before, c1_before = r1, c1
+                r1 = (
+                    r1_before * c1_before ** 2 + r1_add * c1_add ** 2
+                    + omega ** 2 * r1_before * r1_add * (r1_before + r1_add)
+                    * c1_before ** 2 * c1_add ** 2
+                ) / (
+                    (c1_before + c1_add) ** 2
+                    + omega ** 2 * (r1_before + r1_add) ** 2
+                    * c1_before ** 2 * c1_add ** 2
+                )
+                c1 = (
+                    (c1_before + c1_add) ** 2
+                    + omega ** 2 * (r1_before + r1_add) ** 2
+                    * c1_before ** 2 * c1_add ** 2
+                ) / (
+                    c1_before + c1_add
+                    + omega ** 2
+                    * (r1_before ** 2 * c1_before + r1_add ** 2 * c1_add)
+                    * c1_before * c1_add
+                )
+            return r1, c1
+
+        zones = [
+            ([0.0012], [3.1e6]),
+            ([0.0034, 0.021], [7.1e6, 2.7e5]),
+            ([0.004, 0.0008, 0.015, 0.0021], [1.2e6, 9.8e6, 4.4e5, 3.3e6]),
+        ]
+        for r1_list, c1_list in zones:
+            r1, c1 = calc_parallel_connection(r1_list, c1_list, omega)
+            r1_ref, c1_ref = pairwise(r1_list, c1_list)
+            assert r1 == pytest.approx(r1_ref, rel=1e-12)
+            assert c1 == pytest.approx(c1_ref, rel=1e-12)
+
+        # all zones at once, padded with branches without capacity
+        r1_pad = np.zeros((len(zones), 4))
+        c1_pad = np.zeros((len(zones), 4))
+        for i, (r1_list, c1_list) in enumerate(zones):
+            r1_pad[i, :len(r1_list)] = r1_list
+            c1_pad[i, :len(c1_list)] = c1_list
+        r1, c1 = calc_parallel_connection(r1_pad, c1_pad, omega)
+        assert r1.shape == (len(zones),)
+        for i, (r1_list, c1_list) in enumerate(zones):
+            r1_ref, c1_ref = pairwise(r1_list, c1_list)
+            assert r1[i] == pytest.approx(r1_ref, rel=1e-12)
+            assert c1[i] == pytest.approx(c1_ref, rel=1e-12)
+
+    def test_facade_index(self):
+        """Tests the grouping of outer elements by orientation and tilt"""
+        prj.set_default()
+        helptest.building_test2(prj)
+        therm_zone = prj.buildings[-1].thermal_zones[-1]
+
+        facades = therm_zone.facade_index()
+        for wall in therm_zone.outer_walls:
+            assert facades.find("outer_walls", wall.orientation, wall.tilt) \
+                == therm_zone.find_walls(wall.orientation, wall.tilt)
+        for win in therm_zone.windows:
+            assert facades.find("windows", win.orientation, win.tilt) \
+                == therm_zone.find_wins(win.orientation, win.tilt)
+        for roof in therm_zone.rooftops:
+            assert facades.find("rooftops", roof.orientation, roof.tilt) \
+                == therm_zone.find_rts(roof.orientation, roof.tilt)
+        assert facades.find("ground_floors", 1.5, 3.0) == []
+
+        tilt_orient = list(set(
+            (element.orientation, element.tilt)
+            for element in therm_zone.outer_walls + therm_zone.windows))
+        assert facades.tilt_orient("outer_walls", "windows") == tilt_orient
+
+    def test_calc_all_buildings_parallel(self):
+        """Tests calc_all_buildings with a process pool against sequential"""
+
+        def make_project():
+            project = Project()
+            project.number_of_elements_calc = 4
+            for year in (1960, 1990, 2010):
+                helptest.residential_test(
+                    project, name="Residential" + str(year),
+                    year_of_construction=year)
+            return project
+
+        sequential = make_project()
+        sequential.calc_all_buildings()
+        parallel = make_project()
+        bldg = parallel.buildings[0]
+        zone = bldg.thermal_zones[0]
+        parallel.calc_all_buildings(n_workers=2)
+
+        assert parallel.buildings[0] is bldg
+        assert zone.model_attr.thermal_zone is zone
+        assert bldg.library_attr.parent is bldg
+        for bldg_seq, bldg_par in zip(sequential.buildings,
+                                      parallel.buildings):
+            assert bldg_par.sum_heat_load == bldg_seq.sum_heat_load
+            for zone_seq, zone_par in zip(bldg_seq.thermal_zones,
+                                          bldg_par.thermal_zones):
+                attr_seq = zone_seq.model_attr
+                attr_par = zone_par.model_attr
+                assert attr_par.internal_id == attr_seq.internal_id
+                assert attr_par.r1_ow == attr_seq.r1_ow
+                assert attr_par.c1_iw == attr_seq.c1_iw
+                assert attr_par.weightfactor_ow == attr_seq.weightfactor_ow
+                assert zone_par.outer_walls[0].r1 \
+                    == zone_seq.outer_walls[0].r1
+
+        broken = parallel.buildings[1]
+        broken.thermal_zones[0].use_conditions.base_infiltration = None
+        with pytest.raises(TypeError):
+            parallel.calc_all_buildings(raise_errors=True, n_workers=2)
+        with pytest.warns(UserWarning, match="can't be calculated"):
+            parallel.calc_all_buildings(n_workers=2)
+        assert broken not in parallel.buildings
+        assert len(parallel.buildings) == 2
+
+    def test_parallel_state(self):
+        """Tests the state transfer of the process pool without relying on
+        object.__getstate__() (Python < 3.11)"""
+        from teaser.logic.parallel import _get_state, _set_state
+        from teaser.logic.buildingobjects.thermalzone import ThermalZone
+
+        prj.set_default()
+        helptest.building_test2(prj)
+        zone = prj.buildings[-1].thermal_zones[0]
+        wall = zone.outer_walls[0]
+        wall.calc_equivalent_res()
+        state = _get_state(wall)
+        assert isinstance(state, tuple)
+        assert state[0] is None
+        assert state[1]["r1"] == wall.r1
+        assert state[1]["_OuterWall__parent"] is zone
+        assert _get_state(wall.layer[0])[1]["_Layer__parent"] is wall
+        other = zone.outer_walls[1]
+        _set_state(other, state)
+        assert other.r1 == wall.r1
+        assert other.layer is wall.layer
+
+        zone_state = _get_state(zone)
+        assert zone_state["_outer_walls"] is zone.outer_walls
+        copy_zone = ThermalZone.__new__(ThermalZone)
+        _set_state(copy_zone, zone_state)
+        assert copy_zone.area == zone.area
+
+    def test_calc_all_buildings_parallel_unsupported(self, monkeypatch):
+        """Tests the sequential fallback without reducer_override()"""
+        from teaser.logic import parallel
+
+        monkeypatch.setattr(parallel, "supported", False)
+        project = Project()
+        bldg = helptest.residential_test(project)
+        with pytest.warns(UserWarning, match="sequentially"):
+            project.calc_all_buildings(n_workers=2)
+        assert bldg.thermal_zones[0].model_attr.thermal_zone is \
+            bldg.thermal_zones[0]
+
+    def test_calc_all_buildings_incremental(self):
+        """Tests that incremental calculation only skips unchanged zones"""
+
+        def edit(project):
+            zones = project.buildings[0].thermal_zones
+            zones[0].outer_walls[0].area = 20.0
+            zones[1].use_conditions.base_infiltration = 0.3
+            layer = zones[2].windows[0].layer[0]
+            layer.material = layer.material.copy(parent=layer)
+            layer.material.thermal_conduc = 0.5
+
+        project = Project()
+        helptest.office_test(project)
+        zones = project.buildings[0].thermal_zones
+        assert project.calc_all_buildings() == 0
+        sum_heat_load = project.buildings[0].sum_heat_load
+        model_attrs = [zone.model_attr for zone in zones]
+        assert project.calc_all_buildings(incremental=True) == len(zones)
+        assert project.buildings[0].sum_heat_load == sum_heat_load
+        assert [zone.model_attr for zone in zones] == model_attrs
+
+        edit(project)
+        assert project.calc_all_buildings(incremental=True) == len(zones) - 3
+        assert zones[0].model_attr is not model_attrs[0]
+        assert zones[3].model_attr is model_attrs[3]
+
+        reference = Project()
+        helptest.office_test(reference)
+        edit(reference)
+        reference.calc_all_buildings()
+        assert project.buildings[0].sum_heat_load \
+            == reference.buildings[0].sum_heat_load
+        for zone, zone_ref in zip(zones, reference.buildings[0].thermal_zones):
+            assert zone.model_attr.heat_load == zone_ref.model_attr.heat_load
+            assert zone.model_attr.r1_win == zone_ref.model_attr.r1_win
+            assert zone.model_attr.r1_ow == zone_ref.model_attr.r1_ow
+
+        project.number_of_elements_calc = 3
+        assert project.calc_all_buildings(incremental=True) == 0
+
+    def test_calc_zone_parameters_all_orders(self):
+        """Tests the calculation of several model orders in one pass"""
+
+        bldg = helptest.residential_test(Project())
+        zone = bldg.thermal_zones[0]
+        bldg.calc_building_parameter(number_of_elements=[1, 2, 3, 4, 5])
+        assert sorted(zone.model_attrs) == [1, 2, 3, 4, 5]
+        assert zone.model_attr is zone.model_attrs[1]
+        assert bldg.number_of_elements_calc == 1
+
+        for number_of_elements in range(1, 6):
+            reference = helptest.residential_test(Project())
+            reference.calc_building_parameter(
+                number_of_elements=number_of_elements)
+            zone_ref = reference.thermal_zones[0]
+            bldg.select_model_attr(number_of_elements)
+            assert type(zone.model_attr) is type(zone_ref.model_attr)
+            assert bldg.number_of_elements_calc == number_of_elements
+            assert bldg.sum_heat_load == reference.sum_heat_load
+            assert zone.model_attr.r1_ow == zone_ref.model_attr.r1_ow
+            assert zone.model_attr.c1_ow == zone_ref.model_attr.c1_ow
+            assert zone.model_attr.ua_value_win \
+                == zone_ref.model_attr.ua_value_win
+            assert zone.model_attr.weightfactor_ow \
+                == zone_ref.model_attr.weightfactor_ow
+
+        zone.calc_zone_parameters(number_of_elements=2)
+        assert list(zone.model_attrs) == [2]
+        with pytest.raises(ValueError):
+            zone.select_model_attr(4)
+
+    def test_sweep_time_constants(self):
+        """Tests the sweep over t_bt and t_bt_layer against single runs"""
+        project = Project()
+        bldg = helptest.residential_test(project)
+        project.number_of_elements_calc = 4
+        project.calc_all_buildings()
+        zone = bldg.thermal_zones[0]
+        model_attr = zone.model_attr
+        wall = zone.outer_walls[0]
+        wall_values = (wall.r1, wall.c1, wall.ua_value)
+
+        rc_parameters = project.sweep_time_constants(
+            t_bt=[2, 5, 9], t_bt_layer=[3, 7])
+        assert len(rc_parameters) == 6
+        assert zone.model_attr is model_attr
+        assert (wall.r1, wall.c1, wall.ua_value) == wall_values
+
+        for t_bt, t_bt_layer in [(2, 3), (9, 7)]:
+            bldg.t_bt = t_bt
+            bldg.t_bt_layer = t_bt_layer
+            project.calc_all_buildings()
+            row = rc_parameters.loc[
+                (bldg.name, zone.name, float(t_bt), float(t_bt_layer))]
+            for name in ["r1_ow", "c1_ow", "r_rest_ow", "r1_iw", "c1_iw",
+                         "r1_rt", "c1_rt"]:
+                assert row[name] == getattr(zone.model_attr, name)
+
+    def test_heat_load_table(self):
+        """Tests the vectorized static heat load against the models"""
+        project = Project()
+        for year in [1960, 1995]:
+            helptest.residential_test(
+                project, name="Residential" + str(year),
+                year_of_construction=year)
+        for bldg in project.buildings:
+            for zone in bldg.thermal_zones:
+                zone.t_ground_amplitude = 4.0
+        project.t_soil_mode = 2
+        project.calc_all_buildings()
+        table = project.heat_load_table()
+
+        heat_loads = [zone.model_attr.heat_load
+                      for bldg in project.buildings
+                      for zone in bldg.thermal_zones]
+        assert list(table.zone_heat_load()) == heat_loads
+        assert table.building_heat_load() == pytest.approx(
+            [bldg.sum_heat_load for bldg in project.buildings])
+
+        t_outside = np.array([258.15, 262.65, 268.15])
+        scenarios = table.zone_heat_load(
+            t_outside=t_outside[:, np.newaxis],
+            t_soil_mode=np.array([1, 2])[:, np.newaxis, np.newaxis])
+        assert scenarios.shape == (2, 3, len(heat_loads))
+
+        project.t_soil_mode = 1
+        project.set_location_parameters(t_outside=258.15, t_ground=283.15)
+        assert list(table.zone_heat_load(
+            t_outside=258.15, t_ground=283.15, t_soil_mode=1)) == [
+            zone.model_attr.heat_load
+            for bldg in project.buildings
+            for zone in bldg.thermal_zones]
+        assert list(table.zone_heat_load(
+            t_outside=table.building_values([258.15, 268.15]))) == [
+            scenarios[1, 0, 0], scenarios[1, 2, 1]]
+
+    def test_export_periodic_tables(self):
+        """test of the length of exported tables for periodic profiles"""
+        assert utilities.get_table_period([24, 24]) == 24
+        assert utilities.get_table_period([24, 168]) == 168
+        assert utilities.get_table_period([168, 8760]) == 8760
+
+        project = Project()
+        project.name = "PeriodicTables"
+        helptest.residential_test(project)
+        project.used_library_calc = "AixLib"
+        project.calc_all_buildings()
+        bldg = project.buildings[-1]
+        use_cond = bldg.thermal_zones[-1].use_conditions
+        path = os.path.join(utilities.get_default_path(), project.name)
+
+        def read_table(file_name):
+            with open(os.path.join(path, file_name)) as f:
+                lines = f.read().splitlines()
+            return lines[1], [
+                [float(value) for value in line.split("\t")]
+                for line in lines[2:]]
+
+        bldg.library_attr.modelica_set_temp(path=path)
+        header, rows = read_table(bldg.library_attr.file_set_t_heat)
+        assert header == "double Tset(25, 2)"
+        assert [row[0] for row in rows] == [k * 3600 for k in range(25)]
+        assert [row[1] for row in rows[1:]] == use_cond.heating_profile
+        assert rows[0][1] == rows[-1][1]
+
+        use_cond.persons_profile = [0.5] * 120 + [0.0] * 48
+        bldg.library_attr.modelica_gains_boundary(path=path)
+        header, rows = read_table(bldg.library_attr.file_internal_gains)
+        assert header == "double Internals(169, 4)"
+        assert [row[2] for row in rows[1:]] == use_cond.machines_profile * 7
+
+        use_cond.heating_profile = use_cond.heating_profile * 365
+        bldg.library_attr.modelica_set_temp(path=path)
+        header, rows = read_table(bldg.library_attr.file_set_t_heat)
+        assert header == "double Tset(8760, 2)"
+        assert rows[0][0] == 3600
+        assert [row[1] for row in rows] == use_cond.heating_profile
@@ -1,5 +1,6 @@
 """Module to test UseCondition functions."""
 import os
+import pickle
 
 import pytest
 import helptest
@@ -9,6 +10,7 @@ import pandas as pd
 from teaser.data.dataclass import DataClass
 from teaser.data.utilities import ConstructionData
 from teaser.logic import utilities
+from teaser.logic.buildingobjects.useconditions import UseConditions
 from teaser.project import Project
 
 prj = Project(False)
@@ -216,3 +218,119 @@ class Test_useconditions(object):
 
 
 
+
+    def test_schedules_cache(self):
+        prj.set_default()
+        helptest.building_test2(prj)
+        use_cond = prj.buildings[-1].thermal_zones[-1].use_conditions
+        schedules = use_cond.schedules
+        assert use_cond.schedules is schedules
+        assert schedules.index is utilities.get_hourly_index()
+        assert list(schedules.index[:2]) == ["01-01 00:00:00", "01-01 01:00:00"]
+
+        use_cond.heating_profile = 295.15
+        assert use_cond.schedules is not schedules
+        assert (use_cond.schedules["heating_profile"] == 295.15).all()
+
+        schedules = use_cond.schedules
+        persons_profile = use_cond.persons_profile
+        persons_profile[3] = 0.5
+        assert use_cond.schedules is schedules
+        use_cond.persons_profile = persons_profile
+        assert use_cond.schedules["persons_profile"].iloc[27] == 0.5
+
+        schedules = use_cond.schedules
+        use_cond.set_back_times = [5, 22]
+        use_cond.heating_set_back = -2
+        use_cond.calc_adj_schedules()
+        assert use_cond.schedules is not schedules
+        assert use_cond.schedules["heating_profile"].iloc[0] == 293.15
+
+        new_schedules = use_cond.schedules.copy()
+        new_schedules["cooling_profile"] = 299.15
+        use_cond.schedules = new_schedules
+        assert use_cond.cooling_profile == [299.15] * 8760
+        assert (use_cond.schedules["cooling_profile"] == 299.15).all()
+
+    def test_profile_adjust_yearly_profiles(self):
+        prj.set_default()
+        helptest.building_test2(prj)
+        use_cond = prj.buildings[-1].thermal_zones[-1].use_conditions
+        machines_day = use_cond.machines_profile
+        heating_day = use_cond.heating_profile
+        use_cond.adjusted_opening_times = [10, 15]
+        use_cond.set_back_times = [5, 22]
+        use_cond.calc_adj_schedules()
+        machines_day_adjusted = use_cond.machines_profile
+        heating_day_adjusted = use_cond.heating_profile
+
+        use_cond.machines_profile = machines_day * 365
+        use_cond.heating_profile = heating_day * 365
+        use_cond.calc_adj_schedules()
+        assert isinstance(use_cond.machines_profile, list)
+        assert use_cond.machines_profile == machines_day_adjusted * 365
+        assert use_cond.heating_profile == heating_day_adjusted * 365
+
+        with pytest.raises(ValueError):
+            use_cond.lighting_profile = [0.5] * 25
+
+    def test_interned_profiles(self):
+        prj.set_default()
+        helptest.building_test2(prj)
+        helptest.building_test2(prj)
+        use_cond_1 = prj.buildings[-2].thermal_zones[-1].use_conditions
+        use_cond_2 = prj.buildings[-1].thermal_zones[-1].use_conditions
+        use_cond_1.load_use_conditions("Living", data_class=prj.data)
+        use_cond_2.load_use_conditions("Living", data_class=prj.data)
+        assert use_cond_1._persons_profile is use_cond_2._persons_profile
+        assert use_cond_1.schedules_key == use_cond_2.schedules_key
+        assert use_cond_1.schedules is not use_cond_2.schedules
+        assert use_cond_1.schedules.equals(use_cond_2.schedules)
+
+        # editing the frame of one zone does not change other zones
+        use_cond_1.schedules.loc[:, "heating_profile"] = 280.0
+        assert (use_cond_2.schedules["heating_profile"] != 280.0).all()
+        assert use_cond_2.schedules["heating_profile"].tolist() \
+            == use_cond_2._heating_profile.hourly().tolist()
+        assert use_cond_1._heating_profile is use_cond_2._heating_profile
+        use_cond_1.schedules = None
+
+        use_cond_2.heating_profile = 295.15
+        assert use_cond_1.schedules_key != use_cond_2.schedules_key
+        assert use_cond_1.schedules is not use_cond_2.schedules
+        assert use_cond_1.heating_profile != use_cond_2.heating_profile
+        with pytest.raises(ValueError):
+            use_cond_1._heating_profile.values[0] = 300.0
+
+        copied = pickle.loads(pickle.dumps(use_cond_1))
+        assert copied._persons_profile is use_cond_1._persons_profile
+        assert copied.schedules is not use_cond_1.schedules
+        assert copied.schedules.equals(use_cond_1.schedules)
+
+    def test_use_conditions_template(self):
+        data_class = DataClass(construction_data=ConstructionData.iwu_heavy)
+        template = data_class.get_use_conditions_template("Living")
+        assert data_class.get_use_conditions_template("Living") is template
+
+        use_cond_1 = UseConditions()
+        use_cond_2 = UseConditions()
+        use_cond_1.load_use_conditions("Living", data_class=data_class)
+        use_cond_2.load_use_conditions("Living", data_class=data_class)
+        living = data_class.conditions_bind["Living"]
+        assert use_cond_1.usage == "Living"
+        assert use_cond_1.machines == living["machines"]
+        assert use_cond_1.heating_profile == living["heating_profile"]
+        assert use_cond_1.internal_id != use_cond_2.internal_id
+
+        use_cond_1.machines = 99.0
+        use_cond_1.persons_profile = 0.5
+        assert use_cond_2.machines == living["machines"]
+        assert use_cond_2.persons_profile == living["persons_profile"]
+        assert template["machines"] == living["machines"]
+
+        with pytest.raises(KeyError):
+            data_class.get_use_conditions_template("NoUsage")
+
+        data_class.detach_binding("conditions_bind")
+        assert data_class.get_use_conditions_template("Living") \
+            is not template